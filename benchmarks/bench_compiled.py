@@ -0,0 +1,58 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Per-call overhead of the pure Python and the mypyc compiled build
+
+Run it once against each build and compare the results.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_compiled.py [--number N]
+    PY_NULLABLE_MYPYC=1 python setup.py build_ext --inplace
+    PYTHONPATH=. python benchmarks/bench_compiled.py [--number N]
+
+"""
+from __future__ import annotations
+import argparse
+import timeit
+from typing import Callable, Optional
+from py_nullable import MetricsRegistry, Nullable, compiled_modules,\
+    nullable_wrap
+
+PRESENT: Nullable[int] = Nullable(1)
+
+
+@nullable_wrap
+def find(value: int) -> Optional[int]:
+    return value
+
+
+@nullable_wrap(metrics=MetricsRegistry())
+def find_measured(value: int) -> Optional[int]:
+    return value
+
+
+CASES: dict[str, Callable[[], object]] = {
+    "Nullable": lambda: Nullable(1),
+    "map": lambda: PRESENT.map(abs),
+    "orElse": lambda: PRESENT.orElse(0),
+    "nullable_wrap": lambda: find(1),
+    "metrics": lambda: find_measured(1),
+}
+
+
+def measure(case: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(case, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"compiled: {', '.join(compiled_modules()) or 'none'}")
+    print(f"{'case':>14} {'ns':>8}")
+    for name, case in CASES.items():
+        print(f"{name:>14} {measure(case, args.number):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Nullable chains through the runtime API, nullable_inline and by hand
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_inline.py [--number N]
+
+"""
+from __future__ import annotations
+import argparse
+import timeit
+from typing import Callable, Optional
+from py_nullable import Nullable, nullable_inline
+
+
+def runtime(n: Nullable[int]) -> int:
+    return n.map(lambda x: x * 2).filter(lambda x: x > 5).orElse(0)
+
+
+inlined: Callable[[Nullable[int]], int] = nullable_inline(runtime)
+
+
+def by_hand(n: Optional[int]) -> int:
+    if n is not None:
+        n = n * 2
+        if n > 5:
+            return n
+    return 0
+
+
+def measure(case: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(case, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    present: Nullable[int] = Nullable(3)
+    empty: Nullable[int] = Nullable(None)
+    print(f"{'case':>10} {'present ns':>11} {'empty ns':>9}")
+    for name, present_case, empty_case in (
+        ("runtime", lambda: runtime(present), lambda: runtime(empty)),
+        ("inline", lambda: inlined(present), lambda: inlined(empty)),
+        ("by hand", lambda: by_hand(3), lambda: by_hand(None)),
+    ):
+        print(f"{name:>10} {measure(present_case, args.number):>11.0f} "
+              f"{measure(empty_case, args.number):>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Per-call overhead of Nullable callbacks with and without production mode
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_production_mode.py [--number N]
+
+"""
+from __future__ import annotations
+import argparse
+import timeit
+from typing import Callable
+from py_nullable import Nullable, set_production_mode
+
+PRESENT: Nullable[int] = Nullable(1)
+EMPTY: Nullable[int] = Nullable(None)
+
+CASES: dict[str, Callable[[], object]] = {
+    "map": lambda: PRESENT.map(abs),
+    "filter": lambda: PRESENT.filter(bool),
+    "flatMap": lambda: PRESENT.flatMap(Nullable),
+    "orElseGet": lambda: EMPTY.orElseGet(int),
+    "ifPresent": lambda: PRESENT.ifPresent(abs),
+}
+
+
+def measure(case: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(case, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'method':>10} {'default ns':>11} {'production ns':>14}")
+    for name, case in CASES.items():
+        set_production_mode(False)
+        default: float = measure(case, args.number)
+        set_production_mode(True)
+        production: float = measure(case, args.number)
+        print(f"{name:>10} {default:>11.0f} {production:>14.0f}")
+    set_production_mode(False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Thread scaling benchmark of Nullable construction and chained operations
+
+Runs the same workload on 1, 2, 4 ... threads and prints the throughput.
+On a free-threaded build (e.g. python3.13t) the throughput grows with
+the number of threads, while it stays flat under the GIL.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_threads.py \
+        [--operations N] [--max-threads N]
+
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Callable
+from py_nullable import Nullable
+
+
+def workload(operations: int) -> None:
+    # callbacks are created per thread, so that threads do not contend
+    # on the reference counts of shared function objects.
+    double: Callable[[int], int] = lambda x: x * 2
+    indivisible: Callable[[int], bool] = lambda x: x % 3 != 0
+    to_str: Callable[[int], Nullable[str]] = lambda x: Nullable(str(x))
+
+    for i in range(operations):
+        Nullable(i).map(double).filter(indivisible).flatMap(to_str).orElse("")
+
+
+def run(threads: int, operations: int) -> float:
+    barrier: threading.Barrier = threading.Barrier(threads + 1)
+
+    def target() -> None:
+        barrier.wait()
+        workload(operations)
+
+    workers: list[threading.Thread] = [
+        threading.Thread(target=target) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    started: float = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * operations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=100_000,
+                        help="chains evaluated per thread")
+    parser.add_argument("--max-threads", type=int,
+                        default=min(os.cpu_count() or 1, 16))
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    print(f"python {sys.version.split()[0]}, "
+          f"GIL {'enabled' if is_gil_enabled() else 'disabled'}")
+    print(f"{'threads':>8} {'chains/s':>14} {'speedup':>8}")
+
+    baseline: float = 0.0
+    threads: int = 1
+    while threads <= args.max_threads:
+        throughput: float = run(threads, args.operations)
+        baseline = baseline or throughput
+        print(f"{threads:>8} {throughput:>14,.0f} "
+              f"{throughput / baseline:>7.2f}x")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
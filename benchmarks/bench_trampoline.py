@@ -0,0 +1,68 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Nested flatMap recursion against nullable_tailrec and flat_map_chain
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_trampoline.py [--depth N]
+
+"""
+from __future__ import annotations
+import argparse
+import functools
+import sys
+import timeit
+from typing import Callable
+from py_nullable import Nullable, nullable_tailrec, flat_map_chain
+
+
+def nested(n: int) -> Nullable[int]:
+    if n == 0:
+        return Nullable(0)
+    return Nullable(n - 1).flatMap(nested)
+
+
+@nullable_tailrec
+def trampolined(n: int) -> Nullable[int]:
+    if n == 0:
+        return Nullable(0)
+    return Nullable(n - 1).flatMap(trampolined)
+
+
+def nested_chain(mappers: list[Callable[[int], Nullable[int]]]) -> Callable[
+        [int], Nullable[int]]:
+    return functools.reduce(
+        lambda inner, outer: lambda x: inner(x).flatMap(outer),
+        mappers[1:], mappers[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=300,
+                        help="recursion depth, kept below the recursion limit")
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.depth * 4 + 100))
+
+    step: Callable[[int], Nullable[int]] = lambda x: Nullable(x + 1)
+    mappers: list[Callable[[int], Nullable[int]]] = [step] * args.depth
+    composed: Callable[[int], Nullable[int]] = nested_chain(mappers)
+
+    cases: dict[str, Callable[[], object]] = {
+        "nested recursion": lambda: nested(args.depth),
+        "nullable_tailrec": lambda: trampolined(args.depth),
+        "nested flatMap chain": lambda: composed(0),
+        "flat_map_chain": lambda: flat_map_chain(Nullable(0), mappers),
+    }
+    print(f"depth {args.depth}")
+    for name, case in cases.items():
+        elapsed: float = min(
+            timeit.repeat(case, number=args.number, repeat=3)) / args.number
+        print(f"{name:>22} {elapsed * 1e6:>10.1f} us "
+              f"{elapsed / args.depth * 1e9:>8.0f} ns/step")
+
+    deep: int = sys.getrecursionlimit() * 10
+    print(f"nullable_tailrec at depth {deep}: {trampolined(deep).isPresent()}")
+
+
+if __name__ == "__main__":
+    main()
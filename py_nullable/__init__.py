@@ -1,5 +1,24 @@
-from .nullable import Nullable
-from .decorator import nullable_wrap
+from .nullable import Nullable, set_production_mode, is_production_mode
+from .decorator import nullable_wrap, nullable_batch
+from .column import NullableColumn, write_column
+from .mapping import NullableMapping
+from .iteration import present_values, partition
+from .row import NullableRow
+from .ndjson import read_ndjson
+from .record import NullableRecord
+from .trampoline import nullable_tailrec, flat_map_chain
+from .sorting import nulls_first, nulls_last, top_k, merge
+from .field import NullableField
+from .sqlite import ColumnBatch, nullable_row_factory, fetch_columns
+from .metrics import NullableMetrics, MetricsRegistry, default_registry
+from .inline import nullable_inline
+from .sparse import NullableSparseArray
+from .stream import AsyncNullableStream
+from .view import readonly_view
+from .bloom import BloomFilter
+from .cache import SqliteCache
+from .build import compiled_modules
+from .grouping import Aggregation, aggregate
 from .exception\
     import Stack, PyNullableError, UncallableException,\
     IncompleteCallBackException, EmptyValueException
@@ -0,0 +1,259 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's Bloom filter
+
+Class:
+    * BloomFilter
+
+File Layout:
+    A filter file consists of two sections.
+
+    - header (32 bytes, little-endian)
+        magic ``b"PYNB"``, format version, number of hash functions,
+        number of bits, number of added keys.
+
+    - bit array
+        one bit per slot, least significant bit first.
+
+"""
+from __future__ import annotations
+import math
+import os
+import struct
+import threading
+from hashlib import blake2b
+from typing import Callable, Hashable, Iterable, Optional, Union
+
+_MAGIC: bytes = b"PYNB"
+_VERSION: int = 1
+_HEADER: struct.Struct = struct.Struct("<4sBxxxQQQ")
+
+
+def _key_bytes(key: Hashable) -> bytes:
+    """Encodes a key deterministically, so that a saved filter
+    answers the same in another process.
+
+    Only str, bytes, int and tuples of them are encoded:
+    other types, e.g. frozenset, may encode differently across processes,
+    and float keys encode differently from the int keys they equal.
+    """
+    if isinstance(key, bytes):
+        return key
+    if isinstance(key, str):
+        return key.encode("utf-8", "surrogatepass")
+    if isinstance(key, int):
+        # bool is encoded as the int it equals.
+        return b"\x00i" + str(int(key)).encode("ascii")
+    if isinstance(key, tuple):
+        items: list[bytes] = [_key_bytes(item) for item in key]
+        return b"\x00t" + b"".join(
+            len(item).to_bytes(8, "little") + item for item in items)
+    raise TypeError(
+        f"cannot encode a {type(key).__name__} key, "
+        "pass key_serializer to BloomFilter.")
+
+
+class BloomFilter:
+    """Probabilistic set of keys with a compact bytearray storage.
+
+    A key that was added is always reported as contained.
+    A key that was not added is reported as not contained,
+    except for a false positive rate of about error_rate.
+
+    Keys are str, bytes, int or tuples of them, unless key_serializer
+    is given. Adding keys is thread-safe.
+
+    Example:
+        >>> blocked = BloomFilter.from_keys(["A001", "A002"], error_rate=0.001)
+            print("A001" in blocked, "B001" in blocked)
+        True False
+    """
+
+    __slots__ = ["_bits", "_size", "_hashes", "_count", "_serializer",
+                 "_lock"]
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.01,
+        key_serializer: Optional[Callable[[Hashable], bytes]] = None
+    ) -> None:
+        """constructor.
+
+        Args:
+            capacity (int): number of keys the filter is sized for.
+            error_rate (float, optional):
+                false positive rate at capacity. Defaults to 0.01.
+            key_serializer (Optional[Callable[[Hashable], bytes]], optional):
+                function that encodes a key into the same bytes
+                in every process, and equal keys into equal bytes.
+                Defaults to the encoding of str, bytes, int and tuples.
+
+        Raises:
+            ValueError: if the capacity is not positive,
+                or the error_rate is not between 0 and 1.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be 1 or more.")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+        size: int = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._size: int = max(size, 8)
+        self._hashes: int = max(1, round(self._size / capacity * math.log(2)))
+        self._bits: bytearray = bytearray((self._size + 7) // 8)
+        self._count: int = 0
+        self._serializer: Callable[[Hashable], bytes]\
+            = key_serializer or _key_bytes
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def from_keys(
+        cls,
+        keys: Iterable[Hashable],
+        error_rate: float = 0.01,
+        capacity: Optional[int] = None,
+        key_serializer: Optional[Callable[[Hashable], bytes]] = None
+    ) -> BloomFilter:
+        """Returns a filter of the keys.
+
+        Args:
+            keys (Iterable[Hashable]): keys to add.
+            error_rate (float, optional):
+                false positive rate at capacity. Defaults to 0.01.
+            capacity (Optional[int], optional):
+                number of keys the filter is sized for,
+                leaving room for later additions.
+                Defaults to the number of keys.
+            key_serializer (Optional[Callable[[Hashable], bytes]], optional):
+                function that encodes a key, see: BloomFilter
+
+        Raises:
+            TypeError: if a key cannot be encoded.
+
+        Returns:
+            BloomFilter: filter containing the keys.
+        """
+        if capacity is None:
+            keys = list(keys)
+            capacity = max(len(keys), 1)
+        bloom: BloomFilter = cls(capacity, error_rate, key_serializer)
+        bloom.update(keys)
+        return bloom
+
+    def _positions(self, key: Hashable) -> Iterable[int]:
+        # double hashing: k positions from two 64-bit halves of one digest.
+        digest: bytes = blake2b(
+            self._serializer(key), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+        size: int = self._size
+        return [(first + i * second) % size for i in range(self._hashes)]
+
+    def add(self, key: Hashable) -> None:
+        """Adds a key.
+
+        Args:
+            key (Hashable): key to add.
+
+        Raises:
+            TypeError: if the key cannot be encoded.
+        """
+        positions: Iterable[int] = self._positions(key)
+        bits: bytearray = self._bits
+        # setting a bit reads and writes its byte,
+        # so concurrent additions would lose each other's bits.
+        with self._lock:
+            for position in positions:
+                bits[position >> 3] |= 1 << (position & 7)
+            self._count += 1
+
+    def update(self, keys: Iterable[Hashable]) -> None:
+        """Adds keys.
+
+        Args:
+            keys (Iterable[Hashable]): keys to add.
+
+        Raises:
+            TypeError: if a key cannot be encoded.
+        """
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        bits: bytearray = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: number of added keys, duplicates included.
+        """
+        return self._count
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Returns:
+            float: estimated false positive rate with the added keys.
+        """
+        return (1 - math.exp(-self._hashes * self._count / self._size))\
+            ** self._hashes
+
+    def save(self, path: Union[str, os.PathLike[str]]) -> None:
+        """Writes the filter to a file.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): destination file.
+        """
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(
+                _MAGIC, _VERSION, self._hashes, self._size, self._count))
+            file.write(self._bits)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, os.PathLike[str]],
+        key_serializer: Optional[Callable[[Hashable], bytes]] = None
+    ) -> BloomFilter:
+        """Reads a filter written by BloomFilter#save.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): filter file.
+            key_serializer (Optional[Callable[[Hashable], bytes]], optional):
+                function that encoded the keys of the saved filter,
+                see: BloomFilter
+
+        Raises:
+            ValueError: if the file is not a filter file.
+
+        Returns:
+            BloomFilter: the filter.
+        """
+        with open(path, "rb") as file:
+            header: bytes = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"`{path}` is not a py_nullable filter file.")
+            magic, version, hashes, size, count = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"`{path}` is not a py_nullable filter file.")
+            bits: bytearray = bytearray(file.read())
+        if len(bits) != (size + 7) // 8:
+            raise ValueError(f"`{path}` is truncated.")
+
+        bloom: BloomFilter = cls.__new__(cls)
+        bloom._bits = bits
+        bloom._size = size
+        bloom._hashes = hashes
+        bloom._count = count
+        bloom._serializer = key_serializer or _key_bytes
+        bloom._lock = threading.Lock()
+        return bloom
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(bits={self._size}, "\
+            f"hashes={self._hashes}, keys={self._count})"
@@ -0,0 +1,34 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's build information
+
+Function:
+    * compiled_modules
+
+"""
+from __future__ import annotations
+import sys
+from importlib.machinery import EXTENSION_SUFFIXES
+
+
+def compiled_modules() -> tuple[str, ...]:
+    """Returns the modules of py_nullable that are compiled with mypyc.
+
+    The compiled build installs extension modules next to the Python ones,
+    and the import system picks the extension modules when they exist,
+    so the pure Python build is used wherever they do not.
+
+    Returns:
+        tuple[str, ...]:
+            names of the imported modules loaded from extension modules,
+            empty for the pure Python build.
+
+    Example:
+        >>> print(compiled_modules())
+        ('py_nullable.decorator', 'py_nullable.metrics')
+    """
+    return tuple(sorted(
+        name for name, module in list(sys.modules.items())
+        if name.startswith("py_nullable.")
+        and str(getattr(module, "__file__", None)).endswith(
+            tuple(EXTENSION_SUFFIXES))))
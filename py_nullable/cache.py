@@ -0,0 +1,353 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's persistent result cache
+
+Class:
+    * SqliteCache
+
+"""
+from __future__ import annotations
+import io
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+from .nullable import Nullable
+
+_Key = Union[bytes, str]
+
+# pending writes, by serialized key: pickled value or None, and expiry.
+_Pending = Dict[_Key, Tuple[Optional[bytes], Optional[float]]]
+
+_SCHEMA: str = "CREATE TABLE IF NOT EXISTS py_nullable_cache ("\
+    "key BLOB PRIMARY KEY, value BLOB, expires REAL) WITHOUT ROWID"
+_SELECT: str = "SELECT value, expires FROM py_nullable_cache WHERE key = ?"
+_UPSERT: str = "INSERT OR REPLACE INTO py_nullable_cache"\
+    "(key, value, expires) VALUES (?, ?, ?)"
+
+# fixed, so that every supported Python version reads the file.
+_PROTOCOL: int = 4
+
+
+def _serialize_key(key: Hashable) -> bytes:
+    """Pickles the key without the memo.
+
+    The memo pickles a repeated object as a reference to its first
+    occurrence, so that equal keys would be serialized differently
+    depending on which of their parts are the same objects.
+    """
+    buffer: io.BytesIO = io.BytesIO()
+    pickler: pickle.Pickler = pickle.Pickler(buffer, protocol=_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(key)
+    return buffer.getvalue()
+
+
+def _connect(path: str, timeout: float) -> sqlite3.Connection:
+    connection: sqlite3.Connection = sqlite3.connect(
+        path, timeout=timeout, isolation_level=None, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def _write(path: str, timeout: float, rows: _Pending) -> None:
+    """Writes rows in a single transaction of a new connection.
+    """
+    if not rows:
+        return
+    connection: sqlite3.Connection = _connect(path, timeout)
+    try:
+        _write_rows(connection, rows)
+    finally:
+        connection.close()
+
+
+def _write_rows(connection: sqlite3.Connection, rows: _Pending) -> None:
+    if not rows:
+        return
+    # BEGIN IMMEDIATE takes the write lock up front,
+    # so that concurrent writers wait on busy_timeout instead of failing.
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        connection.executemany(
+            _UPSERT,
+            [(key, value, expires)
+             for key, (value, expires) in rows.items()])
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+def _schedule(cache: SqliteCache, interval: float) -> threading.Timer:
+    """Starts a timer that writes the pending results of the cache.
+
+    The timer refers to the cache weakly, so that it does not keep
+    the cache alive, and writes with a connection of its own.
+    """
+    reference: weakref.ref[SqliteCache] = weakref.ref(cache)
+
+    def _() -> None:
+        target: Optional[SqliteCache] = reference()
+        if target is None or target._closed:
+            return
+        rows: _Pending = target._take()
+        _write(target._path, target._timeout, rows)
+        target._release(rows)
+
+    timer: threading.Timer = threading.Timer(interval, _)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+class SqliteCache:
+    """Persistent cache of present and empty results in a sqlite3 file.
+
+    The file is opened in WAL mode, so several processes can share it:
+    readers do not block the writer, and writers wait for each other
+    up to timeout seconds.
+    Each thread uses its own connection.
+
+    Writes are buffered and written in a single transaction
+    when flush_size results are pending, flush_interval seconds after
+    the first pending result (by a background timer, even if the cache
+    is idle), or when the cache is flushed or closed.
+    Pending results are seen by lookups of the same cache object,
+    and written at interpreter exit.
+
+    Values are pickled. Keys are serialized by key_serializer,
+    which must return the same str or bytes for equal keys
+    in every process.
+
+    Example:
+        >>> cache = SqliteCache("results.sqlite3", ttl=3600, empty_ttl=60)
+        ...
+        ...
+        ... @nullable_wrap(cache=cache)
+        ... def find_by_id(id: str) -> Optional[YourClass]:
+        ...     return remote_db.get(id)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        ttl: Optional[float] = None,
+        empty_ttl: Optional[float] = None,
+        key_serializer: Callable[[Hashable], _Key] = _serialize_key,
+        flush_size: int = 64,
+        flush_interval: float = 1.0,
+        timeout: float = 5.0
+    ) -> None:
+        """constructor.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): cache file.
+            ttl (Optional[float], optional):
+                seconds to keep present results. Defaults to forever.
+            empty_ttl (Optional[float], optional):
+                seconds to keep empty results. Defaults to ttl.
+            key_serializer (Callable[[Hashable], Union[bytes, str]], optional):
+                function that serializes a key.
+                Defaults to pickling it without the memo, which is stable
+                for str, bytes, numbers and tuples of them.
+            flush_size (int, optional):
+                number of pending results that triggers a write.
+                Defaults to 64.
+            flush_interval (float, optional):
+                seconds after which a pending result triggers a write.
+                Defaults to 1.0.
+            timeout (float, optional):
+                seconds to wait for the lock of another writer.
+                Defaults to 5.0.
+
+        Raises:
+            ValueError: if flush_size is less than 1.
+        """
+        if flush_size < 1:
+            raise ValueError("flush_size must be 1 or more.")
+        self._path: str = os.fspath(path)
+        self._ttl: Optional[float] = ttl
+        self._empty_ttl: Optional[float] = ttl if empty_ttl is None\
+            else empty_ttl
+        self._key_serializer: Callable[[Hashable], _Key] = key_serializer
+        self._flush_size: int = flush_size
+        self._flush_interval: float = flush_interval
+        self._timeout: float = timeout
+        self._local: threading.local = threading.local()
+        self._connections: list[
+            tuple[threading.Thread, sqlite3.Connection]] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: _Pending = {}
+        self._flushed_at: float = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._closed: bool = False
+
+        self._connection().execute(_SCHEMA)
+        # the finalizer must not refer to the cache,
+        # so that it runs at exit but does not keep the cache alive.
+        self._finalizer: weakref.finalize = weakref.finalize(
+            self, _write, self._path, self._timeout, self._pending)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("operation on a closed SqliteCache.")
+
+    def _connection(self) -> sqlite3.Connection:
+        # a connection must not be used by a forked child process.
+        local: threading.local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            local.connection = _connect(self._path, self._timeout)
+            local.pid = os.getpid()
+            with self._lock:
+                # close the connections of finished threads,
+                # so that they do not accumulate in a long-lived cache.
+                finished: list[sqlite3.Connection] = [
+                    connection for thread, connection in self._connections
+                    if not thread.is_alive()]
+                self._connections = [
+                    (thread, connection)
+                    for thread, connection in self._connections
+                    if thread.is_alive()]
+                self._connections.append(
+                    (threading.current_thread(), local.connection))
+            for connection in finished:
+                connection.close()
+        return local.connection
+
+    def lookup(self, key: Hashable) -> Optional[Nullable[Any]]:
+        """Returns the cached result of the key.
+
+        Args:
+            key (Hashable): key of the result.
+
+        Raises:
+            ValueError: if the cache is closed.
+
+        Returns:
+            Optional[Nullable[Any]]:
+                the cached result, which may be empty,
+                or None if the key is not cached or has expired.
+        """
+        self._check_open()
+        serialized: _Key = self._key_serializer(key)
+        with self._lock:
+            row: Optional[tuple[Optional[bytes], Optional[float]]]\
+                = self._pending.get(serialized)
+        if row is None:
+            row = self._connection().execute(
+                _SELECT, (serialized,)).fetchone()
+            if row is None:
+                return None
+        value, expires = row
+        if expires is not None and expires <= time.time():
+            return None
+        if value is None:
+            return Nullable.empty()
+        return Nullable(pickle.loads(value))
+
+    def store(self, key: Hashable, value: Optional[Any]) -> None:
+        """Caches the result of the key.
+
+        Args:
+            key (Hashable): key of the result.
+            value (Optional[Any]): present value, or None for an empty result.
+
+        Raises:
+            ValueError: if the cache is closed.
+        """
+        self._check_open()
+        ttl: Optional[float] = self._empty_ttl if value is None else self._ttl
+        row: tuple[Optional[bytes], Optional[float]] = (
+            None if value is None
+            else pickle.dumps(value, _PROTOCOL),
+            None if ttl is None else time.time() + ttl)
+        serialized: _Key = self._key_serializer(key)
+        with self._lock:
+            self._pending[serialized] = row
+            due: bool = len(self._pending) >= self._flush_size\
+                or time.monotonic() - self._flushed_at >= self._flush_interval
+            if not due and (self._timer is None
+                            or not self._timer.is_alive()):
+                self._timer = _schedule(self, self._flush_interval)
+        if due:
+            self.flush()
+
+    def _take(self) -> _Pending:
+        with self._lock:
+            self._flushed_at = time.monotonic()
+            return dict(self._pending)
+
+    def _release(self, rows: _Pending) -> None:
+        with self._lock:
+            # keep results stored again while writing.
+            for key, row in rows.items():
+                if self._pending.get(key) is row:
+                    del self._pending[key]
+
+    def flush(self) -> None:
+        """Writes the pending results.
+
+        Raises:
+            ValueError: if the cache is closed.
+        """
+        self._check_open()
+        rows: _Pending = self._take()
+        _write_rows(self._connection(), rows)
+        self._release(rows)
+
+    def purge(self) -> int:
+        """Deletes the expired results from the file.
+
+        Raises:
+            ValueError: if the cache is closed.
+
+        Returns:
+            int: number of deleted results.
+        """
+        self._check_open()
+        cursor: sqlite3.Cursor = self._connection().execute(
+            "DELETE FROM py_nullable_cache WHERE expires <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Deletes every result, pending ones included.
+
+        Raises:
+            ValueError: if the cache is closed.
+        """
+        self._check_open()
+        with self._lock:
+            self._pending.clear()
+        self._connection().execute("DELETE FROM py_nullable_cache")
+
+    def close(self) -> None:
+        """Writes the pending results and closes the connections.
+
+        Any later operation but close raises ValueError.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._finalizer.detach()
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+            connections: list[
+                tuple[threading.Thread, sqlite3.Connection]]\
+                = self._connections
+            self._connections = []
+        for _, connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> SqliteCache:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
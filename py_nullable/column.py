@@ -0,0 +1,272 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's on-disk numeric column
+
+Class:
+    * NullableColumn
+
+Function:
+    * write_column
+
+File Layout:
+    A column file consists of three sections.
+
+    - header (32 bytes, little-endian)
+        magic ``b"PYNC"``, format version, byte order of the value buffer,
+        array typecode, item size, length, value offset, bitmap offset.
+
+    - value buffer
+        packed native values, one per position (empty positions hold 0).
+
+    - validity bitmap
+        one bit per position, least significant bit first.
+        a set bit means the position holds a value.
+
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional, Union
+from .nullable import Nullable
+
+_Number = Union[int, float]
+
+_MAGIC: bytes = b"PYNC"
+_VERSION: int = 1
+_HEADER: struct.Struct = struct.Struct("<4sBBcBQQQ")
+_TYPECODES: str = "bBhHiIlLqQfd"
+_BYTEORDER: int = 0 if sys.byteorder == "little" else 1
+_CHUNK_SIZE: int = 65536
+
+_BITS: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)
+)
+
+
+def write_column(
+    path: Union[str, os.PathLike[str]],
+    values: Iterable[Union[Nullable[_Number], Optional[_Number]]],
+    typecode: str = "d"
+) -> int:
+    """Writes Nullable or Optional numerics to a column file.
+
+    values are consumed in a single pass,
+    so generators of any size can be written with flat memory.
+
+    Args:
+        path (Union[str, os.PathLike[str]]): destination file.
+        values (Iterable[Union[Nullable[N], Optional[N]]]):
+            Nullable objects or None-able numerics.
+        typecode (str, optional):
+            ``array`` typecode of the value buffer. Defaults to "d".
+
+    Raises:
+        ValueError: if the typecode is not a numeric array typecode.
+
+    Returns:
+        int: number of written positions.
+
+    Example:
+        >>> write_column("readings.pync", [1.5, None, Nullable[float](2.5)])
+            3
+    """
+    if typecode not in _TYPECODES:
+        raise ValueError(f"unsupported typecode `{typecode}`.")
+
+    itemsize: int = array(typecode).itemsize
+    bitmap: bytearray = bytearray()
+    buffer: array[Any] = array(typecode)
+    length: int = 0
+    current: int = 0
+
+    with open(path, "wb") as file:
+        file.write(bytes(_HEADER.size))
+        for item in values:
+            value: Optional[_Number] = (
+                item.orElse(None)  # type: ignore
+                if isinstance(item, Nullable) else item)
+            if value is None:
+                buffer.append(0)
+            else:
+                buffer.append(value)
+                current |= 1 << (length & 7)
+            length += 1
+            if not length & 7:
+                bitmap.append(current)
+                current = 0
+            if len(buffer) >= _CHUNK_SIZE:
+                buffer.tofile(file)
+                buffer = array(typecode)
+        buffer.tofile(file)
+        if length & 7:
+            bitmap.append(current)
+
+        values_end: int = _HEADER.size + length * itemsize
+        bitmap_offset: int = (values_end + 7) & ~7
+        file.write(bytes(bitmap_offset - values_end))
+        file.write(bitmap)
+
+        file.seek(0)
+        file.write(_HEADER.pack(
+            _MAGIC, _VERSION, _BYTEORDER, typecode.encode("ascii"),
+            itemsize, length, _HEADER.size, bitmap_offset))
+
+    return length
+
+
+class NullableColumn:
+    """Memory-mapped, read-only view of a column file.
+
+    Nothing is deserialized on open.
+    Positions are decoded on access, and the pages are shared
+    with every other process mapping the same file.
+
+    Example:
+        >>> with NullableColumn("readings.pync") as column:
+        ...     print(column[1].isEmpty())
+            True
+    """
+
+    __slots__ = ["_file", "_mmap", "_view", "_values", "_bitmap",
+                 "_length", "_typecode"]
+
+    def __init__(self, path: Union[str, os.PathLike[str]]) -> None:
+        """constructor.
+
+        Args:
+            path (Union[str, os.PathLike[str]]): column file to map.
+
+        Raises:
+            ValueError: if the file is not a column file,
+                or was written on a machine with another byte order.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"`{path}` is not a py_nullable column file.")
+
+        try:
+            if len(self._mmap) < _HEADER.size:
+                raise ValueError(
+                    f"`{path}` is not a py_nullable column file.")
+            magic, version, byteorder, typecode, itemsize, length, \
+                values_offset, bitmap_offset = _HEADER.unpack_from(self._mmap)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(
+                    f"`{path}` is not a py_nullable column file.")
+            if byteorder != _BYTEORDER:
+                raise ValueError(
+                    f"`{path}` was written with another byte order.")
+
+            self._typecode: str = typecode.decode("ascii")
+            self._length: int = length
+            self._view: memoryview = memoryview(self._mmap)
+            self._values: memoryview = self._view[
+                values_offset:values_offset + length * itemsize
+            ].cast(self._typecode)
+            self._bitmap: memoryview = self._view[
+                bitmap_offset:bitmap_offset + (length + 7) // 8]
+        except Exception:
+            self._mmap.close()
+            self._file.close()
+            raise
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns:
+            str: ``array`` typecode of the value buffer.
+        """
+        return self._typecode
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Nullable[_Number]:
+        """Returns the position as a Nullable.
+
+        Args:
+            index (int): position, negative values count from the end.
+
+        Raises:
+            IndexError: if the index is out of range.
+
+        Returns:
+            Nullable[N]: the value, or an empty Nullable.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("column index out of range")
+        if self._bitmap[index >> 3] >> (index & 7) & 1:
+            return Nullable(self._values[index])
+        return Nullable.empty()
+
+    def __iter__(self) -> Iterator[Nullable[_Number]]:
+        return map(Nullable, self.iter_optional())
+
+    def iter_optional(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> Iterator[Optional[_Number]]:
+        """Iterates the positions as None-able numerics in bulk.
+
+        values and validity bits are decoded chunk by chunk,
+        without creating a Nullable per position.
+
+        Args:
+            start (int, optional): first position. Defaults to 0.
+            stop (Optional[int], optional):
+                position to stop before. Defaults to the column length.
+
+        Returns:
+            Iterator[Optional[N]]: the value, or None per position.
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        while start < stop:
+            end: int = min(start + _CHUNK_SIZE, stop)
+            first_byte: int = start >> 3
+            # copied, so that no slice of the mapping is exported
+            # while the iteration is suspended, which would fail close.
+            flags: Iterator[bool] = chain.from_iterable(
+                map(_BITS.__getitem__,
+                    self._bitmap[first_byte:(end + 7) >> 3].tobytes()))
+            for _ in range(start - (first_byte << 3)):
+                next(flags)
+            values: list[_Number]\
+                = self._values[start:end].tolist()  # type: ignore
+            yield from [
+                value if flag else None for value, flag in zip(values, flags)
+            ]
+            start = end
+
+    def close(self) -> None:
+        """Releases the mapping and the underlying file.
+
+        Closing again has no effect, and retries the release
+        if a previous close failed.
+
+        Raises:
+            BufferError: if a view of the mapping is still exported.
+        """
+        try:
+            self._values.release()
+            self._bitmap.release()
+            self._view.release()
+            self._mmap.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> NullableColumn:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
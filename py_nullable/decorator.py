@@ -4,20 +4,376 @@
 
 Function:
     * nullable_wrap
+    * nullable_batch
 
 """
+from __future__ import annotations
+import asyncio
 import functools
-from typing import Any, Callable, Optional, TypeVar
-from .nullable import Nullable
+import heapq
+import importlib
+import inspect
+import itertools
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, Future, TimeoutError
+from typing import Any, Awaitable, Callable, Generic, Hashable, Mapping,\
+    Optional, TypeVar, Union, overload
+from .nullable import Nullable, _raw_value
+from .exception import IncompleteCallBackException
+from .metrics import MetricsRegistry, NullableMetrics, default_registry
+from .bloom import BloomFilter
+from .cache import SqliteCache
 
 _T = TypeVar("_T")
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
 
+_settle_lock: threading.Lock = threading.Lock()
 
+
+class _TimeoutScheduler:
+    """Runs callbacks at their deadline on a single daemon thread.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._condition: threading.Condition = threading.Condition()
+        self._counter: itertools.count[int] = itertools.count()
+        self._worker: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        with self._condition:
+            heapq.heappush(
+                self._heap,
+                (time.monotonic() + delay, next(self._counter), callback))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="py_nullable-timeout", daemon=True)
+                self._worker.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap\
+                        or self._heap[0][0] > time.monotonic():
+                    self._condition.wait(
+                        self._heap[0][0] - time.monotonic()
+                        if self._heap else None)
+                callback: Callable[[], None] = heapq.heappop(self._heap)[2]
+            callback()
+
+
+_scheduler: _TimeoutScheduler = _TimeoutScheduler()
+
+
+class _Undecorated:
+    """Calls the undecorated function of a decorated one on an executor.
+
+    The decorated function is referred to instead of the original one,
+    because only the former can be found by name in a process pool.
+    It is pickled by its module and qualified name,
+    which also works when this module is compiled.
+    """
+
+    __slots__ = ["decorated"]
+
+    def __init__(self, decorated: Callable[..., Any]) -> None:
+        self.decorated: Callable[..., Any] = decorated
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.decorated.__wrapped__(  # type: ignore
+            *args, **kwargs)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _find, (self.decorated.__module__,
+                       self.decorated.__qualname__)
+
+
+def _find(module: str, qualname: str) -> _Undecorated:
+    target: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    return _Undecorated(target)
+
+
+def _settle(future: Future[Nullable[_T]], settle: Callable[[], Any]) -> None:
+    """Settles the future once, whichever of completion and expiry
+    comes first.
+
+    The future is claimed under the lock by marking it running,
+    and settled outside the lock, because settling runs its callbacks,
+    which may settle other futures.
+    """
+    with _settle_lock:
+        if future.running() or future.done()\
+                or not future.set_running_or_notify_cancel():
+            return
+    settle()
+
+
+def _measured(
+    func: Callable[..., Optional[_T]],
+    recorder: NullableMetrics
+) -> Callable[..., Nullable[_T]]:
+    perf_counter: Callable[[], float] = time.perf_counter
+    observe: Callable[[float, bool], None] = recorder.observe
+
+    @functools.wraps(func)
+    def _(*args: Any, **kwargs: Any) -> Nullable[_T]:
+        started: float = perf_counter()
+        try:
+            value: Optional[_T] = func(*args, **kwargs)
+        except BaseException:
+            recorder.observe_error(perf_counter() - started)
+            raise
+        observe(perf_counter() - started, value is None)
+        return Nullable(value)
+
+    _.metrics = recorder  # type: ignore
+    return _
+
+
+def _observe(
+    recorder: NullableMetrics,
+    started: float,
+    done: Union[Future[Nullable[_T]], asyncio.Future[Nullable[_T]]]
+) -> None:
+    seconds: float = time.perf_counter() - started
+    if done.cancelled() or done.exception() is not None:
+        recorder.observe_error(seconds)
+    else:
+        recorder.observe(seconds, done.result().isEmpty())
+
+
+def _submit(
+    wrapper: Callable[..., Any],
+    executor: Executor,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    timeout: Optional[float],
+    raise_on_timeout: bool,
+    recorder: Optional[NullableMetrics] = None
+) -> Union[Future[Nullable[_T]], Awaitable[Nullable[_T]]]:
+    started: float = time.perf_counter()
+    inner: Future[Optional[_T]] = executor.submit(
+        _Undecorated(wrapper), *args, **kwargs)
+
+    loop: Optional[asyncio.AbstractEventLoop]
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is not None:
+        task: asyncio.Task[Nullable[_T]] = loop.create_task(
+            _await_result(inner, timeout, raise_on_timeout))
+        if recorder is not None:
+            task.add_done_callback(
+                functools.partial(_observe, recorder, started))
+        return task
+
+    outer: Future[Nullable[_T]] = Future()
+    if recorder is not None:
+        outer.add_done_callback(
+            functools.partial(_observe, recorder, started))
+
+    def _complete(done: Future[Optional[_T]]) -> None:
+        if done.cancelled():
+            # no-op if the call was cancelled because it expired.
+            outer.cancel()
+            return
+        exception: Optional[BaseException] = done.exception()
+        if exception is not None:
+            _settle(outer, lambda: outer.set_exception(exception))
+        else:
+            _settle(outer, lambda: outer.set_result(
+                Nullable(done.result())))
+
+    def _expire() -> None:
+        # outer is settled first, so that cancelling a call
+        # still waiting in the queue does not cancel outer.
+        if raise_on_timeout:
+            _settle(outer, lambda: outer.set_exception(TimeoutError()))
+        else:
+            _settle(outer, lambda: outer.set_result(Nullable.empty()))
+        inner.cancel()
+
+    outer.add_done_callback(lambda _: outer.cancelled() and inner.cancel())
+    if timeout is not None:
+        _scheduler.schedule(timeout, _expire)
+    inner.add_done_callback(_complete)
+    return outer
+
+
+def _cached(
+    func: Callable[..., Optional[_T]],
+    cache: SqliteCache
+) -> Callable[..., Optional[_T]]:
+    """Returns the function that looks its results up in the cache first.
+    """
+    name: str = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def _(*args: Any, **kwargs: Any) -> Optional[_T]:
+        key: tuple[Any, ...] = (name, args, tuple(kwargs.items()))
+        cached: Optional[Nullable[_T]] = cache.lookup(key)
+        if cached is not None:
+            return _raw_value(cached)
+        value: Optional[_T] = func(*args, **kwargs)
+        cache.store(key, value)
+        return value
+
+    return _
+
+
+def _first_argument(*args: Any, **kwargs: Any) -> Any:
+    if args:
+        return args[0]
+    if len(kwargs) == 1:
+        return next(iter(kwargs.values()))
+    raise TypeError(
+        "bloom_key is required for calls without a single argument.")
+
+
+def _resolved(
+    value: Nullable[_T]
+) -> Union[Future[Nullable[_T]], Awaitable[Nullable[_T]]]:
+    """Returns an already done future, of the running event loop if any.
+    """
+    future: Union[Future[Nullable[_T]], asyncio.Future[Nullable[_T]]]
+    try:
+        future = asyncio.get_running_loop().create_future()
+    except RuntimeError:
+        future = Future()
+    future.set_result(value)
+    return future
+
+
+def _gated(
+    func: Callable[..., Any],
+    wrapper: Callable[..., Any],
+    bloom: BloomFilter,
+    key: Callable[..., Hashable],
+    empty: Callable[[], Any]
+) -> Callable[..., Any]:
+    """Returns the wrapper that skips keys definitely not in the filter.
+    """
+    @functools.wraps(func)
+    def _(*args: Any, **kwargs: Any) -> Any:
+        if key(*args, **kwargs) not in bloom:
+            return empty()
+        return wrapper(*args, **kwargs)
+
+    _.metrics = getattr(wrapper, "metrics", None)  # type: ignore
+    if hasattr(wrapper, "with_timeout"):
+        _.with_timeout = lambda timeout: _gated(  # type: ignore
+            func, wrapper.with_timeout(timeout), bloom, key, empty)
+    return _
+
+
+async def _await_result(
+    inner: Future[Optional[_T]],
+    timeout: Optional[float],
+    raise_on_timeout: bool
+) -> Nullable[_T]:
+    try:
+        value: Optional[_T] = await asyncio.wait_for(
+            asyncio.wrap_future(inner), timeout)
+    except asyncio.TimeoutError:
+        if raise_on_timeout:
+            raise
+        return Nullable.empty()
+    return Nullable(value)
+
+
+@overload
 def nullable_wrap(
     func: Callable[..., Optional[_T]]
-) -> Callable[..., Nullable[_T]]:
+) -> Callable[..., Nullable[_T]]: ...
+
+
+@overload
+def nullable_wrap(
+    *,
+    executor: None = None,
+    timeout: None = None,
+    raise_on_timeout: bool = False,
+    metrics: Union[bool, MetricsRegistry] = False,
+    bloom: Optional[BloomFilter] = None,
+    bloom_key: Optional[Callable[..., Hashable]] = None,
+    cache: Optional[SqliteCache] = None
+) -> Callable[[Callable[..., Optional[_T]]], Callable[..., Nullable[_T]]]: ...
+
+
+@overload
+def nullable_wrap(
+    *,
+    executor: Executor,
+    timeout: Optional[float] = None,
+    raise_on_timeout: bool = False,
+    metrics: Union[bool, MetricsRegistry] = False,
+    bloom: Optional[BloomFilter] = None,
+    bloom_key: Optional[Callable[..., Hashable]] = None,
+    cache: Optional[SqliteCache] = None
+) -> Callable[
+    [Callable[..., Optional[_T]]],
+    Callable[..., Union[Future[Nullable[_T]], Awaitable[Nullable[_T]]]]
+]: ...
+
+
+def nullable_wrap(
+    func: Optional[Callable[..., Optional[_T]]] = None,
+    *,
+    executor: Optional[Executor] = None,
+    timeout: Optional[float] = None,
+    raise_on_timeout: bool = False,
+    metrics: Union[bool, MetricsRegistry] = False,
+    bloom: Optional[BloomFilter] = None,
+    bloom_key: Optional[Callable[..., Hashable]] = None,
+    cache: Optional[SqliteCache] = None
+) -> Any:
     """Decorator that wraps the return value of an Optional[T] type in Nullable[T]
 
+    If an executor is given, the function runs on the executor.
+    The decorated function then returns a Future[Nullable[T]],
+    or an awaitable of Nullable[T] when called from a running event loop.
+
+    For a process pool, the function must be defined at module level.
+
+    Args:
+        func (Optional[Callable[..., Optional[T]]]):
+            function to be decorated.
+        executor (Optional[Executor], optional):
+            thread or process pool to run the function on.
+        timeout (Optional[float], optional):
+            seconds to wait for the executor.
+            ``with_timeout`` of the decorated function overrides it per call.
+        raise_on_timeout (bool, optional):
+            if true, a timed out call raises TimeoutError,
+            otherwise it results in an empty Nullable.
+        metrics (Union[bool, MetricsRegistry], optional):
+            if true, calls are counted and timed into the default registry,
+            or into the given registry.
+            The metrics are available as ``metrics`` of the decorated
+            function. With an executor, the time includes the queueing.
+        bloom (Optional[BloomFilter], optional):
+            filter of the keys that may be found.
+            A call whose key is definitely not in the filter returns
+            the shared empty Nullable (or a done future of it with an
+            executor) without calling the function, nor counting metrics.
+            Keys added to the filter later are honored on the next call.
+        bloom_key (Optional[Callable[..., Hashable]], optional):
+            function that maps the call arguments to the key.
+            Defaults to the first argument.
+        cache (Optional[SqliteCache], optional):
+            persistent cache of the results, present and empty ones.
+            The key is the qualified name of the function and its
+            arguments. With an executor, the cache is used on the executor,
+            so a timed out call still caches its result.
+
     Example:
         >>> in_memory_db: dict[str, YourClass] = {"A001": YourClass("foo")}
         ...
@@ -30,10 +386,306 @@ def nullable_wrap(
         ... nullable: Nullable[YourClass] = find_by_id("B001")
         ... print(nullable.isEmpty())
             True
+
+        >>> @nullable_wrap(executor=ThreadPoolExecutor(), timeout=0.5)
+        ... def find_by_id(id: str) -> Optional[YourClass]:
+        ...     return in_memory_db.get(id)
+        ...
+        ...
+        ... futures = [find_by_id(id) for id in ("A001", "B001")]
+        ... print([future.result().isPresent() for future in futures])
+            [True, False]
+
+        >>> known_ids = BloomFilter.load("known_ids.bloom")
+        ...
+        ...
+        ... @nullable_wrap(bloom=known_ids)
+        ... def find_by_id(id: str) -> Optional[YourClass]:
+        ...     return remote_db.get(id)
+        ...
+        ...
+        ... print(find_by_id("B001").isEmpty())  # remote_db is not called
+            True
     """
-    @functools.wraps(func)
-    def _(*args: Any, **kwargs: Any) -> Nullable[_T]:
-        value: Optional[_T] = func(*args, **kwargs)
-        return Nullable[_T](value)
+    def decorator(
+        func: Callable[..., Optional[_T]]
+    ) -> Callable[..., Any]:
+        if cache is not None:
+            func = _cached(func, cache)
+        wrapped: Callable[..., Any] = _decorate(func)
+        if bloom is None:
+            return wrapped
+        return _gated(
+            func, wrapped, bloom, bloom_key or _first_argument,
+            Nullable.empty if executor is None
+            else functools.partial(_resolved, Nullable.empty()))
 
-    return _
+    def _decorate(
+        func: Callable[..., Optional[_T]]
+    ) -> Callable[..., Any]:
+        recorder: Optional[NullableMetrics] = None
+        if metrics is not False:
+            registry: MetricsRegistry = default_registry\
+                if metrics is True else metrics  # type: ignore
+            recorder = registry.metrics(
+                f"{func.__module__}.{func.__qualname__}")
+
+        if executor is None:
+            if recorder is not None:
+                return _measured(func, recorder)
+
+            @functools.wraps(func)
+            def _(*args: Any, **kwargs: Any) -> Nullable[_T]:
+                value: Optional[_T] = func(*args, **kwargs)
+                return Nullable(value)
+
+            return _
+
+        def with_timeout(
+            timeout: Optional[float]
+        ) -> Callable[
+            ..., Union[Future[Nullable[_T]], Awaitable[Nullable[_T]]]
+        ]:
+            def _(
+                *args: Any, **kwargs: Any
+            ) -> Union[Future[Nullable[_T]], Awaitable[Nullable[_T]]]:
+                return _submit(
+                    wrapper, executor, args, kwargs, timeout,
+                    raise_on_timeout, recorder)
+
+            return _
+
+        def wrapper(
+            *args: Any, **kwargs: Any
+        ) -> Union[Future[Nullable[_T]], Awaitable[Nullable[_T]]]:
+            return _submit(
+                wrapper, executor, args, kwargs, timeout,
+                raise_on_timeout, recorder)
+
+        # not decorated, so that the closure refers to the wrapper itself.
+        functools.update_wrapper(wrapper, func)
+        wrapper.with_timeout = with_timeout  # type: ignore
+        wrapper.metrics = recorder  # type: ignore
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+class _ThreadBatch(Generic[_K, _V]):
+    """Keys gathered from threads for a single batch call.
+    """
+
+    __slots__ = ["keys", "full", "done", "results", "error"]
+
+    def __init__(self) -> None:
+        self.keys: dict[_K, None] = {}
+        self.full: threading.Event = threading.Event()
+        self.done: threading.Event = threading.Event()
+        self.results: Mapping[_K, Optional[_V]] = {}
+        self.error: Optional[BaseException] = None
+
+
+class _LoopBatch(Generic[_K, _V]):
+    """Keys gathered on an event loop for a single batch call.
+    """
+
+    __slots__ = ["futures"]
+
+    def __init__(self) -> None:
+        self.futures: dict[_K, asyncio.Future[Nullable[_V]]] = {}
+
+
+class _Batcher(Generic[_K, _V]):
+    """Gathers keys into batches and dispatches them to the batch function.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[
+            [list[_K]],
+            Union[Mapping[_K, Optional[_V]],
+                  Awaitable[Mapping[_K, Optional[_V]]]]
+        ],
+        max_batch: int,
+        max_wait_ms: float
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch: int = max_batch
+        self._max_wait: float = max_wait_ms / 1000
+        self._lock: threading.Lock = threading.Lock()
+        self._thread_batch: Optional[_ThreadBatch[_K, _V]] = None
+        self._loop_batches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopBatch[_K, _V]
+        ] = weakref.WeakKeyDictionary()
+
+    def load(self, key: _K) -> Nullable[_V]:
+        leader: bool = False
+        with self._lock:
+            batch: Optional[_ThreadBatch[_K, _V]] = self._thread_batch
+            if batch is None:
+                batch = self._thread_batch = _ThreadBatch()
+                leader = True
+            batch.keys[key] = None
+            if len(batch.keys) >= self._max_batch:
+                self._thread_batch = None
+                batch.full.set()
+
+        if leader:
+            try:
+                batch.full.wait(self._max_wait)
+                with self._lock:
+                    if self._thread_batch is batch:
+                        self._thread_batch = None
+                batch.results = self._call(list(batch.keys))
+            except Exception as e:
+                batch.error = e
+            except BaseException as e:
+                # e.g. KeyboardInterrupt: the followers fail with it
+                # instead of waiting forever, and the leader re-raises it.
+                with self._lock:
+                    if self._thread_batch is batch:
+                        self._thread_batch = None
+                batch.error = e
+                raise
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise IncompleteCallBackException(
+                cause=batch.error, callback=self._batch_fn)
+        return Nullable(batch.results.get(key))
+
+    def load_async(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: _K
+    ) -> asyncio.Future[Nullable[_V]]:
+        batch: Optional[_LoopBatch[_K, _V]] = self._loop_batches.get(loop)
+        if batch is None:
+            batch = self._loop_batches[loop] = _LoopBatch()
+            if self._max_wait > 0:
+                loop.call_later(self._max_wait, self._flush, loop, batch)
+            else:
+                loop.call_soon(self._flush, loop, batch)
+
+        future: Optional[asyncio.Future[Nullable[_V]]]\
+            = batch.futures.get(key)
+        if future is None:
+            future = batch.futures[key] = loop.create_future()
+            if len(batch.futures) >= self._max_batch:
+                self._flush(loop, batch)
+        return future
+
+    def _flush(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: _LoopBatch[_K, _V]
+    ) -> None:
+        if self._loop_batches.get(loop) is not batch:
+            return
+        del self._loop_batches[loop]
+        loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: _LoopBatch[_K, _V]) -> None:
+        results: Mapping[_K, Optional[_V]]
+        try:
+            result: Any = self._batch_fn(list(batch.futures))
+            if inspect.isawaitable(result):
+                result = await result
+            results = result
+        except Exception as e:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(IncompleteCallBackException(
+                        cause=e, callback=self._batch_fn))
+            return
+
+        for key, future in batch.futures.items():
+            if not future.done():
+                future.set_result(Nullable(results.get(key)))
+
+    def _call(self, keys: list[_K]) -> Mapping[_K, Optional[_V]]:
+        result: Any = self._batch_fn(keys)
+        if inspect.isawaitable(result):
+            raise TypeError(
+                "an awaitable batch function requires a running event loop.")
+        return result
+
+
+def nullable_batch(
+    batch_fn: Callable[
+        [list[_K]],
+        Union[Mapping[_K, Optional[_V]], Awaitable[Mapping[_K, Optional[_V]]]]
+    ],
+    *,
+    max_batch: int = 100,
+    max_wait_ms: float = 0
+) -> Callable[
+    [Callable[..., _K]],
+    Callable[..., Union[Nullable[_V], Awaitable[Nullable[_V]]]]
+]:
+    """Decorator that gathers single-key lookups into calls of batch_fn.
+
+    The decorated function maps its arguments to a key.
+    Calls made within the same window share one call of batch_fn
+    with the de-duplicated keys, and each caller receives
+    a Nullable of the value for its own key (empty for missing keys).
+
+    From threads, the decorated function blocks and returns Nullable[V].
+    From a running event loop, it returns an awaitable of Nullable[V],
+    and batch_fn may be a coroutine function.
+
+    Args:
+        batch_fn (Callable[[list[K]], Mapping[K, Optional[V]]]):
+            bulk lookup that returns the found values by key.
+        max_batch (int, optional):
+            number of keys that dispatches the batch immediately.
+            Defaults to 100.
+        max_wait_ms (float, optional):
+            milliseconds to gather keys after the first call.
+            Defaults to 0, which gathers the calls of the current
+            event loop iteration, or only concurrent threads.
+
+    Raises:
+        IncompleteCallBackException:
+            on each caller, if batch_fn raises some exception.
+
+    Example:
+        >>> def find_all(ids: list[str]) -> dict[str, YourClass]:
+        ...     return {id: in_memory_db[id] for id in ids if id in in_memory_db}
+        ...
+        ...
+        ... @nullable_batch(find_all, max_batch=50, max_wait_ms=2)
+        ... def find_by_id(id: str) -> str:
+        ...     return id
+        ...
+        ...
+        ... async def main() -> None:
+        ...     found = await asyncio.gather(find_by_id("A001"), find_by_id("B001"))
+        ...     print([nullable.isPresent() for nullable in found])
+        ... asyncio.run(main())
+            [True, False]
+    """
+    def decorator(
+        func: Callable[..., _K]
+    ) -> Callable[..., Union[Nullable[_V], Awaitable[Nullable[_V]]]]:
+        batcher: _Batcher[_K, _V] = _Batcher(batch_fn, max_batch, max_wait_ms)
+
+        @functools.wraps(func)
+        def _(
+            *args: Any, **kwargs: Any
+        ) -> Union[Nullable[_V], Awaitable[Nullable[_V]]]:
+            key: _K = func(*args, **kwargs)
+            try:
+                loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            except RuntimeError:
+                return batcher.load(key)
+            return batcher.load_async(loop, key)
+
+        return _
+
+    return decorator
@@ -15,6 +15,7 @@ import copy
 import inspect
 import json
 import sys
+from types import FrameType
 from typing import Any, Callable, Optional
 from typing_extensions import TypedDict
 
@@ -37,38 +38,30 @@ class PyNullableError(Exception):
 
     def __init__(
             self,
-            cause: Optional[Exception] = None,
+            cause: Optional[BaseException] = None,
             message: Optional[str] = None):
         """constructor.
 
         Args:
-            cause (Optional[Exception], optional): causal error.
+            cause (Optional[BaseException], optional): causal error.
             message (Optional[str], optional): message.
         """
         exc_obj = cause if cause is not None\
             else sys.exc_info()[1]  # type: ignore
 
-        stack_list: list[inspect.FrameInfo] = inspect.stack()
-
-        from_subclasses: bool = not isinstance(self, stack_list[-1].__class__)
-
-        latest_stack_index: int
-        if from_subclasses:
-            latest_stack_index = 2
-        else:
-            latest_stack_index = 1
-
-        stack_list = stack_list[latest_stack_index:]
+        # skip this constructor and the constructor of the subclass.
+        frame: Optional[FrameType] = sys._getframe(2)
 
         self.__stacktrace = []
-        for stack in stack_list:
+        while frame is not None:
             self.__stacktrace.append(
                 Stack(
-                    FileName=stack.filename,
-                    FunctionName=stack.function,
-                    LineNumber=stack.lineno
+                    FileName=frame.f_code.co_filename,
+                    FunctionName=frame.f_code.co_name,
+                    LineNumber=frame.f_lineno
                 )
             )
+            frame = frame.f_back
 
         latest_stack: Stack = self.__stacktrace[1]
         file_name: str = latest_stack.get("FileName")
@@ -128,7 +121,7 @@ class UncallableException(PyNullableError):
         except AttributeError:
             code = str(callback)
 
-        base_class_param: dict[str, Any] = {
+        base_class_param = {
             "message": f"Callback is not callable `{code}`."}
 
         super().__init__(**base_class_param)
@@ -140,13 +133,13 @@ class IncompleteCallBackException(PyNullableError):
     """
 
     def __init__(self, callback: Callable[..., Any],
-                 cause: Optional[Exception] = None) -> None:
+                 cause: Optional[BaseException] = None) -> None:
         """constructor.
 
         Args:
             callback (Callable[..., Any]):
                 Callback function that raised the exception.
-            cause (Optional[Exception], optional):
+            cause (Optional[BaseException], optional):
                 Exception raised in a callback function.
         """
         base_class_param: dict[str, Any]
@@ -156,7 +149,7 @@ class IncompleteCallBackException(PyNullableError):
         except AttributeError:
             code = str(callback)
 
-        base_class_param: dict[str, Any] = {
+        base_class_param = {
             "message": f"Callback is Incompleted `{code}`."}
 
         if cause is not None:
@@ -0,0 +1,155 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's attribute descriptor
+
+Class:
+    * NullableField
+
+"""
+from __future__ import annotations
+from types import MemberDescriptorType
+from typing import Any, Generic, Optional, TypeVar, Union, overload
+from .nullable import Nullable
+
+_T = TypeVar("_T")
+
+_MISSING: Any = object()
+
+# prefix of the class attribute that re-attaches a descriptor
+# to the class rebuilt by dataclass(slots=True).
+_ALIAS: str = "_nullable_field_"
+
+
+class NullableField(Generic[_T]):
+    """Descriptor that exposes an attribute as a Nullable.
+
+    The Nullable is created once when the attribute is assigned,
+    and the same instance is returned on every access.
+    None is stored as the shared empty Nullable,
+    and so is an attribute that has never been assigned.
+
+    Values are stored in the attribute ``_<name>`` of the instance,
+    which may be declared in ``__slots__``.
+    With ``dataclass(slots=True)``, which replaces the class and
+    declares a slot per field, values are stored in the slot of the field.
+
+    Attributes:
+        _default (Optional[T]): default value used by dataclasses
+        _slot (Optional[str]): name of the storage attribute
+        _member (Optional[MemberDescriptorType]):
+            slot of the field in a class rebuilt by dataclasses
+
+    Example:
+        >>> @dataclass
+        ... class User:
+        ...     name: str
+        ...     email: NullableField[str] = NullableField(None)
+        ...
+        ...
+        ... user = User("foo")
+        ... user.email = "foo@example.com"
+        ... print(user.email.get())
+            foo@example.com
+    """
+
+    __slots__ = ["_default", "_slot", "_member"]
+
+    def __init__(
+        self,
+        default: Optional[_T] = _MISSING,
+        *,
+        slot: Optional[str] = None
+    ) -> None:
+        """constructor.
+
+        Args:
+            default (Optional[T], optional):
+                value returned on class access,
+                which dataclasses use as the field default.
+                Defaults to none, i.e. the field is required.
+            slot (Optional[str], optional):
+                name of the storage attribute. Defaults to ``_<name>``.
+        """
+        self._default: Optional[_T] = default
+        self._slot: Optional[str] = slot
+        self._member: Optional[MemberDescriptorType] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if name.startswith(_ALIAS):
+            # dataclass(slots=True) rebuilds the class without the field
+            # attributes, but with the other attributes, this alias included.
+            delattr(owner, name)
+            field: str = name[len(_ALIAS):]
+            member: Any = owner.__dict__.get(field)
+            if isinstance(member, MemberDescriptorType):
+                self._member = member
+                setattr(owner, field, self)
+            return
+        if self._slot is None:
+            self._slot = "_" + name
+        setattr(owner, _ALIAS + name, self)
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> Optional[_T]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> Nullable[_T]:
+        ...
+
+    def __get__(
+        self,
+        instance: Optional[object],
+        owner: type
+    ) -> Union[Optional[_T], Nullable[_T]]:
+        """Returns the attribute as a Nullable.
+
+        Raises:
+            AttributeError: on class access, if there is no default.
+
+        Returns:
+            Union[Optional[T], Nullable[T]]:
+                the stored Nullable, or the shared empty Nullable.
+                on class access, the default value.
+        """
+        if instance is None:
+            if self._default is _MISSING:
+                raise AttributeError(self._slot)
+            return self._default
+        if self._member is not None:
+            try:
+                return self._member.__get__(instance, owner)
+            except AttributeError:
+                return Nullable.empty()
+        return getattr(instance, self._slot, Nullable.empty())  # type: ignore
+
+    def __set__(
+        self,
+        instance: object,
+        value: Union[Optional[_T], Nullable[_T]]
+    ) -> None:
+        """Stores the value as a Nullable.
+
+        Args:
+            value (Union[Optional[T], Nullable[T]]):
+                None-able value, or a Nullable stored as is.
+        """
+        if value is None:
+            value = Nullable.empty()
+        elif not isinstance(value, Nullable):
+            value = Nullable(value)
+        if self._member is not None:
+            self._member.__set__(instance, value)
+            return
+        setattr(instance, self._slot, value)  # type: ignore
+
+    def __delete__(self, instance: object) -> None:
+        """Resets the attribute to the shared empty Nullable.
+        """
+        try:
+            if self._member is not None:
+                self._member.__delete__(instance)
+            else:
+                delattr(instance, self._slot)  # type: ignore
+        except AttributeError:
+            pass
@@ -0,0 +1,359 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's grouped aggregation
+
+Class:
+    * Aggregation
+
+Function:
+    * aggregate
+
+"""
+from __future__ import annotations
+import operator
+from typing import Any, Callable, Generic, Hashable, Iterable, Iterator,\
+    Mapping, Optional, Tuple, TypeVar, Union
+from .nullable import Nullable, _raw_value, is_production_mode
+from .exception import UncallableException
+
+_K = TypeVar("_K", bound=Hashable)
+
+OPERATIONS: frozenset[str] = frozenset({"count", "sum", "min", "max", "mean"})
+
+# positions of the accumulators of a field in the state of a group,
+# following the number of records of the group at position 0.
+_PRESENT: int = 0
+_EMPTY: int = 1
+_SUM: int = 2
+_MIN: int = 3
+_MAX: int = 4
+_WIDTH: int = 5
+
+_Spec = Union[str, Callable[[Any], Any]]
+_Step = Tuple[Callable[[Any], Any], int, bool, bool, bool]
+
+
+class _Field:
+    """Reads a field of a record by name: an item of a mapping,
+    otherwise an attribute.
+
+    Unlike a closure, it can be pickled with the aggregation.
+    """
+
+    __slots__ = ["name"]
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+
+    def __call__(self, record: Any) -> Any:
+        if isinstance(record, Mapping):
+            return record.get(self.name)
+        return getattr(record, self.name)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Field) and self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+
+def _reader(spec: _Spec) -> Callable[[Any], Any]:
+    if isinstance(spec, str):
+        return _Field(spec)
+    if not is_production_mode() and not callable(spec):
+        raise UncallableException(callback=spec)
+    return spec
+
+
+class Aggregation(Generic[_K]):
+    """Per-group count, sum, min, max and mean of optional fields,
+    computed in a single pass.
+
+    Fields may be None-able values or Nullable objects.
+    Empty values are counted and otherwise skipped,
+    and present values are read without copying.
+    Each field is read once per record, however many aggregations use it.
+
+    More records can be added with Aggregation#update,
+    and partial aggregations of the same specification can be combined
+    with Aggregation#merge. An aggregation of named fields can be pickled,
+    e.g. to return it from a process pool.
+
+    Example:
+        >>> totals = Aggregation("region", {"orders": ("amount", "count"),
+        ...                                 "total": ("amount", "sum")})
+        ... for chunk in chunks:
+        ...     totals.update(chunk)
+        ... print(totals["EU"]["total"].orElse(0))
+            1250
+    """
+
+    __slots__ = ["_key", "_aggs", "_readers", "_plan", "_groups"]
+
+    def __init__(
+        self,
+        key: _Spec,
+        aggs: Mapping[str, tuple[_Spec, str]]
+    ) -> None:
+        """constructor.
+
+        Args:
+            key (Union[str, Callable[[Any], K]]):
+                name of the field to group by, or function of the record.
+                A Nullable key is unwrapped, so empty keys form
+                the group None.
+            aggs (Mapping[str, tuple[Union[str, Callable[[Any], Any]], str]]):
+                name of each aggregation, and its field with its operation,
+                one of "count", "sum", "min", "max" and "mean".
+                "count" counts the present values.
+
+        Raises:
+            UncallableException:
+                if the key or a field is neither a name nor callable.
+            ValueError:
+                if an operation is unknown.
+        """
+        self._key: Callable[[Any], Any] = _reader(key)
+        self._aggs: dict[str, tuple[int, str]] = {}
+        self._readers: list[Callable[[Any], Any]] = []
+        operations: list[set[str]] = []
+        for name, (spec, operation) in aggs.items():
+            if operation not in OPERATIONS:
+                raise ValueError(f"unknown operation `{operation}`.")
+            reader: Callable[[Any], Any] = _reader(spec)
+            if reader not in self._readers:
+                self._readers.append(reader)
+                operations.append(set())
+            index: int = self._readers.index(reader)
+            operations[index].add(operation)
+            self._aggs[name] = (index, operation)
+
+        # reader, position of its accumulators and whether sum, min and max
+        # are needed, so that values are not summed unless asked.
+        self._plan: list[_Step] = [
+            (reader, 1 + index * _WIDTH,
+             bool(used & {"sum", "mean"}), "min" in used, "max" in used)
+            for index, (reader, used)
+            in enumerate(zip(self._readers, operations))]
+        self._groups: dict[Any, list[Any]] = {}
+
+    def _state(self) -> list[Any]:
+        # sums start from the first present value, as min and max do,
+        # so that values such as timedelta, which cannot be added to 0,
+        # can be summed.
+        return [0] + [0, 0, None, None, None] * len(self._readers)
+
+    def update(self, records: Iterable[Any]) -> Aggregation[_K]:
+        """Adds records to the aggregation.
+
+        The records are consumed once, so they can be a stream.
+
+        Args:
+            records (Iterable[Any]): mappings or objects with the fields.
+
+        Returns:
+            Aggregation[K]: this aggregation.
+        """
+        key: Callable[[Any], Any] = self._key
+        groups: dict[Any, list[Any]] = self._groups
+        plan: list[_Step] = self._plan
+        for record in records:
+            group: Any = key(record)
+            if isinstance(group, Nullable):
+                group = _raw_value(group)
+            state: Optional[list[Any]] = groups.get(group)
+            if state is None:
+                state = groups[group] = self._state()
+            state[0] += 1
+            for reader, base, summed, low, high in plan:
+                value: Any = reader(record)
+                if value is not None and isinstance(value, Nullable):
+                    value = _raw_value(value)
+                if value is None:
+                    state[base + _EMPTY] += 1
+                    continue
+                state[base + _PRESENT] += 1
+                if summed:
+                    total: Any = state[base + _SUM]
+                    state[base + _SUM] = value if total is None\
+                        else total + value
+                if low:
+                    current: Any = state[base + _MIN]
+                    if current is None or value < current:
+                        state[base + _MIN] = value
+                if high:
+                    current = state[base + _MAX]
+                    if current is None or value > current:
+                        state[base + _MAX] = value
+        return self
+
+    def merge(self, other: Aggregation[_K]) -> Aggregation[_K]:
+        """Returns the combination of two partial aggregations.
+
+        Args:
+            other (Aggregation[K]):
+                aggregation of the same key and aggregations.
+
+        Raises:
+            ValueError: if the specifications differ.
+
+        Returns:
+            Aggregation[K]: a new aggregation of the records of both.
+
+        Example:
+            >>> with ProcessPoolExecutor() as executor:
+            ...     parts = executor.map(aggregate_chunk, chunks)
+            ...     totals = functools.reduce(Aggregation.merge, parts)
+        """
+        if self._key != other._key or self._aggs != other._aggs\
+                or self._readers != other._readers:
+            raise ValueError("aggregations of different specifications.")
+        merged: Aggregation[_K] = Aggregation.__new__(Aggregation)
+        merged._key = self._key
+        merged._aggs = self._aggs
+        merged._readers = self._readers
+        merged._plan = self._plan
+        merged._groups = {
+            group: list(state) for group, state in self._groups.items()}
+
+        for group, state in other._groups.items():
+            target: Optional[list[Any]] = merged._groups.get(group)
+            if target is None:
+                merged._groups[group] = list(state)
+                continue
+            target[0] += state[0]
+            for _, base, _, _, _ in self._plan:
+                target[base + _PRESENT] += state[base + _PRESENT]
+                target[base + _EMPTY] += state[base + _EMPTY]
+                for position, combine in (
+                        (base + _SUM, operator.add),
+                        (base + _MIN, min), (base + _MAX, max)):
+                    # accumulators that are not needed stay None.
+                    if state[position] is not None:
+                        target[position] = state[position]\
+                            if target[position] is None\
+                            else combine(target[position], state[position])
+        return merged
+
+    def _field(self, group: _K, name: str) -> tuple[list[Any], int, str]:
+        index, operation = self._aggs[name]
+        return self._groups[group], 1 + index * _WIDTH, operation
+
+    def __getitem__(self, group: _K) -> dict[str, Nullable[Any]]:
+        """Returns the results of a group.
+
+        Args:
+            group (K): key of the group.
+
+        Raises:
+            KeyError: if no record has the key.
+
+        Returns:
+            dict[str, Nullable[Any]]:
+                result of each aggregation. Results other than "count"
+                are empty if the field has no present value in the group.
+        """
+        state: list[Any] = self._groups[group]
+        results: dict[str, Nullable[Any]] = {}
+        for name, (index, operation) in self._aggs.items():
+            base: int = 1 + index * _WIDTH
+            present: int = state[base + _PRESENT]
+            if operation == "count":
+                results[name] = Nullable(present)
+            elif not present:
+                results[name] = Nullable.empty()
+            elif operation == "sum":
+                results[name] = Nullable(state[base + _SUM])
+            elif operation == "mean":
+                results[name] = Nullable(state[base + _SUM] / present)
+            elif operation == "min":
+                results[name] = Nullable(state[base + _MIN])
+            else:
+                results[name] = Nullable(state[base + _MAX])
+        return results
+
+    def results(self) -> dict[_K, dict[str, Nullable[Any]]]:
+        """
+        Returns:
+            dict[K, dict[str, Nullable[Any]]]:
+                results of every group, in order of first appearance.
+        """
+        return {group: self[group] for group in self._groups}
+
+    def rows(self, group: _K) -> int:
+        """
+        Returns:
+            int: number of records of the group.
+        """
+        return self._groups[group][0]
+
+    def present_count(self, group: _K, name: str) -> int:
+        """
+        Returns:
+            int: number of present values of the field of the aggregation
+            in the group.
+        """
+        state, base, _ = self._field(group, name)
+        return state[base + _PRESENT]
+
+    def empty_count(self, group: _K, name: str) -> int:
+        """
+        Returns:
+            int: number of empty values of the field of the aggregation
+            in the group.
+        """
+        state, base, _ = self._field(group, name)
+        return state[base + _EMPTY]
+
+    def __contains__(self, group: object) -> bool:
+        return group in self._groups
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._groups)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(groups={len(self._groups)}, "\
+            f"aggs={list(self._aggs)})"
+
+
+def aggregate(
+    records: Iterable[Any],
+    key: _Spec,
+    aggs: Mapping[str, tuple[_Spec, str]]
+) -> Aggregation[Any]:
+    """Groups records by a key and aggregates their optional fields
+    in a single pass.
+
+    see: Aggregation
+
+    Args:
+        records (Iterable[Any]): mappings or objects with the fields.
+        key (Union[str, Callable[[Any], Hashable]]):
+            name of the field to group by, or function of the record.
+        aggs (Mapping[str, tuple[Union[str, Callable[[Any], Any]], str]]):
+            name of each aggregation, and its field with its operation,
+            one of "count", "sum", "min", "max" and "mean".
+
+    Raises:
+        UncallableException:
+            if the key or a field is neither a name nor callable.
+        ValueError:
+            if an operation is unknown.
+
+    Returns:
+        Aggregation[Any]: the aggregation, which can be updated further.
+
+    Example:
+        >>> orders = [{"region": "EU", "amount": 10},
+        ...           {"region": "EU", "amount": None},
+        ...           {"region": "US", "amount": Nullable(None)}]
+        ... totals = aggregate(orders, key="region",
+        ...                    aggs={"total": ("amount", "sum"),
+        ...                          "average": ("amount", "mean")})
+        ... print(totals["EU"]["total"].get(), totals["US"]["total"].isEmpty())
+            10 True
+    """
+    return Aggregation(key, aggs).update(records)
@@ -0,0 +1,165 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's hedged fallbacks
+
+Function:
+    * first_present_concurrent
+    * first_present_async
+
+"""
+from __future__ import annotations
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Executor, Future,\
+    ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar,\
+    Union
+from .nullable import Nullable, _raw_value, is_production_mode
+from .exception import UncallableException, IncompleteCallBackException
+
+_T = TypeVar("_T")
+
+_Supplied = Union[Optional[_T], Nullable[_T]]
+
+
+def _validate(suppliers: Sequence[Callable[[], Any]]) -> None:
+    if is_production_mode():
+        return
+    for supplier in suppliers:
+        if not callable(supplier):
+            raise UncallableException(callback=supplier)
+
+
+def _unwrap(value: Any) -> Any:
+    return _raw_value(value) if isinstance(value, Nullable) else value
+
+
+def _all_failed(
+    suppliers: Sequence[Callable[[], Any]],
+    errors: list[tuple[int, BaseException]]
+) -> BaseException:
+    """Returns the exception to raise when every supplier has failed.
+    """
+    errors.sort(key=lambda error: error[0])
+    index, cause = errors[0]
+    if is_production_mode():
+        return cause
+    exception: IncompleteCallBackException = IncompleteCallBackException(
+        cause=cause, callback=suppliers[index])  # type: ignore
+    exception.causes = tuple(error for _, error in errors)  # type: ignore
+    return exception
+
+
+def first_present_concurrent(
+    suppliers: Sequence[Callable[[], _Supplied[_T]]],
+    executor: Optional[Executor] = None,
+    hedge_after_ms: Optional[float] = None
+) -> Nullable[_T]:
+    """Runs suppliers on an executor and returns the first present result.
+
+    see: Nullable#firstPresentConcurrent
+    """
+    _validate(suppliers)
+    if not suppliers:
+        return Nullable.empty()
+
+    owned: Optional[Executor] = None
+    if executor is None:
+        executor = owned = ThreadPoolExecutor(
+            max_workers=len(suppliers),
+            thread_name_prefix="py_nullable-hedge")
+    delay: Optional[float] = None\
+        if hedge_after_ms is None else hedge_after_ms / 1000
+
+    started: dict[Future[Any], int] = {}
+    errors: list[tuple[int, BaseException]] = []
+    try:
+        for index, supplier in enumerate(suppliers):
+            started[executor.submit(supplier)] = index
+            if delay is not None:
+                break
+
+        pending: set[Future[Any]] = set(started)
+        while pending:
+            timeout: Optional[float] = delay\
+                if len(started) < len(suppliers) else None
+            done, pending = wait(
+                pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                error: Optional[BaseException] = future.exception()
+                if error is not None:
+                    errors.append((started[future], error))
+                    continue
+                value: Any = _unwrap(future.result())
+                if value is not None:
+                    return Nullable(value)
+            # a timed out, empty or failed supplier is hedged by the next one.
+            if len(started) < len(suppliers):
+                future = executor.submit(suppliers[len(started)])
+                started[future] = len(started)
+                pending.add(future)
+    finally:
+        for future in started:
+            future.cancel()
+        if owned is not None:
+            owned.shutdown(wait=False)
+
+    if len(errors) == len(suppliers):
+        raise _all_failed(suppliers, errors)
+    return Nullable.empty()
+
+
+async def first_present_async(
+    suppliers: Sequence[Callable[[], Awaitable[_Supplied[_T]]]],
+    hedge_after_ms: Optional[float] = None
+) -> Nullable[_T]:
+    """Runs coroutine suppliers as tasks and returns the first present result.
+
+    see: Nullable#firstPresentAsync
+    """
+    _validate(suppliers)
+    if not suppliers:
+        return Nullable.empty()
+
+    delay: Optional[float] = None\
+        if hedge_after_ms is None else hedge_after_ms / 1000
+
+    started: dict[asyncio.Future[Any], int] = {}
+    errors: list[tuple[int, BaseException]] = []
+
+    def start(index: int) -> asyncio.Future[Any]:
+        task: asyncio.Future[Any] = asyncio.ensure_future(suppliers[index]())
+        started[task] = index
+        return task
+
+    try:
+        pending: set[asyncio.Future[Any]] = set()
+        for index in range(len(suppliers)):
+            pending.add(start(index))
+            if delay is not None:
+                break
+
+        while pending:
+            timeout: Optional[float] = delay\
+                if len(started) < len(suppliers) else None
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():
+                    errors.append((started[task], asyncio.CancelledError()))
+                    continue
+                error: Optional[BaseException] = task.exception()
+                if error is not None:
+                    errors.append((started[task], error))
+                    continue
+                value: Any = _unwrap(task.result())
+                if value is not None:
+                    return Nullable(value)
+            if len(started) < len(suppliers):
+                pending.add(start(len(started)))
+    finally:
+        for task in started:
+            task.cancel()
+
+    if len(errors) == len(suppliers):
+        raise _all_failed(suppliers, errors)
+    return Nullable.empty()
@@ -0,0 +1,486 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's chain inliner
+
+Function:
+    * nullable_inline
+
+"""
+from __future__ import annotations
+import ast
+import copy
+import inspect
+import textwrap
+from typing import Any, Callable, Optional, TypeVar
+from .nullable import Nullable, _EMPTY, _raw_value, is_production_mode
+from .exception import IncompleteCallBackException, EmptyValueException,\
+    UncallableException
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_PREFIX: str = "_nl_"
+
+# values of these types are returned as is by copy.deepcopy.
+_ATOMIC: frozenset[type] = frozenset({
+    type(None), bool, int, float, complex, str, bytes, range, type})
+
+_STEPS: frozenset[str] = frozenset({"map", "filter"})
+_TERMINALS: dict[str, int] = {
+    "orElse": 1, "get": 0, "isPresent": 0, "isEmpty": 0}
+
+# nodes that open a scope or rebind names inside a lambda body,
+# which make substituting its parameter unsafe.
+_UNSAFE: tuple[type, ...] = (
+    ast.Lambda, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+    ast.Yield, ast.YieldFrom, ast.Await) + (
+    (ast.NamedExpr,) if hasattr(ast, "NamedExpr") else ())
+
+
+def _checked(callback: Any) -> Any:
+    """Validates a callback as Nullable#map and Nullable#filter do.
+    """
+    if not is_production_mode() and not callable(callback):
+        raise UncallableException(callback=callback)
+    return callback
+
+
+def _empty() -> EmptyValueException:
+    """Returns the exception to raise for get of an empty value.
+
+    It is created one frame below the rewritten function,
+    as Nullable#get does, so that its location is the same.
+    """
+    return EmptyValueException()
+
+
+def _failure(cause: Exception, callback: Any) -> Exception:
+    """Returns the exception to raise for a failed callback.
+    """
+    if is_production_mode():
+        return cause
+    return IncompleteCallBackException(cause=cause, callback=callback)
+
+
+_HELPERS: dict[str, Any] = {
+    "Nullable": Nullable,
+    "EMPTY": _EMPTY,
+    "raw": _raw_value,
+    "copy": copy.deepcopy,
+    "atomic": _ATOMIC,
+    "checked": _checked,
+    "failure": _failure,
+    "empty": _empty,
+    "Exception": Exception,
+    "type": type,
+}
+
+
+class _Placeholders(ast.NodeTransformer):
+    """Replaces ``__<name>__`` names of a template with the given nodes,
+    and ``_nl_<name>`` helper names are left as they are.
+    """
+
+    def __init__(self, nodes: dict[str, ast.AST]) -> None:
+        self._nodes: dict[str, ast.AST] = nodes
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id.startswith("__") and node.id.endswith("__"):
+            return self._nodes[node.id[2:-2]]
+        return node
+
+
+class _Rename(ast.NodeTransformer):
+    """Substitutes the parameter of an inlined lambda.
+    """
+
+    def __init__(self, name: str, replacement: str) -> None:
+        self._name: str = name
+        self._replacement: str = replacement
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id == self._name:
+            return ast.copy_location(
+                ast.Name(id=self._replacement, ctx=ast.Load()), node)
+        return node
+
+
+def _template(
+    source: str,
+    location: ast.AST,
+    **nodes: ast.AST
+) -> list[ast.stmt]:
+    """Parses template statements located at the rewritten statement.
+    """
+    body: list[ast.stmt] = ast.parse(textwrap.dedent(source)).body
+    for statement in body:
+        for node in ast.walk(statement):
+            if "lineno" in node._attributes:
+                ast.copy_location(node, location)
+    return [_Placeholders(nodes).visit(statement) for statement in body]
+
+
+def _segment(source: str, node: ast.expr) -> Optional[str]:
+    """Returns the source of an expression, for Python 3.7
+    whose nodes have no end position.
+
+    The source is sliced from the start of the node up to
+    the shortest text that parses into the same expression.
+    """
+    lines: list[str] = source.splitlines(keepends=True)
+    if not 0 < node.lineno <= len(lines):
+        return None
+    text: str = "".join(lines[node.lineno - 1:])
+    # col_offset is in UTF-8 bytes.
+    start: int = len(lines[node.lineno - 1].encode("utf-8")[
+        :node.col_offset].decode("utf-8", "ignore"))
+    expected: str = ast.dump(node)
+    for end in range(start + 1, len(text) + 1):
+        candidate: str = text[start:end]
+        try:
+            parsed: ast.Module = ast.parse(f"({candidate}\n)")
+        except SyntaxError:
+            continue
+        value: Any = getattr(parsed.body[0], "value", None)
+        if value is not None and ast.dump(value) == expected:
+            return candidate.strip()
+    return None
+
+
+def _inlinable(callback: ast.expr) -> Optional[str]:
+    """Returns the parameter name if the lambda can be inlined.
+    """
+    if not isinstance(callback, ast.Lambda):
+        return None
+    args: ast.arguments = callback.args
+    if getattr(args, "posonlyargs", []) or args.vararg or args.kwonlyargs\
+            or args.kwarg or args.defaults or len(args.args) != 1:
+        return None
+    if any(isinstance(node, _UNSAFE) for node in ast.walk(callback.body)):
+        return None
+    return args.args[0].arg
+
+
+class _Chain:
+    """Nullable method chain found in a statement.
+
+    Attributes:
+        receiver (ast.expr): expression the chain starts from
+        steps (list[tuple[str, ast.expr]]): map and filter calls, in order
+        terminal (Optional[tuple[str, list[ast.expr]]]): ending method
+        expression (ast.expr): the whole chain
+    """
+
+    def __init__(
+        self,
+        receiver: ast.expr,
+        steps: list[tuple[str, ast.expr]],
+        terminal: Optional[tuple[str, list[ast.expr]]],
+        expression: ast.expr
+    ) -> None:
+        self.receiver: ast.expr = receiver
+        self.steps: list[tuple[str, ast.expr]] = steps
+        self.terminal: Optional[tuple[str, list[ast.expr]]] = terminal
+        self.expression: ast.expr = expression
+
+    @classmethod
+    def find(cls, expression: Optional[ast.expr]) -> Optional[_Chain]:
+        node: Optional[ast.expr] = expression
+        terminal: Optional[tuple[str, list[ast.expr]]] = None
+        steps: list[tuple[str, ast.expr]] = []
+        while isinstance(node, ast.Call)\
+                and isinstance(node.func, ast.Attribute)\
+                and not node.keywords\
+                and not any(isinstance(arg, ast.Starred) for arg in node.args):
+            name: str = node.func.attr
+            if not steps and terminal is None and name in _TERMINALS:
+                if len(node.args) != _TERMINALS[name]:
+                    return None
+                terminal = (name, node.args)
+            elif name in _STEPS and len(node.args) == 1:
+                steps.append((name, node.args[0]))
+            else:
+                break
+            node = node.func.value
+        if not steps or node is None:
+            return None
+        steps.reverse()
+        return cls(node, steps, terminal, expression)  # type: ignore
+
+
+class _Inliner(ast.NodeTransformer):
+    """Rewrites the statements of a function whose value is a Nullable chain.
+    """
+
+    def __init__(self, source: str) -> None:
+        self._source: str = source
+        self._counter: int = 0
+        self.rewritten: int = 0
+
+    def _name(self) -> str:
+        self._counter += 1
+        return f"{_PREFIX}{self._counter}"
+
+    def _callback_source(self, callback: ast.expr) -> str:
+        segment: Optional[str] = None
+        if hasattr(ast, "get_source_segment"):
+            segment = ast.get_source_segment(self._source, callback)
+        else:
+            segment = _segment(self._source, callback)
+        return segment or "<lambda>"
+
+    def _step(
+        self,
+        method: str,
+        callback: ast.expr,
+        value: str,
+        location: ast.AST
+    ) -> list[ast.stmt]:
+        argument: str = self._name()
+        copied: str = f"{argument} = {value} "\
+            f"if {_PREFIX}type({value}) in {_PREFIX}atomic "\
+            f"else {_PREFIX}copy({value})"
+        parameter: Optional[str] = _inlinable(callback)
+        if parameter is not None:
+            body: ast.expr = _Rename(parameter, argument).visit(
+                copy.deepcopy(callback.body))  # type: ignore
+            described: ast.expr = ast.Constant(
+                value=self._callback_source(callback))
+            prologue: list[ast.stmt] = []
+        else:
+            function: str = self._name()
+            body = _template(  # type: ignore
+                f"{function}({argument})", location)[0].value
+            described = ast.Name(id=function, ctx=ast.Load())
+            prologue = _template(
+                f"{function} = {_PREFIX}checked(__callback__)",
+                location, callback=callback)
+
+        if method == "map":
+            source: str = f"""
+                if {value} is not None:
+                    {copied}
+                    try:
+                        {value} = __body__
+                    except {_PREFIX}Exception as {_PREFIX}e:
+                        raise {_PREFIX}failure({_PREFIX}e, __described__)
+            """
+        else:
+            source = f"""
+                if {value} is not None:
+                    {copied}
+                    try:
+                        if not __body__:
+                            {value} = None
+                    except {_PREFIX}Exception as {_PREFIX}e:
+                        raise {_PREFIX}failure({_PREFIX}e, __described__)
+            """
+        return prologue + _template(
+            source, location, body=body, described=described)
+
+    def _terminal(
+        self,
+        chain: _Chain,
+        value: str,
+        result: str,
+        location: ast.AST
+    ) -> list[ast.stmt]:
+        copied: str = f"({value} "\
+            f"if {_PREFIX}type({value}) in {_PREFIX}atomic "\
+            f"else {_PREFIX}copy({value}))"
+        if chain.terminal is None:
+            return _template(
+                f"{result} = {_PREFIX}EMPTY if {value} is None "
+                f"else {_PREFIX}Nullable({value})", location)
+        name, args = chain.terminal
+        if name == "isPresent":
+            return _template(f"{result} = {value} is not None", location)
+        if name == "isEmpty":
+            return _template(f"{result} = {value} is None", location)
+        if name == "get":
+            return _template(f"""
+                if {value} is None:
+                    raise {_PREFIX}empty()
+                {result} = {copied}
+            """, location)
+        other: ast.expr = args[0]
+        if isinstance(other, ast.Constant):
+            return _template(
+                f"{result} = __other__ if {value} is None else {copied}",
+                location, other=other)
+        # the argument is evaluated after the chain, as in the original.
+        default: str = self._name()
+        return _template(f"""
+            {default} = __other__
+            {result} = {default} if {value} is None else {copied}
+        """, location, other=other)
+
+    def _rewrite(
+        self,
+        statement: ast.stmt,
+        expression: Optional[ast.expr]
+    ) -> Optional[list[ast.stmt]]:
+        chain: Optional[_Chain] = _Chain.find(expression)
+        if chain is None:
+            return None
+        self._counter = 0
+        receiver: str = self._name()
+        value: str = self._name()
+        result: str = self._name()
+
+        fast: list[ast.stmt] = _template(
+            f"{value} = {_PREFIX}raw({receiver})", statement)
+        for method, callback in chain.steps:
+            fast += self._step(method, callback, value, statement)
+        fast += self._terminal(chain, value, result, statement)
+
+        # the original chain runs on anything but an exact Nullable,
+        # e.g. lazy Nullable or objects that merely have a map method.
+        fallback: ast.expr = copy.deepcopy(chain.expression, {
+            id(chain.receiver): ast.copy_location(
+                ast.Name(id=receiver, ctx=ast.Load()), chain.receiver)})
+
+        rewritten: list[ast.stmt] = _template(f"""
+            {receiver} = __receiver__
+            if {_PREFIX}type({receiver}) is {_PREFIX}Nullable:
+                pass
+            else:
+                {result} = __fallback__
+        """, statement, receiver=chain.receiver, fallback=fallback)
+        rewritten[1].body = fast  # type: ignore
+
+        if isinstance(statement, ast.Expr):
+            self.rewritten += 1
+            return rewritten
+        statement.value = ast.copy_location(  # type: ignore
+            ast.Name(id=result, ctx=ast.Load()), expression)  # type: ignore
+        self.rewritten += 1
+        return rewritten + [statement]
+
+    def _visit_statement(self, statement: ast.stmt) -> Any:
+        return self._rewrite(
+            statement, getattr(statement, "value", None)) or statement
+
+    visit_Assign = _visit_statement  # type: ignore
+    visit_AnnAssign = _visit_statement  # type: ignore
+    visit_Return = _visit_statement  # type: ignore
+    visit_Expr = _visit_statement  # type: ignore
+
+    def _skip(self, node: ast.AST) -> ast.AST:
+        return node
+
+    # nested scopes are left to the runtime API.
+    visit_FunctionDef = _skip
+    visit_AsyncFunctionDef = _skip
+    visit_ClassDef = _skip
+    visit_Lambda = _skip
+
+
+def _compile(func: Callable[..., Any]) -> Optional[Callable[..., Any]]:
+    """Returns the function compiled with its chains inlined,
+    or None if there is nothing to inline or it cannot be recompiled.
+    """
+    if getattr(func, "__closure__", None) or "." in func.__qualname__\
+            or hasattr(func, "__wrapped__"):
+        return None
+    try:
+        lines, first_line = inspect.getsourcelines(func)
+    except (OSError, TypeError):
+        return None
+    source: str = textwrap.dedent("".join(lines))
+    try:
+        tree: ast.Module = ast.parse(source)
+    except SyntaxError:
+        return None
+    definition: ast.stmt = tree.body[0]
+    if not isinstance(definition, (ast.FunctionDef, ast.AsyncFunctionDef))\
+            or definition.name != func.__name__:
+        return None
+
+    inliner: _Inliner = _Inliner(source)
+    definition.body = [
+        rewritten
+        for statement in definition.body
+        for rewritten in _as_list(inliner.visit(statement))]
+    if not inliner.rewritten:
+        return None
+
+    # decorators, defaults and annotations have already been evaluated,
+    # so they are taken from the original function instead.
+    definition.decorator_list = []
+    definition.returns = None
+    arguments: ast.arguments = definition.args
+    arguments.defaults = []
+    arguments.kw_defaults = [None] * len(arguments.kwonlyargs)  # type: ignore
+    for argument in ast.walk(arguments):
+        if isinstance(argument, ast.arg):
+            argument.annotation = None
+
+    # helpers are closed over by a factory, so they are looked up as cells.
+    factory: ast.FunctionDef = _template(f"""
+        def {_PREFIX}factory({", ".join(_PREFIX + name for name in _HELPERS)}):
+            pass
+    """, definition)[0]  # type: ignore
+    factory.body = _template(f"return {func.__name__}", definition)
+    factory.body.insert(0, definition)
+    module: ast.Module = ast.Module(body=[factory], type_ignores=[])
+    ast.fix_missing_locations(module)
+    ast.increment_lineno(module, first_line - 1)
+
+    namespace: dict[str, Any] = {}
+    exec(compile(module, func.__code__.co_filename, "exec"),
+         func.__globals__, namespace)
+    inlined: Any = namespace[f"{_PREFIX}factory"](*_HELPERS.values())
+    inlined.__name__ = func.__name__
+    inlined.__qualname__ = func.__qualname__
+    inlined.__module__ = func.__module__
+    inlined.__doc__ = func.__doc__
+    inlined.__defaults__ = func.__defaults__
+    inlined.__kwdefaults__ = func.__kwdefaults__
+    inlined.__annotations__ = func.__annotations__
+    inlined.__dict__.update(func.__dict__)
+    inlined.__wrapped__ = func
+    return inlined
+
+
+def _as_list(node: Any) -> list[ast.stmt]:
+    return node if isinstance(node, list) else [node]
+
+
+def nullable_inline(func: _F) -> _F:
+    """Decorator that compiles Nullable chains of a function
+    into plain branches.
+
+    The source of the function is parsed once, and statements
+    whose whole value is a chain of map and filter calls,
+    optionally ending with orElse, get, isPresent or isEmpty, are
+    rewritten into ``if value is None`` branches.
+    Lambdas with a single parameter are inlined into the branches.
+
+    The rewritten code behaves as the chain, including copies of values
+    passed to callbacks and the exceptions raised. When the receiver is
+    not exactly a Nullable (e.g. Nullable#lazyOf), the original chain runs.
+
+    Note:
+        The function is returned as it is when it cannot be recompiled:
+        its source is not available, or it is a closure, a method,
+        or already decorated.
+        Names starting with ``_nl_`` are reserved in the function.
+
+    Args:
+        func (F): function to be decorated.
+
+    Returns:
+        F: the compiled function, or func itself.
+
+    Example:
+        >>> @nullable_inline
+        ... def discounted(price: Nullable[int]) -> int:
+        ...     return price.map(lambda x: x * 9 // 10).filter(
+        ...         lambda x: x > 0).orElse(0)
+        ...
+        ...
+        ... print(discounted(Nullable[int](100)))
+            90
+    """
+    inlined: Optional[Callable[..., Any]] = _compile(func)
+    return func if inlined is None else inlined  # type: ignore
@@ -0,0 +1,68 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's helpers for iterables of Nullable
+
+Function:
+    * present_values
+    * partition
+
+"""
+from __future__ import annotations
+import functools
+import operator
+from itertools import compress
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+from .nullable import Nullable, _raw_value
+
+_T = TypeVar("_T")
+
+_is_not_none: Callable[[Any], bool] = functools.partial(operator.is_not, None)
+
+
+def present_values(nullables: Iterable[Nullable[_T]]) -> Iterator[_T]:
+    """Lazily flattens Nullable objects to their values, skipping empty ones.
+
+    Note:
+        Like Nullable#ifPresent, values are passed by reference.
+        The iteration runs on ``map`` and ``filter`` without a
+        method call per element.
+
+    Args:
+        nullables (Iterable[Nullable[T]]): Nullable objects to flatten.
+
+    Returns:
+        Iterator[T]: values that are not None.
+
+    Example:
+        >>> nullables = [Nullable[int](1), Nullable[int](None), Nullable[int](3)]
+            print(list(present_values(nullables)))
+        [1, 3]
+    """
+    return filter(_is_not_none, map(_raw_value, nullables))
+
+
+def partition(
+    nullables: Iterable[Nullable[_T]]
+) -> tuple[list[Nullable[_T]], list[Nullable[_T]]]:
+    """Splits Nullable objects into present ones and empty ones.
+
+    Args:
+        nullables (Iterable[Nullable[T]]): Nullable objects to split.
+
+    Returns:
+        tuple[list[Nullable[T]], list[Nullable[T]]]:
+            present Nullable objects and empty Nullable objects,
+            each in the original order.
+
+    Example:
+        >>> nullables = [Nullable[int](1), Nullable[int](None), Nullable[int](3)]
+            present, empty = partition(nullables)
+            print(len(present), len(empty))
+        2 1
+    """
+    items: list[Nullable[_T]] = list(nullables)
+    flags: list[bool] = list(map(_is_not_none, map(_raw_value, items)))
+    return (
+        list(compress(items, flags)),
+        list(compress(items, map(operator.not_, flags)))
+    )
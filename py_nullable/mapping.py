@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's mapping view
+
+Class:
+    * NullableMapping
+
+"""
+from __future__ import annotations
+from typing import Any, Generic, Hashable, Iterable, Iterator, Mapping,\
+    Optional, TypeVar
+from .nullable import Nullable
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class NullableMapping(Generic[_K, _V]):
+    """View that looks up an existing mapping as Nullable values.
+
+    The mapping is referenced, not copied,
+    so changes to it are visible through the view.
+    Missing keys and None values are both treated as empty.
+
+    Attributes:
+        _mapping (Mapping[K, Optional[V]]): mapping to look up
+    """
+
+    __slots__ = ["_mapping"]
+
+    def __init__(self, mapping: Mapping[_K, Optional[_V]]) -> None:
+        """constructor.
+
+        Args:
+            mapping (Mapping[K, Optional[V]]): mapping to look up.
+        """
+        self._mapping: Mapping[_K, Optional[_V]] = mapping
+
+    def get(self, key: _K) -> Nullable[_V]:
+        """Returns the value of the key as a Nullable.
+
+        Args:
+            key (K): key to look up.
+
+        Returns:
+            Nullable[V]:
+                a Nullable describing the value,
+                or the shared empty Nullable if the key is missing or None.
+
+        Example:
+            >>> flags: NullableMapping[str, bool] = NullableMapping({"beta": True})
+                print(flags.get("beta").get())
+            True
+        """
+        value: Optional[_V] = self._mapping.get(key)
+        if value is None:
+            return Nullable.empty()
+        return Nullable(value)
+
+    def is_present(self, key: _K) -> bool:
+        """If the key has a value that is not None, returns true, otherwise false.
+
+        Neither a Nullable nor a copy of the value is created.
+
+        Args:
+            key (K): key to look up.
+
+        Returns:
+            bool: true if the key has a value that is not None, otherwise false.
+        """
+        return self._mapping.get(key) is not None
+
+    def get_many(self, keys: Iterable[_K]) -> Iterator[Nullable[_V]]:
+        """Lazily looks up many keys.
+
+        Args:
+            keys (Iterable[K]): keys to look up.
+
+        Returns:
+            Iterator[Nullable[V]]:
+                Nullable per key in the order of keys,
+                created as the iterator is consumed.
+
+        Example:
+            >>> config: NullableMapping[str, int] = NullableMapping({"a": 1})
+                print([n.orElse(0) for n in config.get_many(["a", "b"])])
+            [1, 0]
+        """
+        return map(self.get, keys)
+
+    def get_path(self, path: Iterable[Hashable]) -> Nullable[Any]:
+        """Looks up nested mappings along the path.
+
+        Args:
+            path (Iterable[Hashable]): keys from the outermost mapping.
+
+        Returns:
+            Nullable[Any]:
+                a Nullable describing the value at the path,
+                or an empty Nullable if any step is missing, None,
+                or not a mapping.
+
+        Example:
+            >>> config = NullableMapping({"db": {"host": "localhost"}})
+                print(config.get_path(("db", "host")).get())
+            localhost
+        """
+        current: Any = self._mapping
+        for key in path:
+            if not isinstance(current, Mapping):
+                return Nullable.empty()
+            current = current.get(key)
+            if current is None:
+                return Nullable.empty()
+        return Nullable(current)
+
+    def __contains__(self, key: _K) -> bool:
+        return self.is_present(key)
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
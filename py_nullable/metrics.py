@@ -0,0 +1,331 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's call metrics
+
+Class:
+    * NullableMetrics
+    * MetricsRegistry
+
+Variable:
+    * default_registry
+
+"""
+from __future__ import annotations
+import threading
+from bisect import bisect_left
+from typing import Iterable, Iterator, Optional, Union
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# positions of the counters in a shard, followed by the bucket counts.
+# the number of calls is the sum of the bucket counts.
+_EMPTIES: int = 0
+_ERRORS: int = 1
+_SUM: int = 2
+_BUCKETS: int = 3
+
+# upper bound of a bucket. int bounds are not converted to float,
+# so that they are rendered as given, also when compiled with mypyc.
+_Bound = Union[int, float]
+
+
+class NullableMetrics:
+    """Call counters and latency histogram of a function.
+
+    Each thread records into its own shard, so recording takes no lock
+    and stays exact on free-threaded builds.
+    Shards are summed under the lock when the metrics are read,
+    so the values read together are taken from the same snapshot,
+    and shards of finished threads are folded into a single one,
+    so their number stays that of the threads alive.
+
+    Attributes:
+        name (str): name of the function
+        buckets (tuple[float, ...]): upper bounds of the histogram, in seconds
+    """
+
+    __slots__ = ["name", "buckets", "_local", "_shards", "_retired", "_lock"]
+
+    def __init__(
+        self,
+        name: str,
+        buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> None:
+        """constructor.
+
+        Args:
+            name (str): name of the function.
+            buckets (Iterable[float], optional):
+                upper bounds of the histogram, in seconds.
+
+        Raises:
+            ValueError: if the buckets are not strictly increasing.
+        """
+        self.name: str = name
+        self.buckets: tuple[_Bound, ...] = tuple(buckets)
+        if any(a >= b for a, b in zip(self.buckets, self.buckets[1:])):
+            raise ValueError("buckets must be strictly increasing.")
+        self._local: threading.local = threading.local()
+        self._shards: list[tuple[threading.Thread, list[float]]] = []
+        self._retired: list[float] = [0] * (_BUCKETS + len(self.buckets) + 1)
+        self._lock: threading.Lock = threading.Lock()
+
+    def _shard(self) -> list[float]:
+        shard: list[float] = [0] * (_BUCKETS + len(self.buckets) + 1)
+        thread: threading.Thread = threading.current_thread()
+        with self._lock:
+            self._retire()
+            self._shards.append((thread, shard))
+        self._local.shard = shard
+        return shard
+
+    def _retire(self) -> None:
+        """Folds the shards of finished threads, with the lock held.
+
+        A finished thread no longer records into its shard,
+        so it is read without a race.
+        """
+        if all(thread.is_alive() for thread, _ in self._shards):
+            return
+        retired: list[float] = self._retired
+        alive: list[tuple[threading.Thread, list[float]]] = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+                continue
+            for position, value in enumerate(shard):
+                retired[position] += value
+        self._shards = alive
+
+    def _snapshot(self) -> list[float]:
+        """Returns the counters summed over the shards, in a single pass.
+        """
+        with self._lock:
+            self._retire()
+            return [sum(column) for column in zip(
+                self._retired, *(shard for _, shard in self._shards))]
+
+    def _cumulative(
+        self,
+        totals: list[float]
+    ) -> list[tuple[_Bound, int]]:
+        result: list[tuple[_Bound, int]] = []
+        total: int = 0
+        for bound, count in zip(self.buckets + (float("inf"),),
+                                totals[_BUCKETS:]):
+            total += int(count)
+            result.append((bound, total))
+        return result
+
+    def observe(self, seconds: float, empty: bool) -> None:
+        """Records a call that returned.
+
+        Args:
+            seconds (float): duration of the call.
+            empty (bool): whether the call returned an empty Nullable.
+        """
+        try:
+            shard: list[float] = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        # the call is counted first, so that a snapshot taken meanwhile
+        # does not count more empties than calls.
+        shard[_BUCKETS + bisect_left(self.buckets, seconds)] += 1
+        if empty:
+            shard[_EMPTIES] += 1
+        shard[_SUM] += seconds
+
+    def observe_error(self, seconds: float) -> None:
+        """Records a call that raised.
+
+        Args:
+            seconds (float): duration of the call.
+        """
+        try:
+            shard: list[float] = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard[_BUCKETS + bisect_left(self.buckets, seconds)] += 1
+        shard[_ERRORS] += 1
+        shard[_SUM] += seconds
+
+    @property
+    def calls(self) -> int:
+        """
+        Returns:
+            int: number of calls.
+        """
+        return int(sum(self._snapshot()[_BUCKETS:]))
+
+    @property
+    def empties(self) -> int:
+        """
+        Returns:
+            int: number of calls that returned an empty Nullable.
+        """
+        return int(self._snapshot()[_EMPTIES])
+
+    @property
+    def errors(self) -> int:
+        """
+        Returns:
+            int: number of calls that raised.
+        """
+        return int(self._snapshot()[_ERRORS])
+
+    @property
+    def sum(self) -> float:
+        """
+        Returns:
+            float: total duration of the calls, in seconds.
+        """
+        return float(self._snapshot()[_SUM])
+
+    @property
+    def empty_rate(self) -> float:
+        """
+        Returns:
+            float: ratio of empty results to returned calls, 0.0 if none.
+        """
+        totals: list[float] = self._snapshot()
+        returned: int = int(sum(totals[_BUCKETS:]) - totals[_ERRORS])
+        return int(totals[_EMPTIES]) / returned if returned else 0.0
+
+    def cumulative_buckets(self) -> list[tuple[_Bound, int]]:
+        """Returns the histogram as cumulative counts.
+
+        Returns:
+            list[tuple[float, int]]:
+                upper bound and number of calls that took at most that long,
+                ending with ``float("inf")``.
+
+        Example:
+            >>> print(find_by_id.metrics.cumulative_buckets()[-1])
+            (inf, 3)
+        """
+        return self._cumulative(self._snapshot())
+
+    def __repr__(self) -> str:
+        totals: list[float] = self._snapshot()
+        return f"{self.__class__.__name__}(name={self.name!r}, "\
+            f"calls={int(sum(totals[_BUCKETS:]))}, "\
+            f"empties={int(totals[_EMPTIES])}, "\
+            f"errors={int(totals[_ERRORS])})"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"")\
+        .replace("\n", "\\n")
+
+
+def _format(value: _Bound) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """Collection of NullableMetrics rendered together.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        ...
+        ...
+        ... @nullable_wrap(metrics=registry)
+        ... def find_by_id(id: str) -> Optional[YourClass]:
+        ...     return in_memory_db.get(id)
+        ...
+        ...
+        ... print(registry.render_prometheus())
+    """
+
+    def __init__(self, prefix: str = "py_nullable") -> None:
+        """constructor.
+
+        Args:
+            prefix (str, optional):
+                prefix of the metric names. Defaults to "py_nullable".
+        """
+        self._prefix: str = prefix
+        self._metrics: dict[str, NullableMetrics] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def metrics(
+        self,
+        name: str,
+        buckets: Optional[Iterable[float]] = None
+    ) -> NullableMetrics:
+        """Returns the metrics of the name, creating them on first use.
+
+        Functions of the same name share their metrics,
+        so a redefined or reloaded function keeps its series.
+
+        Args:
+            name (str): name of the function.
+            buckets (Optional[Iterable[float]], optional):
+                upper bounds of the histogram of new metrics.
+
+        Returns:
+            NullableMetrics: metrics of the name.
+        """
+        with self._lock:
+            metrics: Optional[NullableMetrics] = self._metrics.get(name)
+            if metrics is None:
+                metrics = self._metrics[name] = NullableMetrics(
+                    name, DEFAULT_BUCKETS if buckets is None else buckets)
+            return metrics
+
+    def __iter__(self) -> Iterator[NullableMetrics]:
+        with self._lock:
+            return iter(list(self._metrics.values()))
+
+    def __len__(self) -> int:
+        return len(self._metrics)
+
+    def render_prometheus(self) -> str:
+        """Renders every metrics in the Prometheus text exposition format.
+
+        The values of each metrics are taken from a single snapshot,
+        so that its counters, buckets and sum agree with each other.
+
+        Returns:
+            str: exposition text, labelled by ``function``.
+        """
+        prefix: str = self._prefix
+        metrics: list[NullableMetrics] = list(self)
+        snapshots: list[list[float]] = [m._snapshot() for m in metrics]
+        histograms: list[list[tuple[_Bound, int]]] = [
+            m._cumulative(totals) for m, totals in zip(metrics, snapshots)]
+        lines: list[str] = []
+        for suffix, description, values in (
+            ("calls_total", "Calls of the function.",
+             [buckets[-1][1] for buckets in histograms]),
+            ("empty_total", "Calls that returned an empty Nullable.",
+             [int(totals[_EMPTIES]) for totals in snapshots]),
+            ("errors_total", "Calls that raised an exception.",
+             [int(totals[_ERRORS]) for totals in snapshots]),
+        ):
+            lines.append(f"# HELP {prefix}_{suffix} {description}")
+            lines.append(f"# TYPE {prefix}_{suffix} counter")
+            for m, value in zip(metrics, values):
+                lines.append(
+                    f"{prefix}_{suffix}{{function=\"{_escape(m.name)}\"}} "
+                    f"{value}")
+
+        name: str = f"{prefix}_call_duration_seconds"
+        lines.append(f"# HELP {name} Duration of the calls.")
+        lines.append(f"# TYPE {name} histogram")
+        for m, totals, buckets in zip(metrics, snapshots, histograms):
+            label: str = f"function=\"{_escape(m.name)}\""
+            for bound, count in buckets:
+                lines.append(
+                    f"{name}_bucket{{{label},le=\"{_format(bound)}\"}} {count}")
+            lines.append(
+                f"{name}_sum{{{label}}} {_format(float(totals[_SUM]))}")
+            lines.append(f"{name}_count{{{label}}} {buckets[-1][1]}")
+        return "\n".join(lines) + "\n"
+
+
+default_registry: MetricsRegistry = MetricsRegistry()
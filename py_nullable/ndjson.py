@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's NDJSON reader
+
+Function:
+    * read_ndjson
+
+"""
+from __future__ import annotations
+import json
+import os
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional,\
+    Union
+from .row import NullableRow, _RowSchema
+
+_CHUNK_SIZE: int = 1 << 20
+
+# whitespace of JSON, which the scanner does not skip.
+_WHITESPACE: str = " \t\n\r"
+
+_scan: Callable[[str, int], tuple[Any, int]]\
+    = json.JSONDecoder().scan_once  # type: ignore
+
+
+def _decode_chunk(numbered: list[tuple[int, str]]) -> list[Any]:
+    """Decodes the numbered lines with one scanner call per line
+    over the joined chunk, falling back to line by line decoding
+    to locate an error.
+
+    Each value must end exactly at the end of its line,
+    so that a line is never decoded together with the next one,
+    e.g. ``{"a": [1`` followed by ``2]}``.
+    """
+    lines: list[str] = [line.strip(_WHITESPACE) for _, line in numbered]
+    text: str = ",".join(lines)
+    objects: list[Any] = []
+    append: Callable[[Any], None] = objects.append
+    position: int = 0
+    try:
+        for line in lines:
+            obj, end = _scan(text, position)
+            position += len(line)
+            if end != position:
+                break
+            append(obj)
+            position += 1
+        else:
+            return objects
+    except (ValueError, StopIteration):
+        pass
+
+    objects = []
+    for lineno, line in numbered:
+        try:
+            objects.append(json.loads(line))
+        except ValueError as e:
+            raise ValueError(f"line {lineno}: {e}") from e
+    return objects
+
+
+def read_ndjson(
+    source: Union[str, os.PathLike[str], IO[str]],
+    schema: Union[Iterable[str], Mapping[str, Optional[Callable[[Any], Any]]]],
+    *,
+    chunk_size: int = _CHUNK_SIZE,
+    encoding: str = "utf-8"
+) -> Iterator[NullableRow]:
+    """Streams NDJSON records as rows of optional fields.
+
+    Lines are read and decoded in chunks of about chunk_size characters,
+    and only the fields declared in the schema are kept.
+    Fields become Nullable when they are accessed, see: NullableRow
+
+    Args:
+        source (Union[str, os.PathLike[str], IO[str]]):
+            path or text file of NDJSON.
+        schema (Union[Iterable[str], Mapping[str, Optional[Callable[[Any], Any]]]]):
+            field names, or converters by field name
+            (None for no conversion).
+        chunk_size (int, optional): size hint of a chunk. Defaults to 1 MiB.
+        encoding (str, optional): encoding of a path source. Defaults to "utf-8".
+
+    Raises:
+        ValueError: if a line is not a JSON object.
+
+    Returns:
+        Iterator[NullableRow]: row per non-blank line.
+
+    Example:
+        >>> schema = {"name": None, "born": datetime.date.fromisoformat}
+            for row in read_ndjson("users.ndjson", schema):
+                print(row.born.map(lambda x: x.year).orElse(0))
+            1990
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding) as file:
+            yield from read_ndjson(file, schema, chunk_size=chunk_size)
+        return
+
+    row_schema: _RowSchema = _RowSchema(schema)
+    fields: tuple[str, ...] = row_schema.fields
+    lineno: int = 1
+    while True:
+        chunk: list[str] = source.readlines(chunk_size)
+        if not chunk:
+            return
+        numbered: list[tuple[int, str]] = [
+            (i, line) for i, line in enumerate(chunk, lineno) if line.strip()]
+        lineno += len(chunk)
+        if not numbered:
+            continue
+
+        objects: list[Any] = _decode_chunk(numbered)
+        for (i, _), obj in zip(numbered, objects):
+            if not isinstance(obj, dict):
+                raise ValueError(f"line {i}: not a JSON object")
+            yield NullableRow(row_schema, tuple(map(obj.get, fields)))
@@ -5,17 +5,58 @@
 Class:
     * Nullable
 
+Function:
+    * set_production_mode
+    * is_production_mode
+
 """
 from __future__ import annotations
 import copy
-import inspect
-from typing import Any, Callable, Generic, Optional, TypeVar
+import operator
+import threading
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterator,\
+    Optional, Sequence, TypeVar
 from .exception\
     import IncompleteCallBackException, EmptyValueException, UncallableException
+from .sharing import update_in
 
 _T = TypeVar('_T')
 _U = TypeVar('_U')
 
+_production: bool = not __debug__
+
+
+def set_production_mode(enabled: bool) -> None:
+    """Switches the production mode of every Nullable.
+
+    In production mode, callbacks are not validated,
+    and exceptions raised by callbacks propagate as they are
+    instead of being wrapped in IncompleteCallBackException.
+    So UncallableException and IncompleteCallBackException are not raised,
+    and neither the callback source nor the stack is inspected.
+
+    Production mode is on by default under ``python -O``.
+
+    Args:
+        enabled (bool): true to switch on the production mode.
+
+    Example:
+        >>> set_production_mode(True)
+            Nullable[int](1).map(lambda x: x / 0)
+        ZeroDivisionError: division by zero
+    """
+    global _production
+    _production = enabled
+
+
+def is_production_mode() -> bool:
+    """
+    Returns:
+        bool: true if the production mode is on, otherwise false.
+    """
+    return _production
+
 
 class Nullable(Generic[_T]):
     """Wrap instances of generic type or None.
@@ -34,7 +75,7 @@ class Nullable(Generic[_T]):
         Args:
             val (Optional[T]): None or generic type value
         """
-        self.__val = value
+        object.__setattr__(self, "_Nullable__val", value)
 
     def __setattr__(self, __name: str, __value: Any) -> None:
         """ override __setattr__
@@ -44,24 +85,193 @@ class Nullable(Generic[_T]):
             If you want to change the value
             See: Nullable#ifPresent
         """
-        stack: inspect.FrameInfo = inspect.stack()[1]
-        caller_function: str = stack.function
-        caller_file: str = stack.filename
-
-        allow: bool = any([
-            all(["nullable.py" in caller_file, caller_function == "__init__"]),
-            all(["typing.py" in caller_file, caller_function == "__call__"])
-        ])
-
-        if allow:
-            return super().__setattr__(__name, __value)
-        else:
-            raise NotImplementedError
+        if __name == "__orig_class__":
+            # Nullable[T](...) records the alias on the new instance,
+            # and only AttributeError is ignored before Python 3.12.
+            raise AttributeError(__name)
+        raise NotImplementedError
 
     @property
     def __value(self) -> Optional[_T]:
         return copy.deepcopy(self.__val)
 
+    @staticmethod
+    def empty() -> Nullable[Any]:
+        """Returns the shared empty Nullable.
+
+        Note:
+            Nullable is readonly object,
+            so a single empty instance can be shared by every caller.
+
+        Returns:
+            Nullable[Any]: an empty Nullable.
+
+        Example:
+            >>> nullable: Nullable[str] = Nullable.empty()
+                print(nullable.isEmpty())
+            True
+        """
+        return _EMPTY
+
+    @staticmethod
+    def lazyOf(
+        supplier: Callable[[], Optional[_U]],
+        retry: bool = False
+    ) -> Nullable[_U]:
+        """Returns a Nullable whose value is supplied on first access.
+
+        The supplier runs at most once, even if many threads access
+        the Nullable at the same time, and the result is memoized.
+
+        Note:
+            Every access raises IncompleteCallBackException
+            if the supplier raised some exception.
+
+        Args:
+            supplier (Callable[[], Optional[U]]):
+                the supplying function that produces the value.
+            retry (bool, optional):
+                if true, a failed supplier runs again on the next access,
+                otherwise the failure is memoized. Defaults to False.
+
+        Raises:
+            UncallableException:
+                if the given supplier is not callable.
+
+        Returns:
+            Nullable[U]: a Nullable deferring to the supplier.
+
+        Example:
+            >>> nullable: Nullable[str] = Nullable.lazyOf(lambda: "expensive")
+                print(nullable.get())
+            expensive
+        """
+        if not callable(supplier):
+            raise UncallableException(callback=supplier)
+        return _LazyNullable(supplier, retry)
+
+    @staticmethod
+    def viewOf(value: Optional[_U]) -> Nullable[_U]:
+        """Returns a Nullable that reads its value through read-only views
+        instead of deep copies.
+
+        get, orElse, callbacks and iteration receive a view:
+        mappings as a Mapping, sequences as a Sequence,
+        sets as a Set, and bytearray as a read-only memoryview.
+        Nested items are viewed when they are accessed,
+        so a read costs O(1) instead of O(size) of the value.
+        Other objects are deep-copied as usual.
+
+        Note:
+            The value is referenced, not copied.
+            Changes made through other references are visible in the views,
+            and a viewed bytearray cannot be resized while a view exists.
+
+        Args:
+            value (Optional[U]): None or the value to view.
+
+        Returns:
+            Nullable[U]: a Nullable of the value.
+
+        Example:
+            >>> nullable = Nullable.viewOf({"tags": ["a", "b"]})
+                print(nullable.get()["tags"][0])
+            a
+        """
+        from .view import _ViewNullable
+        return _ViewNullable(value)
+
+    @staticmethod
+    def firstPresentConcurrent(
+        *suppliers: Callable[[], Optional[_U]],
+        executor: Optional[Executor] = None,
+        hedge_after_ms: Optional[float] = None
+    ) -> Nullable[_U]:
+        """Runs suppliers concurrently and returns the first present result.
+
+        Suppliers start all at once,
+        or one after another if hedge_after_ms is given:
+        the next supplier starts when the previous ones have not produced
+        a present value within the delay, or as soon as they are
+        empty or failed.
+        Remaining suppliers are cancelled if not started yet,
+        otherwise their results are ignored.
+
+        Note:
+            A supplier may return a Nullable, which is unwrapped.
+
+        Args:
+            *suppliers (Callable[[], Optional[U]]):
+                the supplying functions, in order of preference.
+            executor (Optional[Executor], optional):
+                executor to run the suppliers on.
+                Defaults to a thread pool for this call.
+            hedge_after_ms (Optional[float], optional):
+                milliseconds to wait before starting the next supplier.
+                Defaults to None, i.e. all suppliers start at once.
+
+        Raises:
+            UncallableException:
+                if any of the given suppliers is not callable.
+            IncompleteCallBackException:
+                if every supplier raises some exception.
+                The exceptions are available as its ``causes``.
+
+        Returns:
+            Nullable[U]: the first present result, or an empty Nullable.
+
+        Example:
+            >>> nullable: Nullable[str] = Nullable.firstPresentConcurrent(
+            ...     lambda: cache.get("A001"),
+            ...     lambda: replica_a.find("A001"),
+            ...     lambda: replica_b.find("A001"),
+            ...     hedge_after_ms=50)
+            ... print(nullable.get())
+                foo
+        """
+        from .hedge import first_present_concurrent
+        return first_present_concurrent(suppliers, executor, hedge_after_ms)
+
+    @staticmethod
+    async def firstPresentAsync(
+        *suppliers: Callable[[], Awaitable[Optional[_U]]],
+        hedge_after_ms: Optional[float] = None
+    ) -> Nullable[_U]:
+        """Awaits coroutine suppliers concurrently
+        and returns the first present result.
+
+        Suppliers start as tasks in the same manner as
+        Nullable#firstPresentConcurrent, and the remaining tasks are
+        cancelled once a present result is found.
+
+        Args:
+            *suppliers (Callable[[], Awaitable[Optional[U]]]):
+                the coroutine functions, in order of preference.
+            hedge_after_ms (Optional[float], optional):
+                milliseconds to wait before starting the next supplier.
+                Defaults to None, i.e. all suppliers start at once.
+
+        Raises:
+            UncallableException:
+                if any of the given suppliers is not callable.
+            IncompleteCallBackException:
+                if every supplier raises some exception.
+                The exceptions are available as its ``causes``.
+
+        Returns:
+            Nullable[U]: the first present result, or an empty Nullable.
+
+        Example:
+            >>> nullable: Nullable[str] = await Nullable.firstPresentAsync(
+            ...     lambda: replica_a.find("A001"),
+            ...     lambda: replica_b.find("A001"),
+            ...     hedge_after_ms=50)
+            ... print(nullable.get())
+                foo
+        """
+        from .hedge import first_present_async
+        return await first_present_async(suppliers, hedge_after_ms)
+
     def isPresent(self) -> bool:
         """If a value is not None, returns true, otherwise false.
 
@@ -74,7 +284,7 @@ class Nullable(Generic[_T]):
                     print("has valid value")
             has valid value
         """
-        return self.__value is not None
+        return self.__val is not None
 
     def isEmpty(self) -> bool:
         """If a value is None, returns true, otherwise false.
@@ -88,7 +298,7 @@ class Nullable(Generic[_T]):
                     print("empty obj")
             empty obj
         """
-        return self.__value is None
+        return self.__val is None
 
     def get(self) -> _T:
         """If a value is not None, returns the value,
@@ -165,11 +375,13 @@ class Nullable(Generic[_T]):
 
         value: Optional[_T] = self.__value
         if value is None:
-            if not isinstance(supplier, Callable):
+            if not _production and not callable(supplier):
                 raise UncallableException(callback=supplier)
             try:
                 result = supplier(*args, **kwargs)
             except Exception as e:
+                if _production:
+                    raise
                 raise IncompleteCallBackException(cause=e, callback=supplier)
         else:
             result = value
@@ -210,12 +422,14 @@ class Nullable(Generic[_T]):
         exception: Optional[Exception] = None
         value: Optional[_T] = self.__value
         if value is None:
-            if not isinstance(supplier, Callable):
+            if not _production and not callable(supplier):
                 raise UncallableException(callback=supplier)
 
             try:
                 exception = supplier(*args, **kwargs)
             except Exception as e:
+                if _production:
+                    raise
                 raise IncompleteCallBackException(cause=e, callback=supplier)
 
             raise exception
@@ -248,11 +462,13 @@ class Nullable(Generic[_T]):
 
         value: Optional[_T] = self.__val
         if value is not None:
-            if not isinstance(action, Callable):
+            if not _production and not callable(action):
                 raise UncallableException(callback=action)
             try:
                 action(value)
             except Exception as e:
+                if _production:
+                    raise
                 raise IncompleteCallBackException(cause=e, callback=action)
 
     def filter(self, extractor: Callable[[_T], bool]) -> Nullable[_T]:
@@ -287,16 +503,18 @@ class Nullable(Generic[_T]):
         """
         result: Nullable[_T]
 
-        if not isinstance(extractor, Callable):
+        if not _production and not callable(extractor):
             raise UncallableException(callback=extractor)
 
         value: Optional[_T] = self.__value
         if value is None:
-            result = Nullable[_T](None)
+            result = _EMPTY
         else:
             try:
-                result = self if extractor(value) else Nullable[_T](None)
+                result = self if extractor(value) else _EMPTY
             except Exception as e:
+                if _production:
+                    raise
                 raise IncompleteCallBackException(cause=e, callback=extractor)
 
         return result
@@ -330,16 +548,18 @@ class Nullable(Generic[_T]):
         """
         result: Nullable[_U]
 
-        if not isinstance(mapper, Callable):
+        if not _production and not callable(mapper):
             raise UncallableException(callback=mapper)
 
         value: Optional[_T] = self.__value
         if value is None:
-            result = Nullable(None)
+            result = _EMPTY
         else:
             try:
                 result = Nullable(mapper(value))
             except Exception as e:
+                if _production:
+                    raise
                 raise IncompleteCallBackException(cause=e, callback=mapper)
 
         return result
@@ -376,20 +596,158 @@ class Nullable(Generic[_T]):
         """
         result: Nullable[_U]
 
-        if not isinstance(mapper, Callable):
+        if not _production and not callable(mapper):
             raise UncallableException(callback=mapper)
 
         value: Optional[_T] = self.__value
         if value is None:
-            result = Nullable(None)
+            result = _EMPTY
         else:
             try:
                 result = mapper(value)
             except Exception as e:
+                if _production:
+                    raise
                 raise IncompleteCallBackException(cause=e, callback=mapper)
 
         return result
 
+    def withPath(self, path: Sequence[Hashable], value: Any) -> Nullable[_T]:
+        """If a value is not None,
+        returns a Nullable describing a copy of the value
+        whose item at the given path is replaced with the given value,
+        otherwise returns an empty Nullable.
+
+        Unlike Nullable#map, the value is not deep-copied:
+        only the containers on the path are copied, shallowly,
+        and every other item is shared with this Nullable,
+        so the cost grows with the depth of the path, not the size of
+        the value.
+        Missing mapping keys on the path are created as dict.
+
+        Note:
+            Supported containers are mutable mappings and sequences,
+            tuples (named tuples included) and dataclass instances.
+            Mutable containers other than dict and list must define
+            ``__copy__``, see: update_in
+            The given value is referenced, not copied.
+
+        Args:
+            path (Sequence[Hashable]):
+                keys, indices or dataclass field names to the item.
+            value (Any): the new item.
+
+        Raises:
+            TypeError:
+                if the path is a str or bytes,
+                or a container on the path is not supported.
+            IndexError:
+                if an index on the path is out of range.
+
+        Returns:
+            Nullable[T]: a Nullable describing the updated copy of the value.
+
+        Example:
+            >>> nullable = Nullable({"user": {"name": "foo"}, "tags": ["a"]})
+                result = nullable.withPath(("user", "name"), "bar")
+                print(result.get())
+            {'user': {'name': 'bar'}, 'tags': ['a']}
+        """
+        root: Optional[_T] = self.__val
+        if root is None:
+            return _EMPTY
+        return Nullable(update_in(root, path, lambda _: value))
+
+    def update(
+        self,
+        key: Hashable,
+        updater: Callable[[Any], Any]
+    ) -> Nullable[_T]:
+        """If a value is not None,
+        returns a Nullable describing a copy of the value
+        whose item at the given key is the result of the given updater,
+        otherwise returns an empty Nullable.
+
+        The value is copied in the same manner as Nullable#withPath.
+        The updater receives a deep copy of the current item only,
+        or None if the key is missing.
+
+        Args:
+            key (Hashable): key, index or dataclass field name of the item.
+            updater (Callable[[Any], Any]):
+                function that returns the new item from the current one.
+
+        Raises:
+            UncallableException:
+                if the given updater is not callable.
+            IncompleteCallBackException:
+                if the given updater raises some exception.
+            TypeError:
+                if the value is not a supported container.
+            IndexError:
+                if the index is out of range.
+
+        Returns:
+            Nullable[T]: a Nullable describing the updated copy of the value.
+
+        Example:
+            >>> nullable = Nullable({"count": 1, "tags": ["a"]})
+                result = nullable.update("count", lambda x: x + 1)
+                print(result.get())
+            {'count': 2, 'tags': ['a']}
+        """
+        if not _production and not callable(updater):
+            raise UncallableException(callback=updater)
+
+        root: Optional[_T] = self.__val
+        if root is None:
+            return _EMPTY
+
+        def _(item: Any) -> Any:
+            try:
+                return updater(copy.deepcopy(item))
+            except Exception as e:
+                if _production:
+                    raise
+                raise IncompleteCallBackException(cause=e, callback=updater)
+
+        return Nullable(update_in(root, (key,), _))
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterates the value as zero or one element.
+
+        Returns:
+            Iterator[T]: iterator of the value, if not None, otherwise empty.
+
+        Example:
+            >>> for val in Nullable[str]("some string"):
+                    print(val)
+            some string
+        """
+        if self.__val is None:
+            return iter(())
+        return iter((self.__value,))  # type: ignore
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: 1 if a value is not None, otherwise 0.
+        """
+        return 0 if self.__val is None else 1
+
+    def __bool__(self) -> bool:
+        """Nullable is truthy if a value is not None, even if the value is falsy.
+
+        Returns:
+            bool: true if a value is not None, otherwise false.
+
+        Example:
+            >>> if Nullable[int](0):
+                    print("has valid value")
+            has valid value
+        """
+        return self.__val is not None
+
     def equals(self, compare_target: Nullable[Any]) -> bool:
         """Compare whether two Nullable object are equal.
 
@@ -427,9 +785,77 @@ class Nullable(Generic[_T]):
                 print(nullable.equals(compare))
             False
         """
-        value = self.__value
-        compare_value = compare_target.__value
+        value = self.__val
+        compare_value = compare_target.__val
         return (
             isinstance(compare_value, value.__class__)
             and value == compare_value
         )
+
+
+class _LazyNullable(Nullable[_T]):
+    """Nullable whose value is supplied on first access.
+
+    Attributes:
+        _outcome (Optional[tuple[Optional[T], Optional[Exception]]]):
+            None until the supplier has run, then its result or exception
+    """
+
+    __slots__ = ["_supplier", "_retry", "_lock", "_outcome"]
+
+    _supplier: Callable[[], Optional[_T]]
+    _retry: bool
+    _lock: threading.Lock
+    _outcome: Optional[tuple[Optional[_T], Optional[Exception]]]
+
+    def __init__(
+        self,
+        supplier: Callable[[], Optional[_T]],
+        retry: bool
+    ) -> None:
+        """constructor.
+
+        Args:
+            supplier (Callable[[], Optional[T]]):
+                the supplying function that produces the value.
+            retry (bool): if true, failures are not memoized.
+        """
+        object.__setattr__(self, "_supplier", supplier)
+        object.__setattr__(self, "_retry", retry)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_outcome", None)
+
+    @property
+    def _Nullable__val(self) -> Optional[_T]:
+        outcome: Optional[tuple[Optional[_T], Optional[Exception]]]\
+            = self._outcome
+        if outcome is None:
+            with self._lock:
+                outcome = self._outcome
+                if outcome is None:
+                    outcome = self._supply()
+
+        value, error = outcome
+        if error is not None:
+            raise IncompleteCallBackException(
+                cause=error, callback=self._supplier)
+        return value
+
+    def _supply(self) -> tuple[Optional[_T], Optional[Exception]]:
+        outcome: tuple[Optional[_T], Optional[Exception]]
+        try:
+            outcome = (self._supplier(), None)
+        except Exception as e:
+            outcome = (None, e)
+            if self._retry:
+                return outcome
+        # the outcome is published as a single reference,
+        # so threads outside the lock see either None or the whole outcome.
+        object.__setattr__(self, "_outcome", outcome)
+        return outcome
+
+
+_EMPTY: Nullable[Any] = Nullable(None)
+
+_raw_value: Callable[[Nullable[Any]], Any]\
+    = operator.attrgetter("_Nullable__val")
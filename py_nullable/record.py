@@ -0,0 +1,173 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's record class factory
+
+Function:
+    * NullableRecord
+
+"""
+from __future__ import annotations
+import keyword
+import sys
+from itertools import starmap
+from typing import Any, Iterable, Optional, Type, TypeVar, Union
+from .nullable import Nullable
+
+_R = TypeVar("_R", bound="_Record")
+
+
+class _Record:
+    """Base class of the classes generated by NullableRecord.
+
+    Attributes:
+        _presence (int): bit i is set if the i-th field is not None
+    """
+
+    __slots__ = ["_presence"]
+
+    _fields: tuple[str, ...] = ()
+    _index: dict[str, int] = {}
+
+    _presence: int
+
+    @classmethod
+    def from_rows(cls: Type[_R], rows: Iterable[Iterable[Any]]) -> list[_R]:
+        """Builds records from tuples or sqlite3 rows in bulk.
+
+        Args:
+            rows (Iterable[Iterable[Any]]): values in the order of the fields.
+
+        Returns:
+            list[R]: record per row.
+        """
+        return list(starmap(cls, rows))
+
+    def is_present(self, name: str) -> bool:
+        """If the field is not None, returns true, otherwise false.
+
+        Args:
+            name (str): field name.
+
+        Raises:
+            KeyError: if the field name is unknown.
+
+        Returns:
+            bool: true if the field is not None, otherwise false.
+        """
+        return bool(self._presence >> self._index[name] & 1)
+
+    def to_tuple(self) -> tuple[Optional[Any], ...]:
+        """
+        Returns:
+            tuple[Optional[Any], ...]: raw values in the order of the fields.
+        """
+        return tuple(getattr(self, f"_{name}") for name in self._fields)
+
+    def to_dict(self) -> dict[str, Optional[Any]]:
+        """
+        Returns:
+            dict[str, Optional[Any]]: raw values by field name.
+        """
+        return dict(zip(self._fields, self.to_tuple()))
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_tuple() == other.to_tuple()  # type: ignore
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields: str = ", ".join(
+            f"{name}={value!r}"
+            for name, value in zip(self._fields, self.to_tuple()))
+        return f"{self.__class__.__name__}({fields})"
+
+
+def NullableRecord(
+    typename: str,
+    field_names: Union[str, Iterable[str]],
+    *,
+    module: Optional[str] = None
+) -> Type[_Record]:
+    """Generates a record class of optional fields.
+
+    Instances keep the raw values in slots
+    and a single integer bitmap of the fields that are not None.
+    A field is returned as a Nullable when it is accessed,
+    so no Nullable is kept per field.
+
+    Args:
+        typename (str): name of the generated class.
+        field_names (Union[str, Iterable[str]]):
+            field names, or a string of names separated by commas or spaces.
+        module (Optional[str], optional):
+            ``__module__`` of the generated class.
+            Defaults to the module of the caller.
+
+    Raises:
+        ValueError: if a field name is not an identifier, is a keyword,
+            starts with an underscore, is the name of a record method
+            such as to_dict, or is duplicated.
+
+    Returns:
+        Type[_Record]: the generated class.
+
+    Example:
+        >>> User = NullableRecord("User", "id, name, email")
+            user = User(1, "foo", None)
+            print(user.name.get(), user.email.isEmpty())
+        foo True
+    """
+    if isinstance(field_names, str):
+        field_names = field_names.replace(",", " ").split()
+    fields: tuple[str, ...] = tuple(field_names)
+
+    for name in (typename,) + fields:
+        if not name.isidentifier() or keyword.iskeyword(name):
+            raise ValueError(f"`{name}` is not a valid name.")
+    for name in fields:
+        if name.startswith("_"):
+            raise ValueError(f"field name `{name}` starts with an underscore.")
+        if name in vars(_Record):
+            raise ValueError(f"field name `{name}` is a method of records.")
+    if len(set(fields)) != len(fields):
+        raise ValueError("field names are duplicated.")
+
+    parameters: str = ", ".join(f"{name}=None" for name in fields)
+    assignments: str = "".join(
+        f"    self._{name} = {name}\n" for name in fields)
+    presence: str = " | ".join(
+        f"(({name} is not None) << {i})" for i, name in enumerate(fields))\
+        or "0"
+    getters: str = "".join(
+        f"def {name}(self):\n"
+        f"    if self._presence & {1 << i}:\n"
+        f"        return _Nullable(self._{name})\n"
+        f"    return _empty\n"
+        for i, name in enumerate(fields))
+    source: str = (
+        f"def __init__(self, {parameters}):\n"
+        f"{assignments}"
+        f"    self._presence = {presence}\n"
+        f"{getters}"
+    )
+
+    namespace: dict[str, Any] = {
+        "_Nullable": Nullable, "_empty": Nullable.empty()}
+    exec(source, namespace)
+
+    attributes: dict[str, Any] = {
+        "__slots__": tuple(f"_{name}" for name in fields),
+        "__init__": namespace["__init__"],
+        "_fields": fields,
+        "_index": {name: i for i, name in enumerate(fields)},
+    }
+    for name in fields:
+        attributes[name] = property(namespace[name])
+
+    if module is None:
+        module = sys._getframe(1).f_globals.get("__name__", "__main__")
+    attributes["__module__"] = module
+
+    return type(typename, (_Record,), attributes)
@@ -0,0 +1,136 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's lazily wrapped row
+
+Class:
+    * NullableRow
+
+"""
+from __future__ import annotations
+import copy
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional,\
+    Sequence, Union
+from .nullable import Nullable
+
+
+class _RowSchema:
+    """Field names and converters shared by every row of a source.
+    """
+
+    __slots__ = ["fields", "index", "converters"]
+
+    def __init__(
+        self,
+        schema: Union[
+            Iterable[str], Mapping[str, Optional[Callable[[Any], Any]]]
+        ]
+    ) -> None:
+        if isinstance(schema, Mapping):
+            self.fields: tuple[str, ...] = tuple(schema)
+            self.converters: tuple[Optional[Callable[[Any], Any]], ...]\
+                = tuple(schema.values())
+        else:
+            self.fields = tuple(schema)
+            self.converters = (None,) * len(self.fields)
+        # the first of duplicated names wins, as in sqlite3.Row.
+        self.index: dict[str, int] = {}
+        for i, field in enumerate(self.fields):
+            self.index.setdefault(field, i)
+
+
+class NullableRow:
+    """Row of raw values that are wrapped in Nullable only when accessed.
+
+    Fields can be accessed by name, position or attribute.
+    A field with a converter is converted on each access,
+    see: Nullable#map
+
+    Example:
+        >>> for row in read_ndjson("users.ndjson", ["name", "age"]):
+        ...     print(row.name.orElse("anonymous"), row["age"].isPresent())
+            foo True
+    """
+
+    __slots__ = ["_schema", "_values"]
+
+    def __init__(self, schema: _RowSchema, values: Sequence[Any]) -> None:
+        """constructor.
+
+        Args:
+            schema (_RowSchema): field names and converters.
+            values (Sequence[Any]): raw values in the order of the fields.
+        """
+        self._schema: _RowSchema = schema
+        self._values: Sequence[Any] = values
+
+    def __getitem__(self, key: Union[str, int]) -> Nullable[Any]:
+        """Returns the field as a Nullable.
+
+        Args:
+            key (Union[str, int]): field name or position.
+
+        Raises:
+            KeyError: if the field name is not in the schema.
+            IndexError: if the position is out of range.
+            IncompleteCallBackException:
+                if the converter of the field raises some exception.
+
+        Returns:
+            Nullable[Any]: the value, or an empty Nullable if it is None.
+        """
+        index: int = self._schema.index[key] if isinstance(key, str) else key
+        value: Any = self._values[index]
+        if value is None:
+            return Nullable.empty()
+        converter: Optional[Callable[[Any], Any]]\
+            = self._schema.converters[index]
+        if converter is None:
+            return Nullable(value)
+        return Nullable(value).map(converter)
+
+    def __getattr__(self, name: str) -> Nullable[Any]:
+        # private and special names are never fields; looking them up
+        # in the schema would recurse while _schema itself is unset,
+        # e.g. on an instance created by copy or pickle.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            index: int = self._schema.index[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return self[index]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (self.__class__, (self._schema, self._values))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> NullableRow:
+        # the schema is shared by every row of a source, so is not copied.
+        return self.__class__(
+            self._schema, copy.deepcopy(self._values, memo))
+
+    def keys(self) -> tuple[str, ...]:
+        """
+        Returns:
+            tuple[str, ...]: field names in order.
+        """
+        return self._schema.fields
+
+    def to_dict(self) -> dict[str, Optional[Any]]:
+        """Returns the raw values by field name, without conversion.
+
+        Returns:
+            dict[str, Optional[Any]]: raw value or None per field.
+        """
+        return dict(zip(self._schema.fields, self._values))
+
+    def __len__(self) -> int:
+        return len(self._schema.fields)
+
+    def __iter__(self) -> Iterator[Nullable[Any]]:
+        return map(self.__getitem__, range(len(self._schema.fields)))
+
+    def __repr__(self) -> str:
+        fields: str = ", ".join(
+            f"{field}={value!r}"
+            for field, value in zip(self._schema.fields, self._values))
+        return f"{self.__class__.__name__}({fields})"
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's structural sharing updates
+
+Function:
+    * update_in
+
+"""
+from __future__ import annotations
+import copy
+import dataclasses
+from collections.abc import Mapping, MutableMapping, MutableSequence,\
+    Sequence
+from typing import Any, Callable, Hashable
+
+# sequences that are not containers of the path.
+_SCALARS: tuple[type, ...] = (str, bytes, bytearray)
+
+
+def _child(container: Any, key: Hashable) -> Any:
+    """Returns the item of the container, or None if the key is missing.
+    """
+    if container is None:
+        return None
+    if isinstance(container, Mapping):
+        # get does not call __missing__, so a defaultdict is not changed.
+        return container.get(key)
+    if isinstance(container, Sequence)\
+            and not isinstance(container, _SCALARS):
+        return container[key]  # type: ignore
+    if dataclasses.is_dataclass(container) and isinstance(key, str):
+        return getattr(container, key)
+    raise TypeError(
+        f"cannot look up {key!r} in {type(container).__name__} object.")
+
+
+def _replaced(container: Any, key: Hashable, value: Any) -> Any:
+    """Returns a shallow copy of the container whose key is set to the value.
+    """
+    if container is None:
+        return {key: value}
+    if isinstance(container, (MutableMapping, MutableSequence))\
+            and not isinstance(container, _SCALARS):
+        # copy.copy of other containers may share their inner storage,
+        # so that setting the item would change the original.
+        if not isinstance(container, (dict, list))\
+                and not hasattr(type(container), "__copy__"):
+            raise TypeError(
+                f"cannot copy {type(container).__name__} object, "
+                "define __copy__.")
+        replaced: Any = copy.copy(container)
+        replaced[key] = value
+        return replaced
+    if isinstance(container, tuple):
+        fields: Any = getattr(container, "_fields", None)
+        if fields is not None:
+            return container._replace(  # type: ignore
+                **{fields[key]: value})  # type: ignore
+        items: list[Any] = list(container)
+        items[key] = value  # type: ignore
+        return tuple(items)
+    if dataclasses.is_dataclass(container) and isinstance(key, str):
+        return dataclasses.replace(container, **{key: value})  # type: ignore
+    raise TypeError(
+        f"cannot set {key!r} in {type(container).__name__} object.")
+
+
+def update_in(
+    root: Any,
+    path: Sequence[Hashable],
+    updater: Callable[[Any], Any]
+) -> Any:
+    """Returns a copy of root whose item at the path is updated.
+
+    Only the containers on the path are copied, shallowly,
+    so the result shares every other item with root.
+    Missing mapping keys on the path are created as dict.
+
+    Supported containers are mutable mappings and sequences,
+    tuples (named tuples included) and dataclass instances.
+    Mutable containers other than dict and list (and their subclasses)
+    must define ``__copy__``, as UserDict, deque and array do.
+
+    Args:
+        root (Any): the nested structure.
+        path (Sequence[Hashable]):
+            keys, indices or dataclass field names from root to the item.
+        updater (Callable[[Any], Any]):
+            function that receives the current item, or None if missing,
+            and returns the new one.
+
+    Raises:
+        TypeError: if the path is a str or bytes,
+            or a container on the path is not supported.
+        IndexError: if an index on the path is out of range.
+
+    Returns:
+        Any: the updated structure.
+
+    Example:
+        >>> document = {"user": {"name": "foo"}, "tags": ["a"]}
+            updated = update_in(document, ("user", "name"), str.upper)
+            print(updated, updated["tags"] is document["tags"])
+        {'user': {'name': 'FOO'}, 'tags': ['a']} True
+    """
+    if isinstance(path, _SCALARS):
+        raise TypeError(
+            f"path must be a sequence of keys, not {type(path).__name__}.")
+    if not path:
+        return updater(root)
+    key: Hashable = path[0]
+    return _replaced(
+        root, key, update_in(_child(root, key), path[1:], updater))
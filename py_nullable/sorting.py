@@ -0,0 +1,174 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's ordering helpers for Nullable sequences
+
+Function:
+    * nulls_first
+    * nulls_last
+    * top_k
+    * merge
+
+"""
+from __future__ import annotations
+import heapq
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+from .nullable import Nullable, _raw_value
+
+_T = TypeVar("_T")
+
+_EMPTY_FIRST: tuple[int] = (0,)
+_EMPTY_LAST: tuple[int] = (1,)
+
+
+def nulls_first(
+    key: Optional[Callable[[_T], Any]] = None
+) -> Callable[[Nullable[_T]], tuple[Any, ...]]:
+    """Returns a sort key that orders empty Nullable objects first.
+
+    The value is read without copying, and key is called once
+    per present Nullable.
+
+    Args:
+        key (Optional[Callable[[T], Any]], optional):
+            key function applied to present values. Defaults to the value.
+
+    Returns:
+        Callable[[Nullable[T]], tuple[Any, ...]]: key for sorted, min, max...
+
+    Example:
+        >>> nullables = [Nullable[int](2), Nullable[int](None), Nullable[int](1)]
+            print([n.orElse(None) for n in sorted(nullables, key=nulls_first())])
+        [None, 1, 2]
+    """
+    if key is None:
+        def _(nullable: Nullable[_T]) -> tuple[Any, ...]:
+            value: Optional[_T] = _raw_value(nullable)
+            return _EMPTY_FIRST if value is None else (1, value)
+    else:
+        def _(nullable: Nullable[_T]) -> tuple[Any, ...]:
+            value: Optional[_T] = _raw_value(nullable)
+            return _EMPTY_FIRST if value is None else (1, key(value))
+    return _
+
+
+def nulls_last(
+    key: Optional[Callable[[_T], Any]] = None
+) -> Callable[[Nullable[_T]], tuple[Any, ...]]:
+    """Returns a sort key that orders empty Nullable objects last.
+
+    The value is read without copying, and key is called once
+    per present Nullable.
+
+    Args:
+        key (Optional[Callable[[T], Any]], optional):
+            key function applied to present values. Defaults to the value.
+
+    Returns:
+        Callable[[Nullable[T]], tuple[Any, ...]]: key for sorted, min, max...
+
+    Example:
+        >>> nullables = [Nullable[int](2), Nullable[int](None), Nullable[int](1)]
+            print([n.orElse(None) for n in sorted(nullables, key=nulls_last())])
+        [1, 2, None]
+    """
+    if key is None:
+        def _(nullable: Nullable[_T]) -> tuple[Any, ...]:
+            value: Optional[_T] = _raw_value(nullable)
+            return _EMPTY_LAST if value is None else (0, value)
+    else:
+        def _(nullable: Nullable[_T]) -> tuple[Any, ...]:
+            value: Optional[_T] = _raw_value(nullable)
+            return _EMPTY_LAST if value is None else (0, key(value))
+    return _
+
+
+def _sort_key(
+    key: Optional[Callable[[_T], Any]],
+    reverse: bool,
+    nulls: str
+) -> Callable[[Nullable[_T]], tuple[Any, ...]]:
+    """Returns the key that places empty Nullable objects
+    at the requested end for the given direction.
+    """
+    if nulls not in ("first", "last"):
+        raise ValueError(f"nulls must be 'first' or 'last', not `{nulls}`.")
+    if (nulls == "last") is not reverse:
+        return nulls_last(key)
+    return nulls_first(key)
+
+
+def top_k(
+    nullables: Iterable[Nullable[_T]],
+    k: int,
+    key: Optional[Callable[[_T], Any]] = None,
+    *,
+    reverse: bool = False,
+    nulls: str = "last"
+) -> list[Nullable[_T]]:
+    """Returns the first k Nullable objects of the sorted order,
+    in a single pass with a heap of k elements.
+
+    Equivalent to ``sorted(nullables, ...)[:k]``.
+
+    Args:
+        nullables (Iterable[Nullable[T]]): Nullable objects to rank.
+        k (int): number of Nullable objects to return.
+        key (Optional[Callable[[T], Any]], optional):
+            key function applied to present values. Defaults to the value.
+        reverse (bool, optional):
+            if true, present values are ranked in descending order.
+        nulls (str, optional):
+            "first" or "last", position of empty Nullable objects.
+            Defaults to "last".
+
+    Raises:
+        ValueError: if nulls is neither "first" nor "last".
+
+    Returns:
+        list[Nullable[T]]: at most k Nullable objects, in sorted order.
+
+    Example:
+        >>> scores = [Nullable[int](3), Nullable[int](None), Nullable[int](5)]
+            print([n.orElse(None) for n in top_k(scores, 2, reverse=True)])
+        [5, 3]
+    """
+    sort_key: Callable[[Nullable[_T]], tuple[Any, ...]]\
+        = _sort_key(key, reverse, nulls)
+    if reverse:
+        return heapq.nlargest(k, nullables, key=sort_key)
+    return heapq.nsmallest(k, nullables, key=sort_key)
+
+
+def merge(
+    *iterables: Iterable[Nullable[_T]],
+    key: Optional[Callable[[_T], Any]] = None,
+    reverse: bool = False,
+    nulls: str = "last"
+) -> Iterator[Nullable[_T]]:
+    """Lazily merges iterables of Nullable that are already sorted
+    in the same order.
+
+    Args:
+        *iterables (Iterable[Nullable[T]]): sorted Nullable iterables.
+        key (Optional[Callable[[T], Any]], optional):
+            key function applied to present values. Defaults to the value.
+        reverse (bool, optional):
+            if true, the iterables are sorted in descending order.
+        nulls (str, optional):
+            "first" or "last", position of empty Nullable objects.
+            Defaults to "last".
+
+    Raises:
+        ValueError: if nulls is neither "first" nor "last".
+
+    Returns:
+        Iterator[Nullable[T]]: Nullable objects of every iterable, in order.
+
+    Example:
+        >>> left = [Nullable[int](1), Nullable[int](4), Nullable[int](None)]
+            right = [Nullable[int](2), Nullable[int](None)]
+            print([n.orElse(None) for n in merge(left, right)])
+        [1, 2, 4, None, None]
+    """
+    return heapq.merge(
+        *iterables, key=_sort_key(key, reverse, nulls), reverse=reverse)
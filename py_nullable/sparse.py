@@ -0,0 +1,390 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's sparse array
+
+Class:
+    * NullableSparseArray
+
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Generic, Iterable, Iterator, Mapping,\
+    Optional, TypeVar, Union
+from .nullable import Nullable, _raw_value, is_production_mode
+from .exception import UncallableException, IncompleteCallBackException
+
+_V = TypeVar("_V")
+_U = TypeVar("_U")
+
+
+class NullableSparseArray(Generic[_V]):
+    """Read-only array of Nullable that stores present positions only.
+
+    Present positions are kept in a sorted array of 64-bit integers,
+    alongside a list of their values,
+    so memory grows with the number of present values, not the length.
+    Other positions are empty.
+
+    Note:
+        Values are passed to callbacks by reference, not copied.
+
+    Attributes:
+        _length (int): number of positions
+        _indices (array[int]): sorted present positions
+        _values (list[V]): value per present position
+
+    Example:
+        >>> clicks = NullableSparseArray(1_000_000, {42: 3, 999_999: 1})
+            print(clicks[42].get(), clicks[43].isEmpty(), len(clicks))
+        3 True 1000000
+    """
+
+    __slots__ = ["_length", "_indices", "_values"]
+
+    def __init__(
+        self,
+        length: int,
+        entries: Union[
+            Mapping[int, Optional[_V]], Iterable[tuple[int, Optional[_V]]]
+        ] = ()
+    ) -> None:
+        """constructor.
+
+        Args:
+            length (int): number of positions.
+            entries (Union[Mapping[int, Optional[V]],
+                           Iterable[tuple[int, Optional[V]]]], optional):
+                values by position. None values are skipped,
+                and the last value of a repeated position wins.
+
+        Raises:
+            ValueError: if the length is negative.
+            IndexError: if a position is out of range.
+        """
+        if length < 0:
+            raise ValueError("length must not be negative.")
+        pairs: dict[int, _V] = {}
+        for index, value in (
+            entries.items() if isinstance(entries, Mapping) else entries
+        ):
+            if not 0 <= index < length:
+                raise IndexError("sparse array index out of range")
+            if value is None:
+                pairs.pop(index, None)
+            else:
+                pairs[index] = value
+        indices: list[int] = sorted(pairs)
+        self._length: int = length
+        self._indices: array[int] = array("q", indices)
+        self._values: list[_V] = [pairs[index] for index in indices]
+
+    @classmethod
+    def _of(
+        cls,
+        length: int,
+        indices: array[int],
+        values: list[_U]
+    ) -> NullableSparseArray[_U]:
+        """Returns an array of already sorted positions, without checks.
+        """
+        instance: NullableSparseArray[_U] = cls.__new__(cls)  # type: ignore
+        instance._length = length
+        instance._indices = indices
+        instance._values = values
+        return instance
+
+    @classmethod
+    def from_dense(
+        cls,
+        values: Iterable[Union[Nullable[_V], Optional[_V]]]
+    ) -> NullableSparseArray[_V]:
+        """Returns a sparse array of Nullable or None-able values.
+
+        Args:
+            values (Iterable[Union[Nullable[V], Optional[V]]]):
+                value per position.
+
+        Returns:
+            NullableSparseArray[V]: array of the present values.
+
+        Example:
+            >>> sparse = NullableSparseArray.from_dense([None, 1, None])
+                print(list(sparse.items()))
+            [(1, 1)]
+        """
+        indices: array[int] = array("q")
+        present: list[_V] = []
+        length: int = 0
+        for length, item in enumerate(values, 1):
+            value: Optional[_V] = _raw_value(item)\
+                if isinstance(item, Nullable) else item
+            if value is not None:
+                indices.append(length - 1)
+                present.append(value)
+        return cls._of(length, indices, present)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def count_present(self) -> int:
+        """
+        Returns:
+            int: number of present positions.
+        """
+        return len(self._values)
+
+    def __getitem__(
+        self,
+        key: Union[int, slice]
+    ) -> Union[Nullable[_V], NullableSparseArray[_V]]:
+        """Returns the position as a Nullable, or a range as a sparse array.
+
+        Args:
+            key (Union[int, slice]):
+                position, negative values count from the end,
+                or a slice without step.
+
+        Raises:
+            IndexError: if the position is out of range.
+            ValueError: if the slice has a step other than 1.
+
+        Returns:
+            Union[Nullable[V], NullableSparseArray[V]]:
+                the value or the shared empty Nullable,
+                or the range whose positions start from 0.
+
+        Example:
+            >>> sparse = NullableSparseArray(10, {2: "a", 5: "b"})
+                print(list(sparse[4:10].items()))
+            [(1, 'b')]
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                raise ValueError("sparse array slices must not have a step.")
+            stop = max(start, stop)
+            first: int = bisect_left(self._indices, start)
+            last: int = bisect_left(self._indices, stop, first)
+            return self._of(
+                stop - start,
+                array("q", [i - start for i in self._indices[first:last]]),
+                self._values[first:last])
+
+        index: int = key
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("sparse array index out of range")
+        position: int = bisect_left(self._indices, index)
+        if position < len(self._indices)\
+                and self._indices[position] == index:
+            return Nullable(self._values[position])
+        return Nullable.empty()
+
+    def __iter__(self) -> Iterator[Nullable[_V]]:
+        """Iterates every position, empty ones included.
+
+        Returns:
+            Iterator[Nullable[V]]: Nullable per position.
+        """
+        empty: Nullable[Any] = Nullable.empty()
+        previous: int = -1
+        for index, value in zip(self._indices, self._values):
+            for _ in range(index - previous - 1):
+                yield empty
+            yield Nullable(value)
+            previous = index
+        for _ in range(self._length - previous - 1):
+            yield empty
+
+    def items(self) -> Iterator[tuple[int, _V]]:
+        """
+        Returns:
+            Iterator[tuple[int, V]]: position and value of present positions.
+        """
+        return zip(self._indices, self._values)
+
+    def indices(self) -> Iterator[int]:
+        """
+        Returns:
+            Iterator[int]: present positions in order.
+        """
+        return iter(self._indices)
+
+    def values(self) -> Iterator[_V]:
+        """
+        Returns:
+            Iterator[V]: present values in order of positions.
+        """
+        return iter(self._values)
+
+    def map(
+        self,
+        mapper: Callable[[_V], Optional[_U]]
+    ) -> NullableSparseArray[_U]:
+        """Applies the mapper to present values only.
+
+        Positions mapped to None become empty.
+
+        Args:
+            mapper (Callable[[V], Optional[U]]): the mapping function.
+
+        Raises:
+            UncallableException:
+                if the given mapper is not callable.
+            IncompleteCallBackException:
+                if the given mapper raises some exception.
+
+        Returns:
+            NullableSparseArray[U]: array of the mapped values.
+
+        Example:
+            >>> sparse = NullableSparseArray(10, {2: 1, 5: -1})
+                print(list(sparse.map(lambda x: x if x > 0 else None).items()))
+            [(2, 1)]
+        """
+        if not is_production_mode() and not callable(mapper):
+            raise UncallableException(callback=mapper)
+        try:
+            mapped: list[Optional[_U]] = list(map(mapper, self._values))
+        except Exception as e:
+            if is_production_mode():
+                raise
+            raise IncompleteCallBackException(cause=e, callback=mapper)
+        if None not in mapped:
+            return self._of(
+                self._length, array("q", self._indices),
+                mapped)  # type: ignore
+        indices: array[int] = array("q")
+        values: list[_U] = []
+        for index, value in zip(self._indices, mapped):
+            if value is not None:
+                indices.append(index)
+                values.append(value)
+        return self._of(self._length, indices, values)
+
+    def filter(
+        self,
+        extractor: Callable[[_V], bool]
+    ) -> NullableSparseArray[_V]:
+        """Keeps present values that match the extractor.
+
+        Args:
+            extractor (Callable[[V], bool]): the extract to apply.
+
+        Raises:
+            UncallableException:
+                if the given extractor is not callable.
+            IncompleteCallBackException:
+                if the given extractor raises some exception.
+
+        Returns:
+            NullableSparseArray[V]: array of the matched values.
+        """
+        if not is_production_mode() and not callable(extractor):
+            raise UncallableException(callback=extractor)
+        try:
+            flags: list[bool] = list(map(extractor, self._values))
+        except Exception as e:
+            if is_production_mode():
+                raise
+            raise IncompleteCallBackException(cause=e, callback=extractor)
+        indices: array[int] = array("q")
+        values: list[_V] = []
+        for index, value, flag in zip(self._indices, self._values, flags):
+            if flag:
+                indices.append(index)
+                values.append(value)
+        return self._of(self._length, indices, values)
+
+    def merge(
+        self,
+        other: NullableSparseArray[_V],
+        combine: Optional[Callable[[_V, _V], Optional[_V]]] = None
+    ) -> NullableSparseArray[_V]:
+        """Merges two sparse arrays in a single linear pass.
+
+        Args:
+            other (NullableSparseArray[V]): array to merge.
+            combine (Optional[Callable[[V, V], Optional[V]]], optional):
+                function that merges two values at the same position.
+                Defaults to taking the value of other.
+
+        Raises:
+            UncallableException:
+                if the given combine is not callable.
+            IncompleteCallBackException:
+                if the given combine raises some exception.
+
+        Returns:
+            NullableSparseArray[V]:
+                array as long as the longer one, with the present values
+                of both.
+
+        Example:
+            >>> a = NullableSparseArray(5, {0: 1, 3: 2})
+                b = NullableSparseArray(5, {3: 10, 4: 20})
+                print(list(a.merge(b, lambda x, y: x + y).items()))
+            [(0, 1), (3, 12), (4, 20)]
+        """
+        if combine is not None and not is_production_mode()\
+                and not callable(combine):
+            raise UncallableException(callback=combine)
+
+        left_indices: array[int] = self._indices
+        right_indices: array[int] = other._indices
+        left_values: list[_V] = self._values
+        right_values: list[_V] = other._values
+        left_size: int = len(left_indices)
+        right_size: int = len(right_indices)
+
+        indices: array[int] = array("q")
+        values: list[_V] = []
+        i: int = 0
+        j: int = 0
+        while i < left_size and j < right_size:
+            left: int = left_indices[i]
+            right: int = right_indices[j]
+            if left < right:
+                indices.append(left)
+                values.append(left_values[i])
+                i += 1
+            elif right < left:
+                indices.append(right)
+                values.append(right_values[j])
+                j += 1
+            else:
+                value: Optional[_V] = right_values[j]
+                if combine is not None:
+                    try:
+                        value = combine(left_values[i], right_values[j])
+                    except Exception as e:
+                        if is_production_mode():
+                            raise
+                        raise IncompleteCallBackException(
+                            cause=e, callback=combine)
+                if value is not None:
+                    indices.append(left)
+                    values.append(value)
+                i += 1
+                j += 1
+        indices.extend(left_indices[i:])
+        values.extend(left_values[i:])
+        indices.extend(right_indices[j:])
+        values.extend(right_values[j:])
+        return self._of(max(self._length, other._length), indices, values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NullableSparseArray):
+            return NotImplemented
+        return self._length == other._length\
+            and self._indices == other._indices\
+            and self._values == other._values
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        entries: str = ", ".join(
+            f"{index}: {value!r}" for index, value in self.items())
+        return f"{self.__class__.__name__}({self._length}, {{{entries}}})"
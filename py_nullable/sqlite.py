@@ -0,0 +1,238 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's sqlite3 integration
+
+Class:
+    * ColumnBatch
+
+Function:
+    * nullable_row_factory
+    * fetch_columns
+
+"""
+from __future__ import annotations
+import sqlite3
+from itertools import repeat
+from operator import is_not
+from typing import Any, Iterator, Optional, Sequence, Union
+from .nullable import Nullable
+from .row import NullableRow, _RowSchema
+
+_FLAGS: bytes = bytes.maketrans(b"\x00\x01", b"01")
+
+# schema of the last seen cursor description.
+# a cursor keeps the same description object for every row of a query,
+# so the identity check is enough to skip rebuilding the schema.
+_last_schema: tuple[Any, Optional[_RowSchema]] = (None, None)
+
+
+def _schema_of(cursor: sqlite3.Cursor) -> _RowSchema:
+    global _last_schema
+    description: Any = cursor.description
+    last_description, schema = _last_schema
+    if description is not last_description or schema is None:
+        schema = _RowSchema(column[0] for column in description)
+        _last_schema = (description, schema)
+    return schema
+
+
+def nullable_row_factory(
+    cursor: sqlite3.Cursor,
+    row: tuple[Any, ...]
+) -> NullableRow:
+    """Row factory that returns rows as NullableRow.
+
+    Cells are wrapped in Nullable only when accessed,
+    and NULL cells are returned as the shared empty Nullable.
+
+    Args:
+        cursor (sqlite3.Cursor): cursor the row was fetched by.
+        row (tuple[Any, ...]): raw row.
+
+    Returns:
+        NullableRow: row whose columns are accessed by name or position.
+
+    Example:
+        >>> connection = sqlite3.connect("app.db")
+            connection.row_factory = nullable_row_factory
+            row = connection.execute("SELECT name, email FROM users").fetchone()
+            print(row.email.orElse("unregistered"))
+        unregistered
+    """
+    return NullableRow(_schema_of(cursor), row)
+
+
+class ColumnBatch:
+    """Rows of a query result stored column by column.
+
+    Each column is a tuple of raw values, NULL cells included as None,
+    with an integer presence bitmap whose bit i is set
+    if row i is not NULL.
+
+    Attributes:
+        _schema (_RowSchema): column names
+        _columns (tuple[tuple[Any, ...], ...]): raw values per column
+        _presence (tuple[int, ...]): presence bitmap per column
+        _length (int): number of rows
+    """
+
+    __slots__ = ["_schema", "_columns", "_presence", "_length"]
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        rows: Sequence[Sequence[Any]]
+    ) -> None:
+        """constructor.
+
+        Args:
+            names (Sequence[str]): column names.
+            rows (Sequence[Sequence[Any]]): raw rows.
+        """
+        self._schema: _RowSchema = _RowSchema(names)
+        self._length: int = len(rows)
+        self._columns: tuple[tuple[Any, ...], ...] = tuple(zip(*rows))\
+            if rows else ((),) * len(names)
+        self._presence: tuple[int, ...] = tuple(
+            int(bytes(map(is_not, column, repeat(None)))[::-1]
+                .translate(_FLAGS), 2)
+            if column else 0
+            for column in self._columns)
+
+    def _index(self, column: Union[str, int]) -> int:
+        if isinstance(column, str):
+            return self._schema.index[column]
+        return range(len(self._columns))[column]
+
+    def names(self) -> tuple[str, ...]:
+        """
+        Returns:
+            tuple[str, ...]: column names in order.
+        """
+        return self._schema.fields
+
+    def column(self, column: Union[str, int]) -> tuple[Any, ...]:
+        """Returns the raw values of a column.
+
+        Args:
+            column (Union[str, int]): column name or position.
+
+        Raises:
+            KeyError: if the column name is not in the result.
+            IndexError: if the position is out of range.
+
+        Returns:
+            tuple[Any, ...]: raw value or None per row.
+        """
+        return self._columns[self._index(column)]
+
+    def presence(self, column: Union[str, int]) -> int:
+        """Returns the presence bitmap of a column.
+
+        Args:
+            column (Union[str, int]): column name or position.
+
+        Raises:
+            KeyError: if the column name is not in the result.
+            IndexError: if the position is out of range.
+
+        Returns:
+            int: bitmap whose bit i is set if row i is not NULL.
+
+        Example:
+            >>> batch = fetch_columns(
+            ...     connection.execute("SELECT email FROM users"), 1000)
+            ... print(bin(batch.presence("email")))
+                0b101
+        """
+        return self._presence[self._index(column)]
+
+    def count_present(self, column: Union[str, int]) -> int:
+        """
+        Args:
+            column (Union[str, int]): column name or position.
+
+        Returns:
+            int: number of rows that are not NULL in the column.
+        """
+        return bin(self.presence(column)).count("1")
+
+    def get(self, row: int, column: Union[str, int]) -> Nullable[Any]:
+        """Returns a cell as a Nullable.
+
+        Args:
+            row (int): row position.
+            column (Union[str, int]): column name or position.
+
+        Raises:
+            KeyError: if the column name is not in the result.
+            IndexError: if a position is out of range.
+
+        Returns:
+            Nullable[Any]: the value, or the shared empty Nullable if NULL.
+        """
+        value: Any = self._columns[self._index(column)][row]
+        if value is None:
+            return Nullable.empty()
+        return Nullable(value)
+
+    def present_values(self, column: Union[str, int]) -> list[Any]:
+        """Returns the values of a column, skipping NULL cells.
+
+        Args:
+            column (Union[str, int]): column name or position.
+
+        Returns:
+            list[Any]: values that are not NULL, in row order.
+        """
+        return [
+            value for value in self._columns[self._index(column)]
+            if value is not None]
+
+    def rows(self) -> Iterator[NullableRow]:
+        """
+        Returns:
+            Iterator[NullableRow]: the rows of the batch.
+        """
+        return map(NullableRow, repeat(self._schema), zip(*self._columns))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(names={self._schema.fields!r}, "\
+            f"rows={self._length})"
+
+
+def fetch_columns(
+    cursor: sqlite3.Cursor,
+    size: Optional[int] = None
+) -> ColumnBatch:
+    """Fetches the next rows of a cursor as a ColumnBatch.
+
+    Rows are fetched as plain tuples, whatever the row factory is,
+    and transposed in bulk, so no object is created per cell.
+
+    Args:
+        cursor (sqlite3.Cursor): cursor of an executed query.
+        size (Optional[int], optional):
+            maximum number of rows. Defaults to ``cursor.arraysize``.
+
+    Returns:
+        ColumnBatch: the fetched rows, empty once the cursor is exhausted.
+
+    Example:
+        >>> cursor = connection.execute("SELECT name, email FROM users")
+            while batch := fetch_columns(cursor, 10000):
+                print(batch.count_present("email"), len(batch))
+        2 3
+    """
+    row_factory: Any = cursor.row_factory
+    cursor.row_factory = None
+    try:
+        rows: list[tuple[Any, ...]] = cursor.fetchmany(
+            cursor.arraysize if size is None else size)
+    finally:
+        cursor.row_factory = row_factory
+    description: Any = cursor.description or ()
+    return ColumnBatch([column[0] for column in description], rows)
@@ -0,0 +1,386 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's asynchronous stream
+
+Class:
+    * AsyncNullableStream
+
+"""
+from __future__ import annotations
+import asyncio
+import inspect
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable,\
+    Generic, Iterable, Optional, TypeVar, Union
+from .nullable import Nullable, _raw_value, is_production_mode
+from .exception import UncallableException, IncompleteCallBackException
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+
+_Item = Union[Optional[_T], Nullable[_T]]
+
+
+def _validate(callback: Any) -> None:
+    if not is_production_mode() and not callable(callback):
+        raise UncallableException(callback=callback)
+
+
+async def _call(
+    callback: Callable[[_T], Any],
+    value: _T
+) -> Any:
+    """Calls a callback that may be a coroutine function,
+    wrapping its exception as Nullable does.
+    """
+    try:
+        result: Any = callback(value)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        if is_production_mode():
+            raise
+        raise IncompleteCallBackException(cause=e, callback=callback)
+
+
+async def _cancel(futures: Iterable[Optional[asyncio.Future[Any]]]) -> None:
+    """Cancels futures and waits for them,
+    so that no exception is left unretrieved.
+    """
+    pending: list[asyncio.Future[Any]] = [
+        future for future in futures if future is not None]
+    for future in pending:
+        future.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _close(iterator: AsyncIterator[Any]) -> None:
+    aclose: Optional[Callable[[], Awaitable[None]]]\
+        = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+class AsyncNullableStream(Generic[_T]):
+    """Asynchronous stream of Nullable over an async or sync iterable.
+
+    Items are pulled from the source only when they are consumed,
+    so a bounded source such as ``asyncio.Queue`` keeps its backpressure.
+    Operations return a new stream, and a stream can be consumed once.
+
+    Note:
+        Like Nullable#ifPresent, values are passed to callbacks
+        by reference.
+
+    Example:
+        >>> async def fetch_profile(user_id: str) -> Optional[Profile]:
+        ...     ...
+        ...
+        ...
+        ... stream = AsyncNullableStream(user_ids)
+        ... profiles = stream.amap(fetch_profile, concurrency=16)
+        ... async for profile in profiles.present():
+        ...     print(profile.name)
+            foo
+    """
+
+    __slots__ = ["_source"]
+
+    def __init__(
+        self,
+        source: Union[AsyncIterable[_Item[_T]], Iterable[_Item[_T]]]
+    ) -> None:
+        """constructor.
+
+        Args:
+            source (Union[AsyncIterable[Union[Optional[T], Nullable[T]]],
+                          Iterable[Union[Optional[T], Nullable[T]]]]):
+                None-able values or Nullable objects.
+        """
+        self._source: Union[
+            AsyncIterable[_Item[_T]], Iterable[_Item[_T]]] = source
+
+    @classmethod
+    def from_queue(
+        cls,
+        queue: asyncio.Queue[_Item[_T]],
+        sentinel: Any
+    ) -> AsyncNullableStream[_T]:
+        """Returns a stream of the items put in the queue.
+
+        An item is taken from the queue only when the stream needs it,
+        and marked done with ``task_done`` once it has been consumed.
+
+        Args:
+            queue (asyncio.Queue[Union[Optional[T], Nullable[T]]]):
+                queue to take items from.
+            sentinel (Any): item that ends the stream, compared by identity.
+
+        Returns:
+            AsyncNullableStream[T]: stream of the queue.
+
+        Example:
+            >>> done = object()
+                stream = AsyncNullableStream.from_queue(queue, done)
+        """
+        async def _() -> AsyncIterator[_Item[_T]]:
+            while True:
+                item: Any = await queue.get()
+                try:
+                    if item is sentinel:
+                        return
+                    yield item
+                finally:
+                    queue.task_done()
+
+        return cls(_())
+
+    async def _values(self) -> AsyncIterator[Optional[_T]]:
+        """Iterates the source as None-able values.
+        """
+        source: Any = self._source
+        if hasattr(source, "__aiter__"):
+            iterator: AsyncIterator[_Item[_T]] = source.__aiter__()
+            try:
+                async for item in iterator:
+                    yield _raw_value(item)\
+                        if isinstance(item, Nullable) else item
+            finally:
+                await _close(iterator)
+        else:
+            for item in source:
+                yield _raw_value(item) if isinstance(item, Nullable) else item
+
+    def __aiter__(self) -> AsyncIterator[Nullable[_T]]:
+        return self._nullables()
+
+    async def _nullables(self) -> AsyncIterator[Nullable[_T]]:
+        values: AsyncIterator[Optional[_T]] = self._values()
+        try:
+            async for value in values:
+                yield Nullable.empty() if value is None else Nullable(value)
+        finally:
+            await _close(values)
+
+    def amap(
+        self,
+        mapper: Callable[[_T], Awaitable[Optional[_U]]],
+        concurrency: int = 1,
+        ordered: bool = True
+    ) -> AsyncNullableStream[_U]:
+        """Applies a coroutine function to present values concurrently.
+
+        At most concurrency items are in flight at a time,
+        and no more items are pulled from the source until one is done.
+        Empty items are passed through without calling the mapper.
+
+        Args:
+            mapper (Callable[[T], Awaitable[Optional[U]]]):
+                the coroutine function to apply to a present value.
+            concurrency (int, optional):
+                maximum number of items in flight. Defaults to 1.
+            ordered (bool, optional):
+                if true, results keep the order of the source,
+                otherwise they come as soon as they are done.
+                Defaults to True.
+
+        Raises:
+            UncallableException:
+                if the given mapper is not callable.
+            ValueError:
+                if concurrency is less than 1.
+
+        Returns:
+            AsyncNullableStream[U]:
+                stream of the results. Iterating it raises
+                IncompleteCallBackException if the mapper raises some
+                exception.
+        """
+        _validate(mapper)
+        if concurrency < 1:
+            raise ValueError("concurrency must be 1 or more.")
+        if ordered:
+            return AsyncNullableStream(
+                self._amap_ordered(mapper, concurrency))
+        return AsyncNullableStream(self._amap_unordered(mapper, concurrency))
+
+    async def _amap_ordered(
+        self,
+        mapper: Callable[[_T], Awaitable[Optional[_U]]],
+        concurrency: int
+    ) -> AsyncIterator[Optional[_U]]:
+        values: AsyncIterator[Optional[_T]] = self._values()
+        pull: Optional[asyncio.Future[Optional[_T]]] = None
+        window: deque[Optional[asyncio.Future[Optional[_U]]]] = deque()
+        exhausted: bool = False
+        try:
+            while True:
+                while window and (window[0] is None or window[0].done()):
+                    head: Optional[asyncio.Future[Optional[_U]]]\
+                        = window.popleft()
+                    yield None if head is None else head.result()
+                if pull is None and not exhausted\
+                        and len(window) < concurrency:
+                    pull = asyncio.ensure_future(values.__anext__())
+                waiting: list[asyncio.Future[Any]] = [
+                    future for future in (pull, window and window[0])
+                    if future]
+                if not waiting:
+                    return
+                await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED)
+                if pull is not None and pull.done():
+                    try:
+                        value: Optional[_T] = pull.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        window.append(None if value is None else
+                                      asyncio.ensure_future(
+                                          _call(mapper, value)))
+                    pull = None
+        finally:
+            await _cancel([pull, *window])
+            await _close(values)
+
+    async def _amap_unordered(
+        self,
+        mapper: Callable[[_T], Awaitable[Optional[_U]]],
+        concurrency: int
+    ) -> AsyncIterator[Optional[_U]]:
+        values: AsyncIterator[Optional[_T]] = self._values()
+        pull: Optional[asyncio.Future[Optional[_T]]] = None
+        running: set[asyncio.Future[Optional[_U]]] = set()
+        exhausted: bool = False
+        try:
+            while True:
+                if pull is None and not exhausted\
+                        and len(running) < concurrency:
+                    pull = asyncio.ensure_future(values.__anext__())
+                waiting: set[asyncio.Future[Any]] = set(running)
+                if pull is not None:
+                    waiting.add(pull)
+                if not waiting:
+                    return
+                done, _ = await asyncio.wait(
+                    waiting, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    if future is not pull:
+                        running.discard(future)
+                        yield future.result()
+                if pull is not None and pull.done():
+                    try:
+                        value: Optional[_T] = pull.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        if value is None:
+                            yield None
+                        else:
+                            running.add(asyncio.ensure_future(
+                                _call(mapper, value)))
+                    pull = None
+        finally:
+            await _cancel([pull, *running])
+            await _close(values)
+
+    def afilter(
+        self,
+        extractor: Callable[[_T], Union[bool, Awaitable[bool]]]
+    ) -> AsyncNullableStream[_T]:
+        """Empties present values that do not match the extractor.
+
+        see: Nullable#filter
+
+        Args:
+            extractor (Callable[[T], Union[bool, Awaitable[bool]]]):
+                function or coroutine function to apply to a present value.
+
+        Raises:
+            UncallableException:
+                if the given extractor is not callable.
+
+        Returns:
+            AsyncNullableStream[T]:
+                stream of the matched values and empty Nullable objects.
+                Iterating it raises IncompleteCallBackException
+                if the extractor raises some exception.
+        """
+        _validate(extractor)
+
+        async def _() -> AsyncIterator[Optional[_T]]:
+            values: AsyncIterator[Optional[_T]] = self._values()
+            try:
+                async for value in values:
+                    if value is not None\
+                            and not await _call(extractor, value):
+                        value = None
+                    yield value
+            finally:
+                await _close(values)
+
+        return AsyncNullableStream(_())
+
+    async def present(self) -> AsyncIterator[_T]:
+        """Iterates present values, skipping empty ones.
+
+        Returns:
+            AsyncIterator[T]: values that are not None.
+        """
+        values: AsyncIterator[Optional[_T]] = self._values()
+        try:
+            async for value in values:
+                if value is not None:
+                    yield value
+        finally:
+            await _close(values)
+
+    def chunked(self, size: int) -> AsyncIterator[list[Nullable[_T]]]:
+        """Iterates the stream in lists of at most size Nullable objects.
+
+        Args:
+            size (int): maximum number of Nullable objects per list.
+
+        Raises:
+            ValueError: if size is less than 1.
+
+        Returns:
+            AsyncIterator[list[Nullable[T]]]: lists in order of the stream.
+        """
+        if size < 1:
+            raise ValueError("size must be 1 or more.")
+        return self._chunked(size)
+
+    async def _chunked(self, size: int) -> AsyncIterator[list[Nullable[_T]]]:
+        chunk: list[Nullable[_T]] = []
+        nullables: AsyncIterator[Nullable[_T]] = self._nullables()
+        try:
+            async for nullable in nullables:
+                chunk.append(nullable)
+                if len(chunk) == size:
+                    yield chunk
+                    chunk = []
+        finally:
+            await _close(nullables)
+        if chunk:
+            yield chunk
+
+    async def first_present(self) -> Nullable[_T]:
+        """Returns the first present value,
+        without pulling any further items from the source.
+
+        Returns:
+            Nullable[T]: the first present value, or an empty Nullable.
+        """
+        values: AsyncIterator[Optional[_T]] = self._values()
+        try:
+            async for value in values:
+                if value is not None:
+                    return Nullable(value)
+        finally:
+            await _close(values)
+        return Nullable.empty()
@@ -0,0 +1,204 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's stack-safe runners
+
+Function:
+    * nullable_tailrec
+    * flat_map_chain
+
+"""
+from __future__ import annotations
+import functools
+import threading
+from typing import Any, Callable, Iterable, Iterator, TypeVar, Union
+from .nullable import Nullable, _raw_value
+
+_T = TypeVar("_T")
+
+_local: threading.local = threading.local()
+
+
+class _Deferred:
+    """Computation that will produce a Nullable when it is run.
+
+    map, flatMap and filter are recorded instead of being called,
+    any other attribute, truth test, iteration, len or comparison
+    runs the computation first.
+    """
+
+    __slots__ = []  # type: ignore
+
+    def map(self, mapper: Callable[[Any], Any]) -> _Deferred:
+        return _Bind(self, "map", mapper)
+
+    def flatMap(self, mapper: Callable[[Any], Any]) -> _Deferred:
+        return _Bind(self, "flatMap", mapper)
+
+    def filter(self, extractor: Callable[[Any], bool]) -> _Deferred:
+        return _Bind(self, "filter", extractor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_run(self), name)
+
+    # special methods are looked up on the type, not through __getattr__.
+    def __bool__(self) -> bool:
+        return bool(_run(self))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(_run(self))
+
+    def __len__(self) -> int:
+        return len(_run(self))
+
+    def __eq__(self, other: object) -> bool:
+        return _run(self) == other
+
+    def __hash__(self) -> int:
+        return hash(_run(self))
+
+
+class _Call(_Deferred):
+    """Suspended call of a function decorated with nullable_tailrec.
+    """
+
+    __slots__ = ["func", "args", "kwargs"]
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any]
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+
+class _Bind(_Deferred):
+    """Nullable method recorded on a deferred computation.
+    """
+
+    __slots__ = ["source", "method", "callback"]
+
+    def __init__(
+        self,
+        source: _Deferred,
+        method: str,
+        callback: Callable[[Any], Any]
+    ) -> None:
+        self.source = source
+        self.method = method
+        self.callback = callback
+
+
+def _run(computation: Union[_Deferred, Nullable[_T]]) -> Nullable[_T]:
+    """Runs a deferred computation in a loop.
+
+    Recorded methods are kept on an explicit stack,
+    so the Python stack depth stays constant however deep the
+    recursion or however long the chain is.
+    """
+    running: bool = getattr(_local, "running", False)
+    _local.running = True
+    try:
+        pending: list[_Bind] = []
+        current: Any = computation
+        while True:
+            if isinstance(current, _Bind):
+                pending.append(current)
+                current = current.source
+            elif isinstance(current, _Call):
+                current = current.func(*current.args, **current.kwargs)
+            elif not pending:
+                return current
+            elif _raw_value(current) is None:
+                return Nullable.empty()
+            else:
+                bind: _Bind = pending.pop()
+                current = getattr(current, bind.method)(bind.callback)
+    finally:
+        _local.running = running
+
+
+def nullable_tailrec(
+    func: Callable[..., Nullable[_T]]
+) -> Callable[..., Nullable[_T]]:
+    """Decorator that runs a recursive Nullable-returning function
+    with constant stack depth.
+
+    While the decorated function runs, its recursive calls
+    (directly or through Nullable#flatMap) return a deferred computation,
+    which is resumed by a loop instead of a nested Python frame.
+
+    Note:
+        Pass recursive calls to flatMap, not map.
+        Results of recursive calls support map, flatMap and filter
+        without running; any other method, truth test, iteration,
+        len or comparison runs them in a nested loop.
+        They are not instances of Nullable, so do not pass them to
+        isinstance but return them, or call a method such as get.
+
+    Args:
+        func (Callable[..., Nullable[T]]): function to be decorated.
+
+    Example:
+        >>> @nullable_tailrec
+        ... def collatz_steps(n: int, steps: int = 0) -> Nullable[int]:
+        ...     if n == 1:
+        ...         return Nullable[int](steps)
+        ...     next_n: int = n // 2 if n % 2 == 0 else 3 * n + 1
+        ...     return Nullable[int](next_n).flatMap(
+        ...         lambda x: collatz_steps(x, steps + 1))
+        ...
+        ...
+        ... print(collatz_steps(27).get())
+            111
+    """
+    @functools.wraps(func)
+    def _(*args: Any, **kwargs: Any) -> Nullable[_T]:
+        call: _Call = _Call(func, args, kwargs)
+        if getattr(_local, "running", False):
+            return call  # type: ignore
+        return _run(call)
+
+    return _
+
+
+def flat_map_chain(
+    nullable: Nullable[Any],
+    mappers: Iterable[Callable[[Any], Nullable[Any]]]
+) -> Nullable[Any]:
+    """Applies mappers one after another as Nullable#flatMap, in a loop.
+
+    The chain stops at the first empty Nullable,
+    so the remaining mappers are neither called nor even iterated.
+
+    Args:
+        nullable (Nullable[Any]): first Nullable of the chain.
+        mappers (Iterable[Callable[[Any], Nullable[Any]]]):
+            Nullable-bearing mapping functions.
+
+    Raises:
+        UncallableException:
+            if a mapper is not callable.
+        IncompleteCallBackException:
+            if a mapper raises some exception.
+
+    Returns:
+        Nullable[Any]: result of the last mapper, or an empty Nullable.
+
+    Example:
+        >>> steps = [lambda x: Nullable[int](x + 1)] * 10000
+            print(flat_map_chain(Nullable[int](0), steps).get())
+        10000
+    """
+    current: Union[_Deferred, Nullable[Any]] = nullable
+    if _raw_value(current) is None:  # type: ignore
+        return Nullable.empty()
+    for mapper in mappers:
+        current = current.flatMap(mapper)
+        if isinstance(current, _Deferred):
+            current = _run(current)
+        if _raw_value(current) is None:  # type: ignore
+            return Nullable.empty()
+    return current  # type: ignore
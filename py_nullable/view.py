@@ -0,0 +1,176 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""py_nullable's read-only views
+
+Function:
+    * readonly_view
+
+"""
+from __future__ import annotations
+import copy
+from collections.abc import Mapping, MutableMapping, MutableSequence,\
+    MutableSet, Sequence, Set
+from typing import Any, Iterable, Iterator, Optional, TypeVar, Union
+from .nullable import Nullable
+
+_T = TypeVar("_T")
+
+_MISSING: Any = object()
+
+# values of these types cannot be changed, so they are returned as is.
+_IMMUTABLE: frozenset[type] = frozenset({
+    type(None), bool, int, float, complex, str, bytes, range, frozenset,
+    type})
+
+
+class _MappingView(Mapping):  # type: ignore
+    """Read-only view of a mapping, whose values are viewed on access.
+    """
+
+    __slots__ = ["_mapping"]
+
+    def __init__(self, mapping: Mapping[Any, Any]) -> None:
+        self._mapping: Mapping[Any, Any] = mapping
+
+    def __getitem__(self, key: Any) -> Any:
+        # get does not call __missing__, so a defaultdict is not changed.
+        value: Any = self._mapping.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return readonly_view(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._mapping
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._mapping!r})"
+
+
+class _SequenceView(Sequence):  # type: ignore
+    """Read-only view of a sequence, whose items are viewed on access.
+    """
+
+    __slots__ = ["_sequence"]
+
+    def __init__(self, sequence: Sequence[Any]) -> None:
+        self._sequence: Sequence[Any] = sequence
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return _SequenceView(self._sequence[index])
+        return readonly_view(self._sequence[index])
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(readonly_view, self._sequence)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._sequence
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _SequenceView):
+            other = other._sequence
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self._sequence) == len(other) and all(
+            a == b for a, b in zip(self._sequence, other))
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._sequence!r})"
+
+
+class _SetView(Set):  # type: ignore
+    """Read-only view of a set.
+
+    Set operations return a frozenset.
+    """
+
+    __slots__ = ["_set"]
+
+    def __init__(self, values: Set[Any]) -> None:
+        self._set: Set[Any] = values
+
+    @classmethod
+    def _from_iterable(cls, values: Iterable[Any]) -> frozenset[Any]:
+        return frozenset(values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._set
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._set)
+
+    def __len__(self) -> int:
+        return len(self._set)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._set!r})"
+
+
+def readonly_view(value: _T) -> Any:
+    """Returns a read-only view of the value, without copying it.
+
+    - mappings are viewed as a Mapping
+    - lists, tuples and other sequences are viewed as a Sequence
+    - sets are viewed as a Set
+    - bytearray and memoryview are viewed as a read-only memoryview.
+      On Python 3.7, which has no memoryview#toreadonly, a writable
+      buffer is copied into a read-only memoryview instead.
+
+    Items of mappings and sequences are viewed in turn when accessed,
+    so each access costs O(1) however deep the value is.
+    Immutable values are returned as they are,
+    and other objects are deep-copied.
+
+    Args:
+        value (T): value to view.
+
+    Returns:
+        Any: read-only view of the value.
+
+    Example:
+        >>> view = readonly_view({"tags": ["a", "b"]})
+            view["tags"].append("c")
+        AttributeError: '_SequenceView' object has no attribute 'append'
+    """
+    kind: type = type(value)
+    if kind in _IMMUTABLE:
+        return value
+    if isinstance(value, (_MappingView, _SequenceView, _SetView)):
+        return value
+    if isinstance(value, (bytearray, memoryview)):
+        view: memoryview = memoryview(value)
+        if view.readonly:
+            return view
+        if hasattr(view, "toreadonly"):
+            return view.toreadonly()
+        return memoryview(view.tobytes()).cast(
+            view.format, view.shape)  # type: ignore
+    if isinstance(value, (dict, MutableMapping)):
+        return _MappingView(value)  # type: ignore
+    if isinstance(value, (list, tuple, MutableSequence)):
+        return _SequenceView(value)  # type: ignore
+    if isinstance(value, (set, MutableSet)):
+        return _SetView(value)  # type: ignore
+    return copy.deepcopy(value)
+
+
+class _ViewNullable(Nullable[_T]):
+    """Nullable whose value is read through read-only views.
+    """
+
+    __slots__ = []  # type: ignore
+
+    @property
+    def _Nullable__value(self) -> Optional[Any]:
+        return readonly_view(self._Nullable__val)  # type: ignore
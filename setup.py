@@ -0,0 +1,32 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Build of py_nullable
+
+The metadata is in pyproject.toml.
+If the environment variable PY_NULLABLE_MYPYC is set to 1,
+the wrapping and metrics modules (decorator.py and metrics.py)
+are also compiled with mypyc, which must be installed
+in the build environment:
+
+    pip install mypy
+    PY_NULLABLE_MYPYC=1 pip wheel --no-build-isolation .
+
+Nullable (nullable.py) is not compiled,
+so its construction and dispatch are not sped up.
+
+"""
+import os
+from setuptools import setup
+
+MYPYC_MODULES = [
+    "py_nullable/decorator.py",
+    "py_nullable/metrics.py",
+]
+
+ext_modules = []
+if os.environ.get("PY_NULLABLE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(
+        MYPYC_MODULES, opt_level="3", group_name="py_nullable")
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+import pytest
+from py_nullable import BloomFilter, Nullable, nullable_wrap
+
+_db: dict[str, int] = {f"K{i:04}": i for i in range(100)}
+_known: BloomFilter = BloomFilter.from_keys(_db, capacity=200)
+_calls: list[str] = []
+_thread_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2)
+
+
+@nullable_wrap(bloom=_known)
+def find_by_id(id: str) -> Optional[int]:
+    _calls.append(id)
+    return _db.get(id)
+
+
+@nullable_wrap(bloom=_known, bloom_key=lambda tenant, id: id)
+def find_by_tenant(tenant: str, id: str) -> Optional[int]:
+    _calls.append(id)
+    return _db.get(id)
+
+
+@nullable_wrap(executor=_thread_pool, bloom=_known)
+def find_in_thread(id: str) -> Optional[int]:
+    _calls.append(id)
+    return _db.get(id)
+
+
+def test_bloom_case_of_added_keys():
+    bloom: BloomFilter = BloomFilter(100)
+    bloom.update(range(50))
+    bloom.add("foo")
+    bloom.add(b"bar")
+
+    assert all(i in bloom for i in range(50))
+    assert "foo" in bloom
+    assert b"bar" in bloom
+    assert len(bloom) == 52
+
+
+def test_bloom_case_of_key_encoding():
+    bloom: BloomFilter = BloomFilter(100)
+    bloom.update([1, ("a", 2, (b"c",))])
+
+    assert True in bloom
+    assert ("a", 2, (b"c",)) in bloom
+    for key in (1.0, frozenset({"a"}), ("a", None)):
+        with pytest.raises(Exception) as excinfo:
+            bloom.add(key)
+        assert excinfo.errisinstance(TypeError)
+
+
+def test_bloom_case_of_key_serializer(tmp_path):
+    def serialize(key: frozenset[str]) -> bytes:
+        return "\x00".join(sorted(key)).encode()
+
+    bloom: BloomFilter = BloomFilter.from_keys(
+        [frozenset({"a", "b"})], key_serializer=serialize)
+    path = tmp_path / "sets.bloom"
+    bloom.save(path)
+    loaded: BloomFilter = BloomFilter.load(path, key_serializer=serialize)
+
+    assert frozenset({"b", "a"}) in loaded
+    assert frozenset({"a"}) not in loaded
+
+
+def test_bloom_case_of_concurrent_additions():
+    bloom: BloomFilter = BloomFilter(20000, error_rate=0.1)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(
+            lambda start: bloom.update(range(start, start + 2500)),
+            range(0, 20000, 2500)))
+
+    assert all(i in bloom for i in range(20000))
+    assert len(bloom) == 20000
+
+
+def test_bloom_case_of_false_positive_rate():
+    bloom: BloomFilter = BloomFilter.from_keys(range(1000), error_rate=0.01)
+    false_positives: int = sum(i in bloom for i in range(1000, 11000))
+
+    assert false_positives < 200
+    assert bloom.error_rate == pytest.approx(0.01, rel=0.5)
+
+
+def test_bloom_case_of_invalid_arguments():
+    with pytest.raises(Exception) as excinfo:
+        BloomFilter(0)
+    assert excinfo.errisinstance(ValueError)
+
+    with pytest.raises(Exception) as excinfo:
+        BloomFilter(10, error_rate=1)
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_bloom_case_of_save_and_load(tmp_path):
+    path = tmp_path / "known.bloom"
+    _known.save(path)
+    loaded: BloomFilter = BloomFilter.load(path)
+
+    assert all(key in loaded for key in _db)
+    assert len(loaded) == len(_known)
+    loaded.add("K9999")
+    assert "K9999" in loaded
+
+
+def test_bloom_case_of_load_invalid_file(tmp_path):
+    path = tmp_path / "invalid.bloom"
+    path.write_bytes(b"not a filter")
+    with pytest.raises(Exception) as excinfo:
+        BloomFilter.load(path)
+
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_bloom_case_of_wrap_definite_miss():
+    _calls.clear()
+    found: Nullable[int] = find_by_id("K0042")
+    missing: Nullable[int] = find_by_id("X0042")
+
+    assert found.get() == 42
+    assert missing is Nullable.empty()
+    assert _calls == ["K0042"]
+
+
+def test_bloom_case_of_wrap_incremental_insertion():
+    bloom: BloomFilter = BloomFilter(10)
+    db: dict[str, int] = {}
+
+    @nullable_wrap(bloom=bloom)
+    def find(id: str) -> Optional[int]:
+        return db.get(id)
+
+    db["new"] = 1
+    assert find("new").isEmpty()
+    bloom.add("new")
+    assert find("new").get() == 1
+
+
+def test_bloom_case_of_wrap_bloom_key():
+    _calls.clear()
+    assert find_by_tenant("t1", "K0001").get() == 1
+    assert find_by_tenant("t1", "X0001").isEmpty()
+    assert _calls == ["K0001"]
+
+
+def test_bloom_case_of_wrap_without_key():
+    find_nothing = nullable_wrap(bloom=_known)(lambda: None)
+    with pytest.raises(Exception) as excinfo:
+        find_nothing()
+
+    assert excinfo.errisinstance(TypeError)
+
+
+def test_bloom_case_of_wrap_executor():
+    _calls.clear()
+    found: Future[Nullable[int]] = find_in_thread("K0007")
+    missing: Future[Nullable[int]] = find_in_thread("X0007")
+
+    assert found.result().get() == 7
+    assert missing.done()
+    assert missing.result().isEmpty()
+    assert _calls == ["K0007"]
+    assert find_in_thread.with_timeout(1)("X0008").result().isEmpty()
+
+
+def test_bloom_case_of_wrap_event_loop():
+    async def main() -> list[Nullable[int]]:
+        return list(await asyncio.gather(
+            find_in_thread("K0003"), find_in_thread("X0003")))
+
+    found, missing = asyncio.run(main())
+
+    assert found.get() == 3
+    assert missing.isEmpty()
@@ -0,0 +1,11 @@
+import sys
+from py_nullable import compiled_modules
+
+
+def test_compiled_modules_case_of_current_build():
+    modules: tuple[str, ...] = compiled_modules()
+
+    assert set(modules) <= {"py_nullable.decorator", "py_nullable.metrics"}
+    assert all(not sys.modules[name].__file__.endswith(".py")
+               for name in modules)
+    assert sys.modules["py_nullable.nullable"].__file__.endswith(".py")
@@ -0,0 +1,189 @@
+from __future__ import annotations
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import pytest
+from py_nullable import Nullable, SqliteCache, nullable_wrap
+
+_calls: list[str] = []
+
+
+def _store_from_process(path: str, start: int) -> None:
+    with SqliteCache(path, flush_size=10) as cache:
+        for i in range(start, start + 50):
+            cache.store(i, i * 2)
+
+
+def test_cache_case_of_present_and_empty(tmp_path):
+    with SqliteCache(tmp_path / "cache.sqlite3") as cache:
+        cache.store("foo", {"name": "foo"})
+        cache.store("bar", None)
+
+        assert cache.lookup("foo").get() == {"name": "foo"}
+        assert cache.lookup("bar") is Nullable.empty()
+        assert cache.lookup("baz") is None
+
+
+def test_cache_case_of_batched_writes(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache: SqliteCache = SqliteCache(path, flush_size=3, flush_interval=60)
+    reader: SqliteCache = SqliteCache(path)
+    cache.store(1, "a")
+    cache.store(2, "b")
+
+    assert cache.lookup(1).get() == "a"
+    assert reader.lookup(1) is None
+
+    cache.store(3, "c")
+    assert reader.lookup(1).get() == "a"
+    assert reader.lookup(3).get() == "c"
+    cache.close()
+    reader.close()
+
+
+def test_cache_case_of_idle_writer(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache: SqliteCache = SqliteCache(path, flush_interval=0.05)
+    reader: SqliteCache = SqliteCache(path)
+    cache.flush()
+    cache.store(1, "a")
+
+    assert reader.lookup(1) is None
+
+    time.sleep(0.5)
+
+    assert reader.lookup(1).get() == "a"
+    cache.close()
+    reader.close()
+
+
+def test_cache_case_of_closed(tmp_path):
+    cache: SqliteCache = SqliteCache(tmp_path / "cache.sqlite3")
+    cache.close()
+    cache.close()
+
+    for operation in (lambda: cache.store(1, "a"), lambda: cache.lookup(1),
+                      cache.flush):
+        with pytest.raises(Exception) as excinfo:
+            operation()
+        assert excinfo.errisinstance(ValueError)
+
+
+def test_cache_case_of_warm_start(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    with SqliteCache(path, flush_interval=60) as cache:
+        cache.store(("find", 1), 10)
+
+    with SqliteCache(path) as cache:
+        assert cache.lookup(("find", 1)).get() == 10
+
+
+def test_cache_case_of_ttl(tmp_path):
+    with SqliteCache(tmp_path / "cache.sqlite3", ttl=60, empty_ttl=0.05)\
+            as cache:
+        cache.store("present", 1)
+        cache.store("empty", None)
+        cache.flush()
+        time.sleep(0.1)
+
+        assert cache.lookup("present").get() == 1
+        assert cache.lookup("empty") is None
+        assert cache.purge() == 1
+
+
+def test_cache_case_of_key_serializer(tmp_path):
+    with SqliteCache(tmp_path / "cache.sqlite3", key_serializer=str.lower)\
+            as cache:
+        cache.store("FOO", 1)
+
+        assert cache.lookup("foo").get() == 1
+
+
+def test_cache_case_of_equal_keys_of_distinct_objects(tmp_path):
+    first: str = "".join(["f", "oo"])
+    second: str = "".join(["fo", "o"])
+
+    with SqliteCache(tmp_path / "cache.sqlite3", flush_size=1) as cache:
+        cache.store((first, first), 1)
+
+        assert cache.lookup((first, second)).get() == 1
+
+
+def test_cache_case_of_finished_threads(tmp_path):
+    with SqliteCache(tmp_path / "cache.sqlite3") as cache:
+        for i in range(50):
+            thread: threading.Thread = threading.Thread(
+                target=cache.lookup, args=(i,))
+            thread.start()
+            thread.join()
+        cache.lookup(0)
+
+        assert len(cache._connections) <= 2
+
+
+def test_cache_case_of_clear(tmp_path):
+    with SqliteCache(tmp_path / "cache.sqlite3", flush_size=1) as cache:
+        cache.store(1, 1)
+        cache.clear()
+
+        assert cache.lookup(1) is None
+
+
+def test_cache_case_of_invalid_flush_size(tmp_path):
+    with pytest.raises(Exception) as excinfo:
+        SqliteCache(tmp_path / "cache.sqlite3", flush_size=0)
+
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_cache_case_of_processes(tmp_path):
+    path: str = str(tmp_path / "cache.sqlite3")
+    SqliteCache(path).close()
+    processes: list[multiprocessing.Process] = [
+        multiprocessing.Process(target=_store_from_process, args=(path, i))
+        for i in (0, 50, 100)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    with SqliteCache(path) as cache:
+        assert all(cache.lookup(i).get() == i * 2 for i in range(150))
+
+
+def test_cache_case_of_wrap(tmp_path):
+    cache: SqliteCache = SqliteCache(tmp_path / "cache.sqlite3")
+
+    @nullable_wrap(cache=cache)
+    def find_even(val: int) -> Optional[int]:
+        _calls.append(val)
+        return val if val % 2 == 0 else None
+
+    _calls.clear()
+    results = [find_even(i) for i in (1, 2, 1, 2)]
+
+    assert [result.isPresent() for result in results]\
+        == [False, True, False, True]
+    assert _calls == [1, 2]
+    cache.close()
+
+
+def test_cache_case_of_wrap_executor(tmp_path):
+    cache: SqliteCache = SqliteCache(tmp_path / "cache.sqlite3")
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2)
+
+    @nullable_wrap(executor=executor, cache=cache)
+    def find_even(val: int) -> Optional[int]:
+        _calls.append(val)
+        return val if val % 2 == 0 else None
+
+    _calls.clear()
+    assert find_even(2).result().get() == 2
+    assert find_even(2).result().get() == 2
+    assert find_even(val=3).result().isEmpty()
+    assert _calls == [2, 3]
+    executor.shutdown()
+    cache.close()
@@ -0,0 +1,87 @@
+import pathlib
+from typing import Iterator, Optional
+import pytest
+from py_nullable import Nullable, NullableColumn, write_column
+
+
+def test_write_column_case_of_mixed_values(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "column.pync"
+    written: int = write_column(
+        path, [1.5, None, Nullable[float](2.5), Nullable[float](None)])
+
+    assert written == 4
+    with NullableColumn(path) as column:
+        assert len(column) == 4
+        assert column.typecode == "d"
+        assert column[0].get() == 1.5
+        assert column[1].isEmpty()
+        assert column[2].get() == 2.5
+        assert column[-1].isEmpty()
+
+
+def test_write_column_case_of_invalid_typecode(tmp_path: pathlib.Path):
+    with pytest.raises(Exception) as excinfo:
+        write_column(tmp_path / "column.pync", [1], typecode="u")
+
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_column_case_of_large_stream(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "column.pync"
+    expected: list[Optional[int]] = [
+        None if i % 3 == 0 else i for i in range(200003)]
+    write_column(path, iter(expected), typecode="q")
+
+    with NullableColumn(path) as column:
+        assert list(column.iter_optional()) == expected
+        assert list(column.iter_optional(65533, 65547))\
+            == expected[65533:65547]
+        assert column[200002].get() == 200002
+        assert column[199998].isEmpty()
+
+
+def test_column_iter_case_of_nullable(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "column.pync"
+    write_column(path, [None, 3], typecode="i")
+
+    with NullableColumn(path) as column:
+        actual: list[Nullable[int]] = list(column)
+        assert actual[0].isEmpty()
+        assert actual[1].get() == 3
+
+
+def test_column_close_case_of_partial_iteration(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "column.pync"
+    write_column(path, [1, None, 3], typecode="i")
+
+    with NullableColumn(path) as column:
+        for value in column:
+            break
+        values: Iterator[Optional[int]] = column.iter_optional(1)
+        assert next(values) is None
+
+    assert value.get() == 1
+    column.close()
+
+
+def test_column_case_of_out_of_range(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "column.pync"
+    write_column(path, [])
+
+    with NullableColumn(path) as column:
+        assert len(column) == 0
+        assert list(column) == []
+        with pytest.raises(Exception) as excinfo:
+            column[0]
+
+    assert excinfo.errisinstance(IndexError)
+
+
+def test_column_case_of_invalid_file(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "column.pync"
+    path.write_bytes(b"not a column file, just some bytes")
+
+    with pytest.raises(Exception) as excinfo:
+        NullableColumn(path)
+
+    assert excinfo.errisinstance(ValueError)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor,\
+    ThreadPoolExecutor, TimeoutError
+from typing import Optional
+import pytest
+from py_nullable import Nullable, nullable_wrap, nullable_batch,\
+    IncompleteCallBackException
+
+# the decorated functions below are bound to these executors on import,
+# and a function run in a process pool must be found by name.
+_thread_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=4)
+_single_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+_process_pool: ProcessPoolExecutor = ProcessPoolExecutor(max_workers=1)
+_release: threading.Event = threading.Event()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def executors():
+    yield
+    _release.set()
+    for executor in (_thread_pool, _single_pool, _process_pool):
+        executor.shutdown()
+
+
+@nullable_wrap(executor=_thread_pool)
+def find_in_thread(val: int) -> Optional[str]:
+    return str(val) if val % 2 == 0 else None
+
+
+@nullable_wrap(executor=_thread_pool, timeout=0.05)
+def find_slowly(val: int) -> Optional[str]:
+    _release.wait(1)
+    return str(val)
+
+
+@nullable_wrap(executor=_thread_pool, timeout=0.05, raise_on_timeout=True)
+def find_slowly_or_raise(val: int) -> Optional[str]:
+    _release.wait(1)
+    return str(val)
+
+
+@nullable_wrap(executor=_single_pool, timeout=0.2)
+def find_queued(val: int) -> Optional[str]:
+    _release.wait(1)
+    return str(val)
+
+
+@nullable_wrap(executor=_single_pool, timeout=0.2, raise_on_timeout=True)
+def find_queued_or_raise(val: int) -> Optional[str]:
+    _release.wait(1)
+    return str(val)
+
+
+@nullable_wrap(executor=_thread_pool)
+def divide(x: int, y: int) -> Optional[float]:
+    return x / y
+
+
+@nullable_wrap(executor=_process_pool)
+def find_in_process(val: int) -> Optional[int]:
+    return val * 2 if val > 0 else None
+
+
+def test_nullable_wrap_executor_case_of_future():
+    present: Future[Nullable[str]] = find_in_thread(2)
+    empty: Future[Nullable[str]] = find_in_thread(1)
+
+    assert isinstance(present, Future)
+    assert present.result(1).get() == "2"
+    assert empty.result(1).isEmpty()
+
+
+def test_nullable_wrap_executor_case_of_exception():
+    with pytest.raises(Exception) as excinfo:
+        divide(1, 0).result(1)
+
+    assert excinfo.errisinstance(ZeroDivisionError)
+
+
+def test_nullable_wrap_executor_case_of_timeout():
+    _release.clear()
+    started: float = time.monotonic()
+    actual: Nullable[str] = find_slowly(1).result(1)
+    _release.set()
+
+    assert actual.isEmpty()
+    assert time.monotonic() - started < 0.5
+
+
+def test_nullable_wrap_executor_case_of_timeout_raised():
+    _release.clear()
+    future: Future[Nullable[str]] = find_slowly_or_raise(1)
+    with pytest.raises(Exception) as excinfo:
+        future.result(1)
+    _release.set()
+
+    assert excinfo.errisinstance(TimeoutError)
+
+
+def test_nullable_wrap_executor_case_of_queued_timeout():
+    _release.clear()
+    running: Future[Nullable[str]] = find_queued(1)
+    queued: Future[Nullable[str]] = find_queued(2)
+    raised: Future[Nullable[str]] = find_queued_or_raise(3)
+
+    assert running.result(1).isEmpty()
+    assert queued.result(1).isEmpty()
+    with pytest.raises(Exception) as excinfo:
+        raised.result(1)
+    _release.set()
+
+    assert excinfo.errisinstance(TimeoutError)
+    assert not queued.cancelled()
+
+
+def test_nullable_wrap_executor_case_of_nested_settlement():
+    _release.clear()
+    settled: threading.Event = threading.Event()
+    results: list[Nullable[str]] = []
+
+    def _(future: Future[Nullable[str]]) -> None:
+        results.append(find_in_thread(4).result(1))
+        settled.set()
+
+    find_slowly(1).add_done_callback(_)
+
+    assert settled.wait(2)
+    _release.set()
+    assert results[0].get() == "4"
+
+
+def test_nullable_wrap_executor_case_of_per_call_timeout():
+    _release.set()
+    actual: Nullable[str] = find_slowly.with_timeout(None)(3).result(1)
+
+    assert actual.get() == "3"
+
+
+def test_nullable_wrap_executor_case_of_asyncio():
+    async def lookup() -> list[Nullable[str]]:
+        return list(await asyncio.gather(find_in_thread(4), find_in_thread(5)))
+
+    actual: list[Nullable[str]] = asyncio.run(lookup())
+
+    assert actual[0].get() == "4"
+    assert actual[1].isEmpty()
+
+
+def test_nullable_wrap_executor_case_of_asyncio_timeout():
+    _release.clear()
+
+    async def lookup() -> Nullable[str]:
+        return await find_slowly(1)
+
+    actual: Nullable[str] = asyncio.run(lookup())
+    _release.set()
+
+    assert actual.isEmpty()
+
+
+def test_nullable_wrap_executor_case_of_process_pool():
+    assert find_in_process(2).result(5).get() == 4
+    assert find_in_process(0).result(5).isEmpty()
+
+
+_batch_calls: list[list[str]] = []
+_users: dict[str, str] = {"A001": "foo", "A002": "bar"}
+
+
+def find_all(ids: list[str]) -> dict[str, str]:
+    _batch_calls.append(ids)
+    return {id: _users[id] for id in ids if id in _users}
+
+
+async def find_all_async(ids: list[str]) -> dict[str, str]:
+    return find_all(ids)
+
+
+def find_all_broken(ids: list[str]) -> dict[str, str]:
+    raise KeyError("backend unavailable")
+
+
+class Interrupted(BaseException):
+    pass
+
+
+def find_all_interrupted(ids: list[str]) -> dict[str, str]:
+    raise Interrupted()
+
+
+@nullable_batch(find_all, max_batch=3, max_wait_ms=50)
+def find_by_id(id: str) -> str:
+    return id
+
+
+@nullable_batch(find_all_async)
+def find_by_id_async(id: str) -> str:
+    return id
+
+
+@nullable_batch(find_all_broken)
+def find_by_id_broken(id: str) -> str:
+    return id
+
+
+@nullable_batch(find_all_interrupted, max_wait_ms=100)
+def find_by_id_interrupted(id: str) -> str:
+    return id
+
+
+def test_nullable_batch_case_of_asyncio():
+    _batch_calls.clear()
+
+    async def lookup() -> list[Nullable[str]]:
+        return list(await asyncio.gather(
+            find_by_id_async("A001"), find_by_id_async("B001"),
+            find_by_id_async("A001")))
+
+    actual: list[Nullable[str]] = asyncio.run(lookup())
+
+    assert _batch_calls == [["A001", "B001"]]
+    assert actual[0].get() == "foo"
+    assert actual[1].isEmpty()
+    assert actual[2].get() == "foo"
+
+
+def test_nullable_batch_case_of_max_batch():
+    _batch_calls.clear()
+
+    async def lookup() -> list[Nullable[str]]:
+        return list(await asyncio.gather(
+            *[find_by_id(id) for id in ("A001", "A002", "B001", "B002")]))
+
+    actual: list[Nullable[str]] = asyncio.run(lookup())
+
+    assert _batch_calls == [["A001", "A002", "B001"], ["B002"]]
+    assert [nullable.isPresent() for nullable in actual]\
+        == [True, True, False, False]
+
+
+def test_nullable_batch_case_of_threads():
+    _batch_calls.clear()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        actual: list[Nullable[str]] = list(
+            pool.map(find_by_id, ["A001", "A002", "B001"]))
+
+    assert sorted(id for ids in _batch_calls for id in ids)\
+        == ["A001", "A002", "B001"]
+    assert actual[0].get() == "foo"
+    assert actual[1].get() == "bar"
+    assert actual[2].isEmpty()
+
+
+def test_nullable_batch_case_of_incomplete_callback():
+    with pytest.raises(Exception) as excinfo:
+        find_by_id_broken("A001")
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+    assert "backend unavailable" in str(excinfo.value)
+
+    async def lookup() -> Nullable[str]:
+        return await find_by_id_broken("A001")
+
+    with pytest.raises(Exception) as excinfo:
+        asyncio.run(lookup())
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+
+def test_nullable_batch_case_of_interrupted_leader():
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures: list[Future[Nullable[str]]] = [
+            pool.submit(find_by_id_interrupted, id)
+            for id in ("A001", "A002", "B001")]
+        errors: list[Optional[BaseException]] = [
+            future.exception(5) for future in futures]
+
+    assert sorted(type(error).__name__ for error in errors)\
+        == ["IncompleteCallBackException", "IncompleteCallBackException",
+            "Interrupted"]
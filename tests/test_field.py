@@ -0,0 +1,108 @@
+import sys
+from dataclasses import dataclass
+import pytest
+from py_nullable import Nullable, NullableField
+
+
+@dataclass
+class User:
+    name: str
+    email: NullableField[str] = NullableField(None)
+
+
+@dataclass
+class Account:
+    owner: NullableField[str] = NullableField()
+    nickname: NullableField[str] = NullableField("anonymous")
+
+
+class Point:
+    __slots__ = ["_x", "_y"]
+
+    x: NullableField[int] = NullableField()
+    y: NullableField[int] = NullableField()
+
+
+class Renamed:
+    __slots__ = ["storage"]
+
+    value: NullableField[int] = NullableField(slot="storage")
+
+
+def test_field_case_of_dataclass():
+    user: User = User("foo")
+
+    assert user.email.isEmpty()
+    assert user.email is Nullable.empty()
+
+    user.email = "foo@example.com"
+
+    assert user.email.get() == "foo@example.com"
+    assert user.email is user.email
+    assert User("bar", "bar@example.com").email.get() == "bar@example.com"
+
+
+def test_field_case_of_dataclass_default():
+    account: Account = Account("foo")
+
+    assert account.owner.get() == "foo"
+    assert account.nickname.get() == "anonymous"
+    assert Account(None).owner.isEmpty()
+    with pytest.raises(Exception) as excinfo:
+        Account()
+
+    assert excinfo.errisinstance(TypeError)
+
+
+def test_field_case_of_slots():
+    point: Point = Point()
+
+    assert point.x.isEmpty()
+
+    point.x = 1
+    point.y = Nullable[int](2)
+    del point.x
+
+    assert point.x is Nullable.empty()
+    assert point.y.get() == 2
+    assert not hasattr(point, "__dict__")
+
+
+def test_field_case_of_slot_name():
+    target: Renamed = Renamed()
+    target.value = 1
+
+    assert target.storage.get() == 1
+    assert target.value is target.storage
+
+
+def test_field_case_of_nullable_assigned():
+    nullable: Nullable[str] = Nullable[str]("foo")
+    user: User = User("foo", nullable)
+
+    assert user.email is nullable
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10),
+                    reason="dataclass(slots=True) requires Python 3.10")
+def test_field_case_of_dataclass_slots():
+    @dataclass(slots=True)
+    class Contact:
+        name: str
+        email: NullableField[str] = NullableField(None)
+
+    contact: Contact = Contact("foo")
+
+    assert contact.email is Nullable.empty()
+    assert Contact("bar", "bar@example.com").email.get() == "bar@example.com"
+
+    contact.email = "foo@example.com"
+
+    assert contact.email.get() == "foo@example.com"
+    assert contact.email is contact.email
+
+    del contact.email
+
+    assert contact.email is Nullable.empty()
+    assert not hasattr(contact, "__dict__")
+    assert Contact.email is None
@@ -0,0 +1,162 @@
+from __future__ import annotations
+import pickle
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Optional
+import pytest
+from py_nullable import Aggregation, Nullable, NullableRecord,\
+    UncallableException, aggregate
+
+_AGGS: dict[str, tuple[Any, str]] = {
+    "orders": ("amount", "count"),
+    "total": ("amount", "sum"),
+    "average": ("amount", "mean"),
+    "lowest": ("amount", "min"),
+    "highest": ("amount", "max"),
+}
+
+_ORDERS: list[dict[str, Any]] = [
+    {"region": "EU", "amount": 10},
+    {"region": "EU", "amount": None},
+    {"region": "EU", "amount": Nullable(30)},
+    {"region": "US", "amount": Nullable(None)},
+    {"region": "US"},
+]
+
+
+@dataclass
+class Order:
+    region: str
+    amount: Optional[float]
+
+
+def _values(results: dict[str, Nullable[Any]]) -> dict[str, Any]:
+    return {name: result.orElse(None) for name, result in results.items()}
+
+
+def test_aggregate_case_of_present_values():
+    totals: Aggregation[str] = aggregate(_ORDERS, key="region", aggs=_AGGS)
+
+    assert list(totals) == ["EU", "US"]
+    assert _values(totals["EU"]) == {
+        "orders": 2, "total": 40, "average": 20, "lowest": 10,
+        "highest": 30}
+
+
+def test_aggregate_case_of_no_present_values():
+    totals: Aggregation[str] = aggregate(_ORDERS, key="region", aggs=_AGGS)
+    results: dict[str, Nullable[Any]] = totals["US"]
+
+    assert results["orders"].get() == 0
+    assert all(results[name].isEmpty()
+               for name in ("total", "average", "lowest", "highest"))
+
+
+def test_aggregate_case_of_counts():
+    totals: Aggregation[str] = aggregate(_ORDERS, key="region", aggs=_AGGS)
+
+    assert totals.rows("EU") == 3
+    assert totals.present_count("EU", "total") == 2
+    assert totals.empty_count("EU", "total") == 1
+    assert totals.present_count("US", "total") == 0
+    assert totals.empty_count("US", "total") == 2
+
+
+def test_aggregate_case_of_objects_and_callables():
+    orders: list[Order] = [Order("EU", 1.5), Order("EU", None),
+                           Order("US", 2.0)]
+    totals: Aggregation[str] = aggregate(
+        orders, key=lambda order: order.region.lower(),
+        aggs={"total": ("amount", "sum"),
+              "doubled": (lambda order: order.amount and order.amount * 2,
+                          "max")})
+
+    assert _values(totals["eu"]) == {"total": 1.5, "doubled": 3.0}
+    assert _values(totals["us"]) == {"total": 2.0, "doubled": 4.0}
+
+
+def test_aggregate_case_of_nullable_records_and_keys():
+    Row = NullableRecord("Row", ["region", "amount"])
+    rows: list[Any] = [Row("EU", 1), Row(None, 2), Row(None, None)]
+    totals: Aggregation[Any] = aggregate(
+        rows, key="region", aggs={"total": ("amount", "sum")})
+
+    assert _values(totals["EU"]) == {"total": 1}
+    assert _values(totals[None]) == {"total": 2}
+    assert totals.empty_count(None, "total") == 1
+
+
+def test_aggregate_case_of_streaming():
+    def _() -> Any:
+        for i in range(1000):
+            yield {"group": i % 3, "value": i if i % 2 else None}
+
+    totals: Aggregation[int] = aggregate(
+        _(), key="group", aggs={"total": ("value", "sum")})
+    expected: int = sum(i for i in range(1000) if i % 2 and i % 3 == 0)
+
+    assert len(totals) == 3
+    assert totals[0]["total"].get() == expected
+
+
+def test_aggregate_case_of_timedelta():
+    def _(minutes: list[Optional[int]]) -> list[dict[str, Any]]:
+        return [{"user": "foo",
+                 "spent": None if m is None else timedelta(minutes=m)}
+                for m in minutes]
+
+    aggs: dict[str, tuple[Any, str]] = {
+        "total": ("spent", "sum"), "average": ("spent", "mean")}
+    first: Aggregation[str] = aggregate(_([10, None, 20]), "user", aggs)
+    second: Aggregation[str] = aggregate(_([30]), "user", aggs)
+
+    assert _values(first["foo"]) == {
+        "total": timedelta(minutes=30), "average": timedelta(minutes=15)}
+    assert _values(first.merge(second)["foo"]) == {
+        "total": timedelta(minutes=60), "average": timedelta(minutes=20)}
+
+
+def test_aggregation_case_of_update_and_merge():
+    whole: Aggregation[str] = aggregate(_ORDERS, key="region", aggs=_AGGS)
+    first: Aggregation[str] = aggregate(_ORDERS[:2], key="region", aggs=_AGGS)
+    second: Aggregation[str] = Aggregation("region", _AGGS)
+    second.update(_ORDERS[2:3]).update(_ORDERS[3:])
+    merged: Aggregation[str] = first.merge(second)
+
+    assert {group: _values(results)
+            for group, results in merged.results().items()}\
+        == {group: _values(results)
+            for group, results in whole.results().items()}
+    assert merged.empty_count("EU", "total") == 1
+    assert _values(first["EU"])["total"] == 10
+
+
+def test_aggregation_case_of_pickle():
+    totals: Aggregation[str] = aggregate(_ORDERS, key="region", aggs=_AGGS)
+    restored: Aggregation[str] = pickle.loads(pickle.dumps(totals))
+
+    assert _values(restored.merge(totals)["EU"])["total"] == 80
+
+
+def test_aggregation_case_of_merge_different_specifications():
+    first: Aggregation[str] = Aggregation("region", _AGGS)
+    second: Aggregation[str] = Aggregation(
+        "region", {"total": ("amount", "sum")})
+    with pytest.raises(Exception) as excinfo:
+        first.merge(second)
+
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_aggregation_case_of_unknown_operation():
+    with pytest.raises(Exception) as excinfo:
+        Aggregation("region", {"median": ("amount", "median")})
+
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_aggregation_case_of_uncallable():
+    with pytest.raises(Exception) as excinfo:
+        Aggregation(1, _AGGS)
+
+    assert excinfo.errisinstance(UncallableException)
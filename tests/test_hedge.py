@@ -0,0 +1,132 @@
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import pytest
+from py_nullable import Nullable, IncompleteCallBackException,\
+    UncallableException
+
+_thread_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=4)
+
+
+def slow(value: Optional[str], seconds: float, calls: list[str]):
+    def _() -> Optional[str]:
+        calls.append(str(value))
+        time.sleep(seconds)
+        return value
+    return _
+
+
+def broken(calls: list[str]):
+    def _() -> Optional[str]:
+        calls.append("broken")
+        raise KeyError("replica unavailable")
+    return _
+
+
+def test_first_present_concurrent_case_of_parallel():
+    calls: list[str] = []
+    started: float = time.monotonic()
+    actual: Nullable[str] = Nullable.firstPresentConcurrent(
+        slow("a", 0.5, calls), slow("b", 0.01, calls), slow(None, 0, calls),
+        executor=_thread_pool)
+
+    assert actual.get() == "b"
+    assert time.monotonic() - started < 0.4
+    assert sorted(calls) == ["None", "a", "b"]
+
+
+def test_first_present_concurrent_case_of_hedge():
+    calls: list[str] = []
+    actual: Nullable[str] = Nullable.firstPresentConcurrent(
+        slow("a", 0.01, calls), slow("b", 0, calls), hedge_after_ms=500)
+
+    assert actual.get() == "a"
+    assert calls == ["a"]
+
+    calls.clear()
+    started: float = time.monotonic()
+    actual = Nullable.firstPresentConcurrent(
+        slow("a", 0.5, calls), slow("b", 0, calls), hedge_after_ms=20)
+
+    assert actual.get() == "b"
+    assert time.monotonic() - started < 0.4
+    assert calls == ["a", "b"]
+
+
+def test_first_present_concurrent_case_of_empty_and_failure():
+    calls: list[str] = []
+    actual: Nullable[str] = Nullable.firstPresentConcurrent(
+        broken(calls), slow(None, 0, calls),
+        lambda: Nullable[str]("c"), hedge_after_ms=1000)
+
+    assert actual.get() == "c"
+    assert Nullable.firstPresentConcurrent(
+        broken(calls), slow(None, 0, calls)).isEmpty()
+    assert Nullable.firstPresentConcurrent().isEmpty()
+
+
+def test_first_present_concurrent_case_of_all_failed():
+    calls: list[str] = []
+    with pytest.raises(Exception) as excinfo:
+        Nullable.firstPresentConcurrent(
+            broken(calls), broken(calls), executor=_thread_pool)
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+    assert len(excinfo.value.causes) == 2
+    assert all(isinstance(e, KeyError) for e in excinfo.value.causes)
+
+
+def test_first_present_concurrent_case_of_uncallable():
+    with pytest.raises(Exception) as excinfo:
+        Nullable.firstPresentConcurrent(lambda: "a", "b")
+
+    assert excinfo.errisinstance(UncallableException)
+
+
+def test_first_present_async():
+    cancelled: threading.Event = threading.Event()
+
+    async def replica(value: Optional[str], seconds: float) -> Optional[str]:
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return value
+
+    async def fail() -> Optional[str]:
+        raise KeyError("replica unavailable")
+
+    async def run() -> list[Nullable[str]]:
+        results: list[Nullable[str]] = [
+            await Nullable.firstPresentAsync(
+                lambda: replica("a", 1), lambda: replica("b", 0.01)),
+            await Nullable.firstPresentAsync(
+                fail, lambda: replica(None, 0), lambda: replica("c", 0),
+                hedge_after_ms=1000),
+            await Nullable.firstPresentAsync(
+                fail, lambda: replica(None, 0)),
+        ]
+        await asyncio.sleep(0)
+        return results
+
+    actual: list[Nullable[str]] = asyncio.run(run())
+
+    assert actual[0].get() == "b"
+    assert cancelled.is_set()
+    assert actual[1].get() == "c"
+    assert actual[2].isEmpty()
+
+
+def test_first_present_async_case_of_all_failed():
+    async def fail() -> Optional[str]:
+        raise KeyError("replica unavailable")
+
+    with pytest.raises(Exception) as excinfo:
+        asyncio.run(Nullable.firstPresentAsync(fail, fail, hedge_after_ms=1))
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+    assert len(excinfo.value.causes) == 2
@@ -0,0 +1,218 @@
+from __future__ import annotations
+import traceback
+from typing import Any, Callable, Optional
+import pytest
+from py_nullable import Nullable, nullable_inline, set_production_mode,\
+    IncompleteCallBackException, EmptyValueException, UncallableException
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+class Box:
+    """Object that is not a Nullable, but has a map method.
+    """
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def map(self, mapper: Callable[[Any], Any]) -> "Box":
+        return Box(mapper(self.value))
+
+    def orElse(self, other: Any) -> Any:
+        return self.value if self.value is not None else other
+
+
+@nullable_inline
+def map_filter_or_else(n: Nullable[int], limit: int = 5) -> int:
+    return n.map(lambda x: x * 2).filter(lambda x: x > limit).orElse(-1)
+
+
+@nullable_inline
+def map_named(n: Nullable[int]) -> Optional[str]:
+    result = n.map(double).map(str).orElse(None)
+    return result
+
+
+@nullable_inline
+def map_to_nullable(n: Nullable[int]) -> Nullable[int]:
+    return n.filter(lambda x: x % 2 == 0).map(lambda x: x // 2)
+
+
+@nullable_inline
+def map_get(n: Nullable[int]) -> str:
+    value: str = n.map(lambda x: f"#{x}").get()
+    return value
+
+
+@nullable_inline
+def map_is_present(n: Nullable[int]) -> tuple[bool, bool]:
+    present = n.map(lambda x: x or None).isPresent()
+    empty = n.map(lambda x: x or None).isEmpty()
+    return present, empty
+
+
+@nullable_inline
+def map_or_else_call(n: Nullable[int], calls: list[int]) -> int:
+    return n.map(lambda x: x + 1).orElse(calls.append(0) or len(calls))
+
+
+@nullable_inline
+def mutate_copy(n: Nullable[list[int]]) -> Optional[list[int]]:
+    return n.map(lambda x: x.append(0) or x).orElse(None)
+
+
+@nullable_inline
+def in_loop(values: list[Nullable[int]]) -> int:
+    total: int = 0
+    for value in values:
+        if value:
+            total += value.map(lambda x: x * x).orElse(0)
+        else:
+            value.map(lambda x: x / 0)
+    return total
+
+
+@nullable_inline
+def divide(n: Nullable[int]) -> float:
+    return n.map(lambda x: 1 / x).orElse(0.0)
+
+
+@nullable_inline
+def map_uncallable(n: Nullable[int]) -> Nullable[int]:
+    return n.map("not callable")
+
+
+@nullable_inline
+def comprehension(n: Nullable[list[int]]) -> list[int]:
+    return n.map(lambda xs: [x * 2 for x in xs]).orElse([])
+
+
+@nullable_inline
+def untouched(n: Nullable[int]) -> int:
+    return n.orElse(0)
+
+
+def make_closure(factor: int) -> Callable[[Nullable[int]], int]:
+    @nullable_inline
+    def _(n: Nullable[int]) -> int:
+        return n.map(lambda x: x * factor).orElse(0)
+    return _
+
+
+INPUTS: list[Any] = [
+    Nullable[int](3), Nullable[int](2), Nullable[int](0), Nullable[int](None),
+    Nullable.lazyOf(lambda: 4), Nullable.lazyOf(lambda: None),
+]
+
+
+def outcome(func: Callable[..., Any], *args: Any) -> Any:
+    try:
+        result: Any = func(*args)
+    except Exception as e:
+        return type(e)
+    return result.orElse("empty") if isinstance(result, Nullable) else result
+
+
+@pytest.mark.parametrize("func", [
+    map_filter_or_else, map_named, map_to_nullable, map_get, map_is_present,
+    divide, comprehension,
+])
+def test_nullable_inline_case_of_equivalence(func: Callable[..., Any]):
+    assert func is not func.__wrapped__
+    for argument in INPUTS:
+        assert outcome(func, argument) == outcome(func.__wrapped__, argument)
+
+
+def test_nullable_inline_case_of_defaults_and_annotations():
+    assert map_filter_or_else(Nullable[int](2), limit=3) == 4
+    assert map_filter_or_else.__name__ == "map_filter_or_else"
+    assert map_filter_or_else.__annotations__["limit"] == "int"
+    assert map_filter_or_else.__defaults__ == (5,)
+
+
+def test_nullable_inline_case_of_evaluation_order():
+    calls: list[int] = []
+
+    assert map_or_else_call(Nullable[int](1), calls) == 2
+    assert map_or_else_call(Nullable[int](None), calls) == 2
+    assert calls == [0, 0]
+
+
+def test_nullable_inline_case_of_copy():
+    source: list[int] = [1]
+
+    assert mutate_copy(Nullable(source)) == [1, 0]
+    assert source == [1]
+
+
+def test_nullable_inline_case_of_nested_statements():
+    values: list[Nullable[int]] = [
+        Nullable[int](1), Nullable[int](None), Nullable[int](3)]
+
+    assert in_loop(values) == 10
+
+
+def test_nullable_inline_case_of_other_receiver():
+    assert divide(Box(2)) == 0.5
+    assert divide(Box(4)) == 0.25
+
+
+def test_nullable_inline_case_of_incomplete_callback():
+    with pytest.raises(Exception) as excinfo:
+        divide(Nullable[int](0))
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+    assert "division by zero" in str(excinfo.value)
+    assert "lambda x: 1 / x" in str(excinfo.value)
+
+    line: int = traceback.extract_tb(
+        excinfo.value.__context__.__traceback__)[-1].lineno
+    source: list[str] = open(__file__).read().splitlines()
+
+    assert "n.map(lambda x: 1 / x)" in source[line - 1]
+
+
+def test_nullable_inline_case_of_production_mode():
+    set_production_mode(True)
+    try:
+        with pytest.raises(Exception) as excinfo:
+            divide(Nullable[int](0))
+    finally:
+        set_production_mode(False)
+
+    assert excinfo.errisinstance(ZeroDivisionError)
+
+
+def test_nullable_inline_case_of_exceptions():
+    with pytest.raises(Exception) as excinfo:
+        map_get(Nullable[int](None))
+
+    assert excinfo.errisinstance(EmptyValueException)
+
+    with pytest.raises(Exception) as excinfo:
+        map_uncallable(Nullable[int](None))
+
+    assert excinfo.errisinstance(UncallableException)
+
+
+def test_nullable_inline_case_of_empty_value_location():
+    with pytest.raises(Exception) as excinfo:
+        map_get(Nullable[int](None))
+    with pytest.raises(Exception) as expected:
+        map_get.__wrapped__(Nullable[int](None))
+
+    assert str(excinfo.value) == str(expected.value)
+    assert "#map_get " in str(excinfo.value)
+
+
+def test_nullable_inline_case_of_fallback():
+    closure: Callable[[Nullable[int]], int] = make_closure(3)
+
+    assert closure.__closure__
+    assert not hasattr(closure, "__wrapped__")
+    assert closure(Nullable[int](2)) == 6
+    assert not hasattr(untouched, "__wrapped__")
+    assert nullable_inline(map_named) is map_named
+    assert nullable_inline(len) is len
@@ -0,0 +1,56 @@
+from py_nullable import Nullable, present_values, partition
+
+
+class TestTarget:
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+def test_iter_case_of_present():
+    target: Nullable[str] = Nullable[str]("foo")
+    assert list(target) == ["foo"]
+    assert len(target) == 1
+    assert bool(target)
+
+
+def test_iter_case_of_empty():
+    target: Nullable[str] = Nullable[str](None)
+    assert list(target) == []
+    assert len(target) == 0
+    assert not target
+
+
+def test_bool_case_of_falsy_value():
+    assert Nullable[int](0)
+    assert Nullable[str]("")
+
+
+def test_iter_case_of_copied_value():
+    test_target: TestTarget = TestTarget(1)
+    target: Nullable[TestTarget] = Nullable[TestTarget](test_target)
+
+    actual: TestTarget = next(iter(target))
+
+    assert actual is not test_target
+    assert actual.value == test_target.value
+
+
+def test_present_values():
+    nullables: list[Nullable[int]] = [
+        Nullable[int](1), Nullable[int](None), Nullable[int](0),
+        Nullable.empty(), Nullable[int](3)]
+
+    assert list(present_values(nullables)) == [1, 0, 3]
+    assert list(present_values([])) == []
+
+
+def test_partition():
+    first: Nullable[int] = Nullable[int](1)
+    second: Nullable[int] = Nullable[int](None)
+    third: Nullable[int] = Nullable[int](3)
+
+    present, empty = partition(iter([first, second, third]))
+
+    assert present == [first, third]
+    assert empty == [second]
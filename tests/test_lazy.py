@@ -0,0 +1,102 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from py_nullable import Nullable, IncompleteCallBackException,\
+    UncallableException
+
+
+def counting_supplier(value):
+    calls: list[int] = []
+
+    def supplier():
+        calls.append(1)
+        time.sleep(0.01)
+        return value
+
+    return supplier, calls
+
+
+def test_lazyOf_case_of_unused():
+    supplier, calls = counting_supplier("foo")
+    Nullable.lazyOf(supplier)
+
+    assert calls == []
+
+
+def test_lazyOf_case_of_present():
+    supplier, calls = counting_supplier("foo")
+    target: Nullable[str] = Nullable.lazyOf(supplier)
+
+    assert target.isPresent()
+    assert target.get() == "foo"
+    assert target.map(str.upper).get() == "FOO"
+    assert calls == [1]
+
+
+def test_lazyOf_case_of_empty():
+    supplier, calls = counting_supplier(None)
+    target: Nullable[str] = Nullable.lazyOf(supplier)
+
+    assert target.isEmpty()
+    assert target.orElse("bar") == "bar"
+    assert calls == [1]
+
+
+def test_lazyOf_case_of_racing_threads():
+    supplier, calls = counting_supplier("foo")
+    target: Nullable[str] = Nullable.lazyOf(supplier)
+    barrier: threading.Barrier = threading.Barrier(16)
+
+    def access(_: int) -> str:
+        barrier.wait()
+        return target.get()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        actual: list[str] = list(pool.map(access, range(16)))
+
+    assert actual == ["foo"] * 16
+    assert calls == [1]
+
+
+def test_lazyOf_case_of_incomplete_callback():
+    calls: list[int] = []
+
+    def supplier():
+        calls.append(1)
+        return 1 / 0
+
+    target: Nullable[float] = Nullable.lazyOf(supplier)
+    for _ in range(2):
+        with pytest.raises(Exception) as excinfo:
+            target.get()
+
+        assert excinfo.errisinstance(IncompleteCallBackException)
+        assert "division by zero" in str(excinfo.value)
+
+    assert calls == [1]
+
+
+def test_lazyOf_case_of_retry():
+    outcomes: list[object] = [ValueError("unavailable"), "foo"]
+
+    def supplier():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    target: Nullable[str] = Nullable.lazyOf(supplier, retry=True)
+    with pytest.raises(Exception) as excinfo:
+        target.isPresent()
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+    assert target.get() == "foo"
+    assert target.get() == "foo"
+
+
+def test_lazyOf_case_of_invalid_callback():
+    with pytest.raises(Exception) as excinfo:
+        Nullable.lazyOf("1")  # type: ignore
+
+    assert excinfo.errisinstance(UncallableException)
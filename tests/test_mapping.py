@@ -0,0 +1,49 @@
+from typing import Any, Optional
+from py_nullable import Nullable, NullableMapping
+
+
+def test_mapping_get_case_of_present():
+    source: dict[str, Optional[int]] = {"a": 1, "b": None}
+    target: NullableMapping[str, int] = NullableMapping(source)
+
+    assert target.get("a").get() == 1
+    assert target.get("b").isEmpty()
+    assert target.get("c").isEmpty()
+    assert target.get("c") is Nullable.empty()
+
+
+def test_mapping_case_of_view():
+    source: dict[str, Optional[int]] = {}
+    target: NullableMapping[str, int] = NullableMapping(source)
+    source["a"] = 1
+
+    assert target.is_present("a")
+    assert "a" in target
+    assert "b" not in target
+    assert len(target) == 1
+    assert list(target) == ["a"]
+
+
+def test_mapping_get_many():
+    target: NullableMapping[str, int] = NullableMapping({"a": 1, "b": 2})
+
+    actual: list[int] = [
+        nullable.orElse(0) for nullable in target.get_many(["b", "x", "a"])]
+
+    assert actual == [2, 0, 1]
+
+
+def test_mapping_get_path():
+    source: dict[str, Any] = {"db": {"host": "localhost", "port": None}}
+    target: NullableMapping[str, Any] = NullableMapping(source)
+
+    assert target.get_path(("db", "host")).get() == "localhost"
+    assert target.get_path(("db", "port")).isEmpty()
+    assert target.get_path(("db", "host", "name")).isEmpty()
+    assert target.get_path(("cache", "host")).isEmpty()
+    assert target.get_path(()).get() == source
+
+
+def test_empty_case_of_shared():
+    assert Nullable.empty() is Nullable.empty()
+    assert Nullable.empty().isEmpty()
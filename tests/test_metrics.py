@@ -0,0 +1,169 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import pytest
+from py_nullable import Nullable, NullableMetrics, MetricsRegistry,\
+    default_registry, nullable_wrap
+
+_registry: MetricsRegistry = MetricsRegistry()
+_thread_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2)
+
+
+@nullable_wrap(metrics=_registry)
+def find_even(val: int) -> Optional[int]:
+    if val < 0:
+        raise ValueError(val)
+    return val if val % 2 == 0 else None
+
+
+@nullable_wrap(executor=_thread_pool, metrics=_registry)
+def find_even_in_thread(val: int) -> Optional[int]:
+    return val if val % 2 == 0 else None
+
+
+@nullable_wrap(metrics=True)
+def find_registered(val: int) -> Optional[int]:
+    return val
+
+
+def test_metrics_case_of_sync_calls():
+    metrics: NullableMetrics = find_even.metrics
+    for i in range(10):
+        find_even(i)
+    with pytest.raises(Exception) as excinfo:
+        find_even(-1)
+
+    assert excinfo.errisinstance(ValueError)
+    assert metrics.calls == 11
+    assert metrics.empties == 5
+    assert metrics.errors == 1
+    assert metrics.empty_rate == 0.5
+    assert metrics.sum > 0
+    assert metrics.cumulative_buckets()[-1] == (float("inf"), 11)
+
+
+def test_metrics_case_of_threads():
+    metrics: NullableMetrics = NullableMetrics("threads")
+
+    def record() -> None:
+        for _ in range(1000):
+            metrics.observe(0.001, False)
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.calls == 4000
+    assert dict(metrics.cumulative_buckets())[0.001] == 4000
+    assert dict(metrics.cumulative_buckets())[0.0005] == 0
+
+
+def test_metrics_case_of_short_lived_threads():
+    metrics: NullableMetrics = NullableMetrics("short")
+    for _ in range(50):
+        thread: threading.Thread = threading.Thread(
+            target=metrics.observe, args=(0.001, True))
+        thread.start()
+        thread.join()
+
+    assert metrics.calls == 50
+    assert metrics.empties == 50
+    assert len(metrics._shards) == 0
+
+    metrics.observe(0.001, False)
+
+    assert metrics.calls == 51
+    assert len(metrics._shards) == 1
+
+
+def test_metrics_case_of_executor():
+    metrics: NullableMetrics = find_even_in_thread.metrics
+    find_even_in_thread(2).result(1)
+    find_even_in_thread(3).result(1)
+
+    async def lookup() -> Nullable[int]:
+        return await find_even_in_thread(5)
+
+    assert asyncio.run(lookup()).isEmpty()
+    assert metrics.calls == 3
+    assert metrics.empties == 2
+
+
+def test_metrics_case_of_default_registry():
+    find_registered(1)
+
+    assert find_registered.metrics in list(default_registry)
+    assert find_registered.metrics.calls == 1
+
+
+def test_registry_render_prometheus():
+    registry: MetricsRegistry = MetricsRegistry(prefix="app")
+    metrics: NullableMetrics = registry.metrics(
+        "mod.\"quoted\"\\name", buckets=[0.1, 1])
+    metrics.observe(0.05, True)
+    metrics.observe(0.5, False)
+    metrics.observe_error(2)
+
+    assert registry.metrics("mod.\"quoted\"\\name") is metrics
+    assert registry.render_prometheus() == "\n".join([
+        "# HELP app_calls_total Calls of the function.",
+        "# TYPE app_calls_total counter",
+        "app_calls_total{function=\"mod.\\\"quoted\\\"\\\\name\"} 3",
+        "# HELP app_empty_total Calls that returned an empty Nullable.",
+        "# TYPE app_empty_total counter",
+        "app_empty_total{function=\"mod.\\\"quoted\\\"\\\\name\"} 1",
+        "# HELP app_errors_total Calls that raised an exception.",
+        "# TYPE app_errors_total counter",
+        "app_errors_total{function=\"mod.\\\"quoted\\\"\\\\name\"} 1",
+        "# HELP app_call_duration_seconds Duration of the calls.",
+        "# TYPE app_call_duration_seconds histogram",
+        "app_call_duration_seconds_bucket"
+        "{function=\"mod.\\\"quoted\\\"\\\\name\",le=\"0.1\"} 1",
+        "app_call_duration_seconds_bucket"
+        "{function=\"mod.\\\"quoted\\\"\\\\name\",le=\"1\"} 2",
+        "app_call_duration_seconds_bucket"
+        "{function=\"mod.\\\"quoted\\\"\\\\name\",le=\"+Inf\"} 3",
+        "app_call_duration_seconds_sum"
+        "{function=\"mod.\\\"quoted\\\"\\\\name\"} 2.55",
+        "app_call_duration_seconds_count"
+        "{function=\"mod.\\\"quoted\\\"\\\\name\"} 3",
+    ]) + "\n"
+
+
+def test_registry_render_prometheus_case_of_concurrent_calls():
+    registry: MetricsRegistry = MetricsRegistry(prefix="app")
+    metrics: NullableMetrics = registry.metrics("concurrent")
+    stop: threading.Event = threading.Event()
+
+    def record() -> None:
+        while not stop.is_set():
+            metrics.observe(0.001, True)
+
+    thread: threading.Thread = threading.Thread(target=record)
+    thread.start()
+    try:
+        for _ in range(1000):
+            values: dict[str, int] = {
+                line.split("{", 1)[0]
+                + ("_inf" if "+Inf" in line else ""): int(line.split()[-1])
+                for line in registry.render_prometheus().splitlines()
+                if not line.startswith("#") and "_sum" not in line}
+
+            assert values["app_calls_total"]\
+                == values["app_call_duration_seconds_count"]\
+                == values["app_call_duration_seconds_bucket_inf"]
+            assert values["app_empty_total"] <= values["app_calls_total"]
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_metrics_case_of_invalid_buckets():
+    with pytest.raises(Exception) as excinfo:
+        NullableMetrics("invalid", buckets=[1, 0.5])
+
+    assert excinfo.errisinstance(ValueError)
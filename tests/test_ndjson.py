@@ -0,0 +1,116 @@
+import copy
+import io
+import pathlib
+import pickle
+import pytest
+from py_nullable import Nullable, NullableRow, read_ndjson,\
+    IncompleteCallBackException
+
+_NDJSON: str = """{"name": "foo", "age": 20, "extra": [1, 2]}
+
+{"name": "bar", "age": null}
+{"age": "unknown"}
+"""
+
+
+def test_read_ndjson_case_of_path(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "users.ndjson"
+    path.write_text(_NDJSON)
+
+    rows: list[NullableRow] = list(read_ndjson(path, ["name", "age"]))
+
+    assert len(rows) == 3
+    assert rows[0].name.get() == "foo"
+    assert rows[0]["age"].get() == 20
+    assert rows[1].age.isEmpty()
+    assert rows[2][0].isEmpty()
+    assert rows[0].keys() == ("name", "age")
+    assert rows[0].to_dict() == {"name": "foo", "age": 20}
+
+
+def test_read_ndjson_case_of_undeclared_field():
+    row: NullableRow = next(read_ndjson(io.StringIO(_NDJSON), ["name"]))
+
+    with pytest.raises(Exception) as excinfo:
+        row.extra
+
+    assert excinfo.errisinstance(AttributeError)
+    assert len(row) == 1
+
+
+def test_read_ndjson_case_of_converter():
+    rows: list[NullableRow] = list(
+        read_ndjson(io.StringIO(_NDJSON), {"name": str.upper, "age": int}))
+
+    assert rows[0].name.get() == "FOO"
+    assert [nullable.orElse(None) for nullable in rows[1]] == ["BAR", None]
+
+    with pytest.raises(Exception) as excinfo:
+        rows[2].age
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+
+def test_read_ndjson_case_of_small_chunks():
+    source: io.StringIO = io.StringIO(
+        "".join(f'{{"id": {i}}}\n' for i in range(1000)))
+
+    ids: list[int] = [
+        row.id.get() for row in read_ndjson(source, ["id"], chunk_size=64)]
+
+    assert ids == list(range(1000))
+
+
+def test_read_ndjson_case_of_invalid_line():
+    source: io.StringIO = io.StringIO('{"id": 1}\n\n{"id": \n')
+
+    with pytest.raises(Exception) as excinfo:
+        list(read_ndjson(source, ["id"]))
+
+    assert excinfo.errisinstance(ValueError)
+    assert "line 3" in str(excinfo.value)
+
+
+def test_read_ndjson_case_of_value_across_lines():
+    for text in ('{"a": [1\n2]}\n{"c": 3},{"d": 4}\n',
+                 '{"a": 1}\n[[1\n2]]\n3],[4\n',
+                 '{"a": 1} {"b": 2}\n'):
+        with pytest.raises(Exception) as excinfo:
+            list(read_ndjson(io.StringIO(text), ["a"]))
+        assert excinfo.errisinstance(ValueError)
+
+
+def test_read_ndjson_case_of_not_object():
+    source: io.StringIO = io.StringIO('{"id": 1}\n[1, 2]\n')
+
+    with pytest.raises(Exception) as excinfo:
+        list(read_ndjson(source, ["id"]))
+
+    assert excinfo.errisinstance(ValueError)
+    assert "line 2" in str(excinfo.value)
+
+
+def test_row_case_of_empty_value():
+    row: NullableRow = next(read_ndjson(io.StringIO('{"id": null}'), ["id"]))
+
+    assert row.id is Nullable.empty()
+
+
+def test_row_case_of_copy():
+    row: NullableRow = next(read_ndjson(io.StringIO(_NDJSON), ["name", "age"]))
+    copied: NullableRow = copy.deepcopy(row)
+    restored: NullableRow = pickle.loads(pickle.dumps(row))
+
+    assert copied.to_dict() == restored.to_dict() == row.to_dict()
+    assert copied.keys() == restored.keys() == ("name", "age")
+    assert Nullable(row).get().name.get() == "foo"
+
+
+def test_row_case_of_private_attribute():
+    row: NullableRow = next(read_ndjson(io.StringIO(_NDJSON), ["_name"]))
+
+    assert row["_name"] is Nullable.empty()
+    with pytest.raises(Exception) as excinfo:
+        row._name
+
+    assert excinfo.errisinstance(AttributeError)
@@ -0,0 +1,57 @@
+from typing import Iterator
+import pytest
+from py_nullable import Nullable, set_production_mode, is_production_mode,\
+    IncompleteCallBackException, UncallableException
+
+
+@pytest.fixture
+def production_mode() -> Iterator[None]:
+    previous: bool = is_production_mode()
+    set_production_mode(True)
+    yield
+    set_production_mode(previous)
+
+
+def test_production_mode_case_of_default():
+    assert is_production_mode() is (not __debug__)
+
+
+def test_production_mode_case_of_incomplete_callback(production_mode):
+    target: Nullable[int] = Nullable[int](1)
+
+    for call in (
+        lambda: target.map(lambda x: x / 0),
+        lambda: target.flatMap(lambda x: Nullable(x / 0)),
+        lambda: target.filter(lambda x: x / 0 > 1),
+        lambda: target.ifPresent(lambda x: print(x / 0)),
+        lambda: Nullable[int](None).orElseGet(lambda: 1 / 0),
+        lambda: Nullable[int](None).orElseRaise(lambda: Exception(1 / 0)),
+    ):
+        with pytest.raises(Exception) as excinfo:
+            call()
+
+        assert excinfo.errisinstance(ZeroDivisionError)
+
+
+def test_production_mode_case_of_invalid_callback(production_mode):
+    with pytest.raises(Exception) as excinfo:
+        Nullable[int](1).map("1")  # type: ignore
+
+    assert excinfo.errisinstance(TypeError)
+    assert not excinfo.errisinstance(UncallableException)
+
+
+def test_production_mode_case_of_switched_off(production_mode):
+    set_production_mode(False)
+
+    with pytest.raises(Exception) as excinfo:
+        Nullable[int](1).map(lambda x: x / 0)
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+
+def test_production_mode_case_of_present(production_mode):
+    target: Nullable[int] = Nullable[int](2)
+
+    assert target.map(lambda x: x * 2).filter(lambda x: x > 3).get() == 4
+    assert Nullable[int](None).orElseGet(lambda: 1) == 1
@@ -0,0 +1,71 @@
+import pickle
+import sqlite3
+import sys
+import pytest
+from py_nullable import Nullable, NullableRecord
+
+User = NullableRecord("User", "id, name, email")
+
+
+def test_record_case_of_present_and_empty():
+    user = User(1, "foo")
+
+    assert user.id.get() == 1
+    assert user.name.get() == "foo"
+    assert user.email is Nullable.empty()
+    assert user.is_present("name")
+    assert not user.is_present("email")
+    assert user.to_tuple() == (1, "foo", None)
+    assert user.to_dict() == {"id": 1, "name": "foo", "email": None}
+    assert repr(user) == "User(id=1, name='foo', email=None)"
+
+
+def test_record_case_of_falsy_value():
+    user = User(0, "", None)
+
+    assert user.id.get() == 0
+    assert user.name.get() == ""
+
+
+def test_record_case_of_slots():
+    user = User(1, "foo", "foo@example.com")
+
+    assert not hasattr(user, "__dict__")
+    assert sys.getsizeof(user) < 3 * sys.getsizeof(Nullable[int](1))
+
+
+def test_record_from_rows_case_of_sqlite():
+    connection: sqlite3.Connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (id, name, email)")
+    connection.executemany(
+        "INSERT INTO users VALUES (?, ?, ?)",
+        [(1, "foo", None), (2, None, "bar@example.com")])
+    connection.row_factory = sqlite3.Row
+
+    users = User.from_rows(
+        connection.execute("SELECT id, name, email FROM users ORDER BY id"))
+
+    assert users == [User(1, "foo", None), User(2, None, "bar@example.com")]
+    assert users[1].name.isEmpty()
+
+
+def test_record_case_of_pickle():
+    user = User(1, None, "foo@example.com")
+
+    assert pickle.loads(pickle.dumps(user)) == user
+
+
+def test_record_case_of_invalid_field_name():
+    for field_names in (["id", "id"], ["_id"], ["class"], ["user-id"]):
+        with pytest.raises(Exception) as excinfo:
+            NullableRecord("User", field_names)
+
+        assert excinfo.errisinstance(ValueError)
+
+
+def test_record_case_of_method_field_name():
+    for name in ("to_tuple", "to_dict", "is_present", "from_rows"):
+        with pytest.raises(Exception) as excinfo:
+            NullableRecord("User", ["id", name])
+
+        assert excinfo.errisinstance(ValueError)
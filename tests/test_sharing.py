@@ -0,0 +1,193 @@
+from __future__ import annotations
+from collections import UserDict, namedtuple
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from typing import Any
+import pytest
+from py_nullable import Nullable, IncompleteCallBackException,\
+    UncallableException
+from py_nullable.nullable import _raw_value
+from py_nullable.sharing import update_in
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class Store(MutableMapping):
+    """Mapping without __copy__, whose copy would share the store.
+    """
+
+    def __init__(self, **items: Any) -> None:
+        self.store: dict[str, Any] = dict(items)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.store[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.store[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.store[key]
+
+    def __iter__(self) -> Any:
+        return iter(self.store)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+
+@dataclass(frozen=True)
+class User:
+    name: str
+    tags: tuple[str, ...]
+
+
+def _document() -> dict[str, Any]:
+    return {
+        "user": {"name": "foo", "roles": ["admin", "dev"]},
+        "items": [{"id": 1}, {"id": 2}],
+        "large": list(range(1000)),
+    }
+
+
+def test_with_path_case_of_sharing():
+    document: dict[str, Any] = _document()
+    nullable: Nullable[dict[str, Any]] = Nullable(document)
+    result: Nullable[dict[str, Any]]\
+        = nullable.withPath(("user", "name"), "bar")
+    updated: dict[str, Any] = _raw_value(result)
+
+    assert updated["user"]["name"] == "bar"
+    assert document["user"]["name"] == "foo"
+    assert updated is not document
+    assert updated["user"] is not document["user"]
+    assert updated["user"]["roles"] is document["user"]["roles"]
+    assert updated["large"] is document["large"]
+
+
+def test_with_path_case_of_sequence_index():
+    nullable: Nullable[dict[str, Any]] = Nullable(_document())
+    result: dict[str, Any] = nullable.withPath(("items", -1, "id"), 3).get()
+
+    assert result["items"] == [{"id": 1}, {"id": 3}]
+
+
+def test_with_path_case_of_missing_keys():
+    result: dict[str, Any] = Nullable({"a": 1}).withPath(("b", "c"), 2).get()
+
+    assert result == {"a": 1, "b": {"c": 2}}
+
+
+def test_with_path_case_of_empty_path():
+    assert Nullable({"a": 1}).withPath((), [1]).get() == [1]
+
+
+def test_with_path_case_of_empty():
+    assert Nullable(None).withPath(("a",), 1) is Nullable.empty()
+
+
+def test_with_path_case_of_tuples_and_dataclasses():
+    value: dict[str, Any] = {
+        "point": Point(1, 2), "pair": (1, 2),
+        "user": User("foo", ("a",))}
+    result: dict[str, Any] = Nullable(value)\
+        .withPath(("point", 0), 10)\
+        .withPath(("pair", 1), 20)\
+        .withPath(("user", "name"), "bar").get()
+
+    assert result["point"] == Point(10, 2)
+    assert result["pair"] == (1, 20)
+    assert result["user"] == User("bar", ("a",))
+
+
+def test_with_path_case_of_unsupported_container():
+    with pytest.raises(Exception) as excinfo:
+        Nullable({"name": "foo"}).withPath(("name", 0), "b")
+
+    assert excinfo.errisinstance(TypeError)
+
+
+def test_with_path_case_of_str_path():
+    for path in ("name", b"name"):
+        with pytest.raises(Exception) as excinfo:
+            Nullable({"name": 1}).withPath(path, 2)
+        assert excinfo.errisinstance(TypeError)
+
+
+def test_with_path_case_of_custom_mapping():
+    store: Store = Store(name="foo")
+    with pytest.raises(Exception) as excinfo:
+        Nullable({"user": store}).withPath(("user", "name"), "bar")
+
+    assert excinfo.errisinstance(TypeError)
+    assert store["name"] == "foo"
+
+    users: UserDict = UserDict(name="foo")
+    result: dict[str, Any] = Nullable({"user": users})\
+        .withPath(("user", "name"), "bar").get()
+
+    assert result["user"]["name"] == "bar"
+    assert users["name"] == "foo"
+
+
+def test_with_path_case_of_index_out_of_range():
+    with pytest.raises(Exception) as excinfo:
+        Nullable([1, 2]).withPath((5,), 0)
+
+    assert excinfo.errisinstance(IndexError)
+
+
+def test_update_case_of_present():
+    document: dict[str, Any] = _document()
+    result: Nullable[dict[str, Any]] = Nullable(document).update(
+        "user", lambda user: {**user, "name": "bar"})
+
+    assert result.get()["user"]["name"] == "bar"
+    assert document["user"]["name"] == "foo"
+
+
+def test_update_case_of_copied_item():
+    document: dict[str, Any] = _document()
+
+    def _(roles: list[str]) -> list[str]:
+        roles.append("ops")
+        return roles
+
+    result: dict[str, Any] = Nullable(document["user"]).update("roles", _)\
+        .get()
+
+    assert result["roles"] == ["admin", "dev", "ops"]
+    assert document["user"]["roles"] == ["admin", "dev"]
+
+
+def test_update_case_of_missing_key():
+    result: dict[str, int] = Nullable({"a": 1})\
+        .update("b", lambda x: (x or 0) + 1).get()
+
+    assert result == {"a": 1, "b": 1}
+
+
+def test_update_case_of_empty():
+    assert Nullable(None).update("a", lambda x: x) is Nullable.empty()
+
+
+def test_update_case_of_uncallable():
+    with pytest.raises(Exception) as excinfo:
+        Nullable({"a": 1}).update("a", "x")
+
+    assert excinfo.errisinstance(UncallableException)
+
+
+def test_update_case_of_exception():
+    with pytest.raises(Exception) as excinfo:
+        Nullable({"a": 1}).update("a", lambda x: x / 0)
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+
+def test_update_in_case_of_lists():
+    rows: list[list[int]] = [[1, 2], [3, 4]]
+    updated: list[list[int]] = update_in(rows, (1, 0), lambda x: x * 10)
+
+    assert updated == [[1, 2], [30, 4]]
+    assert updated[0] is rows[0]
+    assert rows == [[1, 2], [3, 4]]
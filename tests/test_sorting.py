@@ -0,0 +1,75 @@
+from __future__ import annotations
+import random
+from typing import Optional
+import pytest
+from py_nullable import Nullable, nulls_first, nulls_last, top_k, merge
+
+
+def values(nullables) -> list[Optional[int]]:
+    return [nullable.orElse(None) for nullable in nullables]
+
+
+def sample() -> list[Nullable[int]]:
+    generator: random.Random = random.Random(42)
+    return [
+        Nullable[int](generator.choice([None, generator.randrange(100)]))
+        for _ in range(500)]
+
+
+def test_nulls_first_and_last():
+    nullables: list[Nullable[int]] = [
+        Nullable[int](2), Nullable[int](None), Nullable[int](-3)]
+
+    assert values(sorted(nullables, key=nulls_first())) == [None, -3, 2]
+    assert values(sorted(nullables, key=nulls_last())) == [-3, 2, None]
+    assert values(sorted(nullables, key=nulls_last(abs))) == [2, -3, None]
+
+
+def test_top_k_case_of_sorted_equivalence():
+    nullables: list[Nullable[int]] = sample()
+
+    for reverse in (False, True):
+        for nulls, key_func in (("last", nulls_last), ("first", nulls_first)):
+            expected = sorted(
+                nullables,
+                key=key_func() if not reverse else
+                (nulls_first() if nulls == "last" else nulls_last()),
+                reverse=reverse)
+            actual = top_k(nullables, 10, reverse=reverse, nulls=nulls)
+
+            assert values(actual) == values(expected[:10])
+            if nulls == "last":
+                assert None not in values(actual)
+            else:
+                assert values(actual) == [None] * 10
+
+
+def test_top_k_case_of_key():
+    words: list[Nullable[str]] = [
+        Nullable[str]("ccc"), Nullable[str](None), Nullable[str]("a"),
+        Nullable[str]("bb")]
+
+    assert values(top_k(words, 2, key=len, reverse=True)) == ["ccc", "bb"]
+    assert values(top_k(iter(words), 9)) == ["a", "bb", "ccc", None]
+
+
+def test_merge():
+    nullables: list[Nullable[int]] = sample()
+    left = sorted(nullables[:250], key=nulls_last())
+    right = sorted(nullables[250:], key=nulls_last())
+
+    assert values(merge(left, right))\
+        == values(sorted(nullables, key=nulls_last()))
+
+    left = sorted(nullables[:250], key=nulls_first(), reverse=True)
+    right = sorted(nullables[250:], key=nulls_first(), reverse=True)
+
+    assert values(merge(left, right, reverse=True))\
+        == values(sorted(nullables, key=nulls_first(), reverse=True))
+
+
+def test_top_k_case_of_invalid_nulls():
+    with pytest.raises(Exception) as excinfo:
+        top_k([], 1, nulls="middle")
+
+    assert excinfo.errisinstance(ValueError)
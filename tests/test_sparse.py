@@ -0,0 +1,112 @@
+from __future__ import annotations
+import random
+from typing import Optional
+import pytest
+from py_nullable import Nullable, NullableSparseArray,\
+    IncompleteCallBackException, UncallableException
+
+
+def dense(sparse: NullableSparseArray) -> list[Optional[int]]:
+    return [nullable.orElse(None) for nullable in sparse]
+
+
+def test_sparse_array_getitem():
+    sparse: NullableSparseArray[int] = NullableSparseArray(
+        10, {2: 20, 5: None, 7: 70})
+
+    assert len(sparse) == 10
+    assert sparse.count_present() == 2
+    assert sparse[2].get() == 20
+    assert sparse[5] is Nullable.empty()
+    assert sparse[-3].get() == 70
+    assert dense(sparse) == [None, None, 20, None, None, None, None, 70,
+                             None, None]
+
+    with pytest.raises(Exception) as excinfo:
+        sparse[10]
+
+    assert excinfo.errisinstance(IndexError)
+
+    with pytest.raises(Exception) as excinfo:
+        NullableSparseArray(3, [(3, 1)])
+
+    assert excinfo.errisinstance(IndexError)
+
+
+def test_sparse_array_from_dense():
+    values: list[Optional[int]] = [None, 1, Nullable[int](2), None,
+                                   Nullable[int](None)]
+    sparse: NullableSparseArray[int] = NullableSparseArray.from_dense(values)
+
+    assert len(sparse) == 5
+    assert list(sparse.items()) == [(1, 1), (2, 2)]
+    assert list(sparse.indices()) == [1, 2]
+    assert list(sparse.values()) == [1, 2]
+    assert sparse == NullableSparseArray(5, [(2, 2), (1, 1)])
+
+
+def test_sparse_array_slice():
+    sparse: NullableSparseArray[str] = NullableSparseArray(
+        10, {0: "a", 4: "b", 6: "c", 9: "d"})
+
+    assert sparse[4:7] == NullableSparseArray(3, {0: "b", 2: "c"})
+    assert sparse[-1:] == NullableSparseArray(1, {0: "d"})
+    assert len(sparse[7:2]) == 0
+
+    with pytest.raises(Exception) as excinfo:
+        sparse[::2]
+
+    assert excinfo.errisinstance(ValueError)
+
+
+def test_sparse_array_map_filter():
+    sparse: NullableSparseArray[int] = NullableSparseArray(
+        100, {1: 1, 50: -2, 99: 3})
+    calls: list[int] = []
+
+    def mapper(x: int) -> Optional[int]:
+        calls.append(x)
+        return x * 10 if x > 0 else None
+
+    assert list(sparse.map(mapper).items()) == [(1, 10), (99, 30)]
+    assert calls == [1, -2, 3]
+    assert list(sparse.filter(lambda x: x % 2).items()) == [(1, 1), (99, 3)]
+    assert len(sparse.map(str)) == 100
+
+
+def test_sparse_array_merge():
+    generator: random.Random = random.Random(0)
+    left: dict[int, int] = {
+        i: i for i in generator.sample(range(1000), 100)}
+    right: dict[int, int] = {
+        i: -i for i in generator.sample(range(1200), 100)}
+    merged: NullableSparseArray[int] = NullableSparseArray(1000, left)\
+        .merge(NullableSparseArray(1200, right))
+
+    assert len(merged) == 1200
+    assert dict(merged.items()) == {**left, **right}
+    assert list(merged.indices()) == sorted({**left, **right})
+
+    combined: NullableSparseArray[int] = NullableSparseArray(5, {0: 1, 3: 2})\
+        .merge(NullableSparseArray(5, {3: 10, 4: 20}), lambda x, y: x + y)
+
+    assert list(combined.items()) == [(0, 1), (3, 12), (4, 20)]
+
+
+def test_sparse_array_case_of_callback_exceptions():
+    sparse: NullableSparseArray[int] = NullableSparseArray(3, {0: 0})
+
+    with pytest.raises(Exception) as excinfo:
+        sparse.map(lambda x: 1 / x)
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+    with pytest.raises(Exception) as excinfo:
+        sparse.filter("not callable")
+
+    assert excinfo.errisinstance(UncallableException)
+
+    with pytest.raises(Exception) as excinfo:
+        sparse.merge(sparse, lambda x, y: x / y)
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
@@ -0,0 +1,117 @@
+import copy
+import pickle
+import sqlite3
+import pytest
+from py_nullable import Nullable, ColumnBatch, NullableRow,\
+    nullable_row_factory, fetch_columns
+
+
+def connect() -> sqlite3.Connection:
+    connection: sqlite3.Connection = sqlite3.connect(":memory:")
+    connection.execute(
+        "CREATE TABLE users (id INTEGER, name TEXT, age INTEGER)")
+    connection.executemany(
+        "INSERT INTO users VALUES (?, ?, ?)",
+        [(1, "foo", 20), (2, None, 30), (3, "baz", None)])
+    return connection
+
+
+def test_nullable_row_factory():
+    connection: sqlite3.Connection = connect()
+    connection.row_factory = nullable_row_factory
+    rows: list[NullableRow] = connection.execute(
+        "SELECT id, name, age FROM users ORDER BY id").fetchall()
+
+    assert [row.name.orElse("anonymous") for row in rows]\
+        == ["foo", "anonymous", "baz"]
+    assert rows[2]["age"] is Nullable.empty()
+    assert rows[0][0].get() == 1
+    assert rows[0].keys() == ("id", "name", "age")
+
+
+def test_nullable_row_factory_case_of_copy():
+    connection: sqlite3.Connection = connect()
+    connection.row_factory = nullable_row_factory
+    row: NullableRow = connection.execute(
+        "SELECT id, name, age FROM users ORDER BY id").fetchone()
+
+    assert copy.deepcopy(row).to_dict()\
+        == pickle.loads(pickle.dumps(row)).to_dict()\
+        == {"id": 1, "name": "foo", "age": 20}
+    assert Nullable(row).map(lambda row: row.name.get()).get() == "foo"
+
+
+def test_nullable_row_factory_case_of_duplicated_names():
+    connection: sqlite3.Connection = connect()
+    connection.row_factory = nullable_row_factory
+    row: NullableRow = connection.execute(
+        "SELECT name, age AS name FROM users WHERE id = 3").fetchone()
+
+    assert row.name.get() == "baz"
+    assert row[1].isEmpty()
+    assert len(row) == 2
+
+
+def test_fetch_columns():
+    connection: sqlite3.Connection = connect()
+    cursor: sqlite3.Cursor = connection.execute(
+        "SELECT id, name, age FROM users ORDER BY id")
+    batch: ColumnBatch = fetch_columns(cursor, 2)
+
+    assert len(batch) == 2
+    assert batch.names() == ("id", "name", "age")
+    assert batch.column("name") == ("foo", None)
+    assert batch.presence("name") == 0b01
+    assert batch.presence(0) == 0b11
+    assert batch.count_present("name") == 1
+    assert batch.get(1, "name").isEmpty()
+    assert batch.get(1, "age").get() == 30
+
+    batch = fetch_columns(cursor, 2)
+
+    assert len(batch) == 1
+    assert batch.presence("age") == 0
+    assert batch.present_values("name") == ["baz"]
+    assert not fetch_columns(cursor, 2)
+
+
+def test_fetch_columns_case_of_row_factory():
+    connection: sqlite3.Connection = connect()
+    connection.row_factory = nullable_row_factory
+    cursor: sqlite3.Cursor = connection.execute(
+        "SELECT name FROM users ORDER BY id")
+    batch: ColumnBatch = fetch_columns(cursor)
+
+    assert batch.column(0) == ("foo",)
+    assert cursor.row_factory is nullable_row_factory
+    assert cursor.fetchone().name.isEmpty()
+
+
+def test_fetch_columns_case_of_large_result():
+    connection: sqlite3.Connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE readings (value REAL)")
+    connection.executemany(
+        "INSERT INTO readings VALUES (?)",
+        [(None if i % 3 == 0 else float(i),) for i in range(10000)])
+    batch: ColumnBatch = fetch_columns(
+        connection.execute("SELECT value FROM readings"), 10000)
+    presence: int = batch.presence("value")
+
+    assert all(
+        bool(presence >> i & 1) == (i % 3 != 0) for i in range(10000))
+    assert [row.value.orElse(None) for row in batch.rows()][:4]\
+        == [None, 1.0, 2.0, None]
+
+
+def test_column_batch_case_of_unknown_column():
+    batch: ColumnBatch = ColumnBatch(["id"], [(1,)])
+
+    with pytest.raises(Exception) as excinfo:
+        batch.column("name")
+
+    assert excinfo.errisinstance(KeyError)
+
+    with pytest.raises(Exception) as excinfo:
+        batch.presence(1)
+
+    assert excinfo.errisinstance(IndexError)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+import asyncio
+import random
+from typing import AsyncIterator, Optional
+import pytest
+from py_nullable import Nullable, AsyncNullableStream,\
+    IncompleteCallBackException, UncallableException
+
+
+async def source(values: list) -> AsyncIterator[Optional[int]]:
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def collect(stream: AsyncNullableStream) -> list[Optional[int]]:
+    return [nullable.orElse(None) async for nullable in stream]
+
+
+def test_stream_iteration():
+    values: list = [1, None, Nullable[int](3), Nullable[int](None)]
+
+    assert run(collect(AsyncNullableStream(values))) == [1, None, 3, None]
+    assert run(collect(AsyncNullableStream(source(values))))\
+        == [1, None, 3, None]
+
+
+def test_stream_amap_case_of_ordered():
+    in_flight: list[int] = [0]
+    peak: list[int] = [0]
+
+    async def slow_double(x: int) -> Optional[int]:
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(random.random() / 100)
+        in_flight[0] -= 1
+        return x * 2 if x != 4 else None
+
+    values: list[Optional[int]] = [1, None, 2, 3, 4, 5, None, 6, 7, 8]
+    actual: list[Optional[int]] = run(collect(
+        AsyncNullableStream(source(values)).amap(slow_double, concurrency=3)))
+
+    assert actual == [2, None, 4, 6, None, 10, None, 12, 14, 16]
+    assert 1 < peak[0] <= 3
+
+
+def test_stream_amap_case_of_unordered():
+    async def delayed(x: int) -> int:
+        await asyncio.sleep(x / 100)
+        return x
+
+    actual: list[Optional[int]] = run(collect(
+        AsyncNullableStream([3, 1, None, 2]).amap(
+            delayed, concurrency=4, ordered=False)))
+
+    assert actual == [None, 1, 2, 3]
+
+
+def test_stream_amap_case_of_backpressure():
+    async def scenario() -> tuple[list[int], list[Optional[int]]]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        done: object = object()
+        produced: list[int] = []
+
+        async def produce() -> None:
+            for i in range(10):
+                await queue.put(i if i % 3 else None)
+                produced.append(i)
+            await queue.put(done)
+
+        async def echo(x: int) -> int:
+            await asyncio.sleep(0.01)
+            return x
+
+        producer: asyncio.Task = asyncio.ensure_future(produce())
+        stream = AsyncNullableStream.from_queue(queue, done)\
+            .amap(echo, concurrency=2)
+        iterator = stream.__aiter__()
+        first: Nullable[int] = await iterator.__anext__()
+        # the producer is held back by the bounded queue.
+        stalled: list[int] = list(produced)
+        rest: list[Optional[int]] = [
+            nullable.orElse(None) async for nullable in iterator]
+        await producer
+        await queue.join()
+        return stalled, [first.orElse(None)] + rest
+
+    stalled, actual = run(scenario())
+
+    assert len(stalled) < 10
+    assert actual == [None, 1, 2, None, 4, 5, None, 7, 8, None]
+
+
+def test_stream_afilter_present_chunked():
+    async def is_odd(x: int) -> bool:
+        return x % 2 == 1
+
+    async def scenario() -> tuple:
+        filtered = await collect(
+            AsyncNullableStream([1, 2, None, 3]).afilter(is_odd))
+        present = [x async for x in
+                   AsyncNullableStream([1, None, 2]).present()]
+        chunks = [[n.orElse(None) for n in chunk] async for chunk in
+                  AsyncNullableStream([1, None, 2, 3, 4]).chunked(2)]
+        synced = await collect(
+            AsyncNullableStream([1, 2]).afilter(lambda x: x > 1))
+        return filtered, present, chunks, synced
+
+    filtered, present, chunks, synced = run(scenario())
+
+    assert filtered == [1, None, None, 3]
+    assert present == [1, 2]
+    assert chunks == [[1, None], [2, 3], [4]]
+    assert synced == [None, 2]
+
+
+def test_stream_first_present():
+    pulled: list[Optional[int]] = []
+
+    async def tracked() -> AsyncIterator[Optional[int]]:
+        for value in [None, None, 5, 6]:
+            pulled.append(value)
+            yield value
+
+    async def scenario() -> tuple[Nullable[int], Nullable[int]]:
+        return (await AsyncNullableStream(tracked()).first_present(),
+                await AsyncNullableStream([None]).first_present())
+
+    first, empty = run(scenario())
+
+    assert first.get() == 5
+    assert pulled == [None, None, 5]
+    assert empty.isEmpty()
+
+
+def test_stream_case_of_callback_exceptions():
+    async def broken(x: int) -> int:
+        raise KeyError(x)
+
+    with pytest.raises(Exception) as excinfo:
+        run(collect(AsyncNullableStream([1, 2, 3]).amap(
+            broken, concurrency=2)))
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+    with pytest.raises(Exception) as excinfo:
+        AsyncNullableStream([1]).amap("not callable")
+
+    assert excinfo.errisinstance(UncallableException)
+
+    with pytest.raises(Exception) as excinfo:
+        AsyncNullableStream([1]).chunked(0)
+
+    assert excinfo.errisinstance(ValueError)
@@ -0,0 +1,125 @@
+import sys
+from typing import Callable
+import pytest
+from py_nullable import Nullable, nullable_tailrec, flat_map_chain,\
+    IncompleteCallBackException
+
+
+@nullable_tailrec
+def count_down(n: int) -> Nullable[int]:
+    if n == 0:
+        return Nullable[int](0)
+    return Nullable[int](n - 1).flatMap(count_down).map(lambda x: x + 1)
+
+
+@nullable_tailrec
+def find_even(n: int) -> Nullable[int]:
+    if n < 0:
+        return Nullable[int](None)
+    if n % 2 == 0 and n < 10:
+        return Nullable[int](n)
+    return find_even(n - 1)
+
+
+@nullable_tailrec
+def is_even(n: int) -> Nullable[bool]:
+    return Nullable[bool](True) if n == 0 else is_odd(n - 1)
+
+
+@nullable_tailrec
+def is_odd(n: int) -> Nullable[bool]:
+    return Nullable[bool](False) if n == 0 else is_even(n - 1)
+
+
+@nullable_tailrec
+def divide_down(n: int) -> Nullable[float]:
+    if n == 0:
+        return Nullable[float](1 / n)
+    return divide_down(n - 1)
+
+
+def test_tailrec_case_of_deep_recursion():
+    depth: int = sys.getrecursionlimit() * 10
+
+    assert count_down(depth).get() == depth
+    assert find_even(depth + 1).get() == 8
+
+
+def test_tailrec_case_of_mutual_recursion():
+    assert is_even(100001).get() is False
+    assert is_odd(100001).get() is True
+
+
+def test_tailrec_case_of_empty():
+    @nullable_tailrec
+    def search(n: int) -> Nullable[int]:
+        if n == 0:
+            return Nullable[int](None)
+        return Nullable[int](n - 1).flatMap(search).map(lambda x: x * 2)
+
+    assert search(50000).isEmpty()
+
+
+def test_tailrec_case_of_forced_result():
+    @nullable_tailrec
+    def total(n: int) -> Nullable[int]:
+        if n == 0:
+            return Nullable[int](0)
+        return Nullable[int](total(n - 1).get() + n)
+
+    assert total(100).get() == 5050
+
+
+def test_tailrec_case_of_incomplete_callback():
+    with pytest.raises(Exception) as excinfo:
+        divide_down(10000)
+
+    assert excinfo.errisinstance(ZeroDivisionError)
+    assert count_down(3).get() == 3
+
+    @nullable_tailrec
+    def broken(n: int) -> Nullable[int]:
+        return Nullable[int](n).flatMap(lambda x: broken(x - 1))\
+            .filter(lambda x: x / 0 > 0) if n else Nullable[int](1)
+
+    with pytest.raises(Exception) as excinfo:
+        broken(5000)
+
+    assert excinfo.errisinstance(IncompleteCallBackException)
+
+
+def test_flat_map_chain_case_of_long_chain():
+    mappers: list[Callable[[int], Nullable[int]]] = [
+        lambda x: Nullable[int](x + 1)] * 100000
+
+    assert flat_map_chain(Nullable[int](0), mappers).get() == 100000
+
+
+def test_flat_map_chain_case_of_empty():
+    called: list[int] = []
+
+    def mappers():
+        yield lambda x: Nullable[int](None)
+        called.append(1)
+        yield lambda x: Nullable[int](x)
+
+    assert flat_map_chain(Nullable[int](1), mappers()).isEmpty()
+    assert called == []
+    assert flat_map_chain(Nullable[int](1), [count_down]).get() == 1
+
+
+def test_tailrec_case_of_special_methods():
+    results: list[tuple[bool, list[int], int, bool]] = []
+
+    @nullable_tailrec
+    def inspect(n: int, leaf: bool = False) -> Nullable[int]:
+        if leaf:
+            return Nullable[int](n) if n else Nullable.empty()
+        result: Nullable[int] = inspect(n, leaf=True)
+        results.append((bool(result), list(result), len(result),
+                        result == Nullable.empty()))
+        return result
+
+    assert inspect(0).isEmpty()
+    assert inspect(3).get() == 3
+    assert results == [(False, [], 0, True), (True, [3], 1, False)]
@@ -0,0 +1,110 @@
+import sys
+from collections import defaultdict
+from collections.abc import Mapping, Sequence, Set
+from typing import Any
+import pytest
+from py_nullable import Nullable
+
+
+def test_view_of_case_of_mapping():
+    source: dict[str, Any] = {"name": "foo", "tags": ["a", "b"],
+                              "address": {"city": "Tokyo"}}
+    value: Any = Nullable.viewOf(source).get()
+
+    assert isinstance(value, Mapping)
+    assert value == source
+    assert value["tags"] == ["a", "b"]
+    assert value["address"]["city"] == "Tokyo"
+    assert dict(value.items())["name"] == "foo"
+
+    with pytest.raises(Exception) as excinfo:
+        value["name"] = "bar"
+
+    assert excinfo.errisinstance(TypeError)
+
+    with pytest.raises(Exception) as excinfo:
+        value["tags"].append("c")
+
+    assert excinfo.errisinstance(AttributeError)
+
+    with pytest.raises(Exception) as excinfo:
+        value["address"]["city"] = "Osaka"
+
+    assert excinfo.errisinstance(TypeError)
+    assert source["tags"] == ["a", "b"]
+
+
+def test_view_of_case_of_no_copy():
+    source: dict[str, list[int]] = {"values": list(range(1000))}
+    nullable: Nullable[dict[str, list[int]]] = Nullable.viewOf(source)
+    source["values"].append(1000)
+
+    assert len(nullable.get()["values"]) == 1001
+    assert nullable.map(lambda x: len(x["values"])).get() == 1001
+
+
+def test_view_of_case_of_sequence_and_set():
+    sequence: Any = Nullable.viewOf([1, [2, 3], (4, [5])]).get()
+
+    assert isinstance(sequence, Sequence)
+    assert sequence == [1, [2, 3], (4, [5])]
+    assert sequence[1:] == [[2, 3], (4, [5])]
+    assert list(sequence)[1] == (2, 3)
+    assert 1 in sequence
+
+    with pytest.raises(Exception) as excinfo:
+        sequence[2][1].append(6)
+
+    assert excinfo.errisinstance(AttributeError)
+
+    values: Any = Nullable.viewOf({1, 2}).get()
+
+    assert isinstance(values, Set)
+    assert values == {1, 2}
+    assert values | {3} == frozenset({1, 2, 3})
+    assert not hasattr(values, "add")
+
+
+def test_view_of_case_of_buffer():
+    source: bytearray = bytearray(b"abc")
+    view: Any = Nullable.viewOf(source).get()
+
+    assert isinstance(view, memoryview)
+    assert view.readonly
+    assert bytes(view) == b"abc"
+
+    source[0] = ord("x")
+
+    # Python 3.7 has no memoryview#toreadonly, so the buffer is copied.
+    assert bytes(view) == (b"xbc" if sys.version_info >= (3, 8) else b"abc")
+
+    with pytest.raises(Exception) as excinfo:
+        view[0] = 0
+
+    assert excinfo.errisinstance(TypeError)
+
+
+def test_view_of_case_of_other_values():
+    class Point:
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+    point: Point = Point(1)
+    copied: Point = Nullable.viewOf(point).get()
+    counts: defaultdict[str, int] = defaultdict(int)
+
+    assert copied is not point and copied.x == 1
+    assert Nullable.viewOf("foo").get() == "foo"
+    assert Nullable.viewOf(None).isEmpty()
+    assert "missing" not in Nullable.viewOf(counts).get()
+    with pytest.raises(Exception) as excinfo:
+        Nullable.viewOf(counts).get()["missing"]
+
+    assert excinfo.errisinstance(KeyError)
+    assert counts == {}
+
+
+def test_view_of_case_of_equals():
+    assert Nullable.viewOf({"a": [1]}).equals(Nullable[dict]({"a": [1]}))
+    assert Nullable[dict]({"a": [1]}).equals(Nullable.viewOf({"a": [1]}))
+    assert Nullable.viewOf([1]).filter(lambda x: x == [1]).isPresent()